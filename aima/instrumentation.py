@@ -0,0 +1,165 @@
+"""aima/instrumentation.py
+
+Opt-in counters, timers and hooks for the best-first search engines.
+
+Pass a SearchStats as `stats=` to best_first_graph_search, astar_search,
+uniform_cost_search or greedy_best_first_graph_search. The search fills it
+in whether or not it finds a goal (node.metrics only exists on success).
+Both engines ("classic", "best_g") are instrumented, with the same counts:
+  - found, path_cost        outcome of the latest search
+  - expanded, generated     nodes expanded / successor states produced
+  - duplicates              successors dropped: state already expanded, or
+                            already queued with an f at least as good
+  - reinsertions            successors that replaced a queued node with a
+                            better f (decrease-key)
+  - frontier_max, explored  as in node.metrics
+  - heuristic_calls, heuristic_time_s
+                            real h evaluations (astar / greedy); values
+                            served by memoize or a HeuristicCache are free
+                            and not counted
+  - goal_tests, goal_test_time_s
+  - total_time_s
+  - peak_memory_bytes       tracemalloc peak above the level at search
+                            start; only with track_memory=True, since
+                            tracemalloc slows Python down several times
+
+Reusing an instance across searches adds up the counters and times
+(frontier_max and peak_memory_bytes keep the maximum); found and
+path_cost always describe the latest search.
+
+Hooks: every callable in `on_expand` is called as hook(node, stats) right
+after a node is expanded (its children are not generated yet). expanded,
+explored and frontier_max are recorded when the search ends; the other
+counters are live.
+
+Without `stats` the engines skip the wrappers and hooks; what remains is a
+flag test on the rare duplicate / decrease-key branches, so
+instrumentation costs next to nothing unless asked for.
+
+Usage:
+  stats = SearchStats(on_expand=[lambda node, s: print(node.state)])
+  node = astar_search(problem, stats=stats)
+  print(stats.as_dict())
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from functools import wraps
+from typing import Any, Callable, Container, Dict, Iterator, List, Optional
+
+
+@dataclass
+class SearchStats:
+    """Counters of one or more search runs (see the module docstring for reuse)."""
+
+    track_memory: bool = False
+    on_expand: List[Callable[[Any, "SearchStats"], None]] = field(default_factory=list)
+
+    found: bool = False
+    path_cost: float = float("inf")
+    expanded: int = 0
+    generated: int = 0
+    duplicates: int = 0
+    reinsertions: int = 0
+    frontier_max: int = 0
+    explored: int = 0
+    heuristic_calls: int = 0
+    heuristic_time_s: float = 0.0
+    goal_tests: int = 0
+    goal_test_time_s: float = 0.0
+    total_time_s: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The measured values (configuration fields left out)."""
+        skip = ("track_memory", "on_expand")
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in skip}
+
+    def record(self, node: Any, expanded: int, frontier_max: int, explored: int) -> None:
+        """Outcome and end-of-search counters of one run (`node` is None on failure)."""
+        self.found = node is not None
+        self.path_cost = node.path_cost if node is not None else float("inf")
+        self.expanded += expanded
+        self.explored += explored
+        self.frontier_max = max(self.frontier_max, frontier_max)
+
+    def counting_skip(self, skip: Container[Any]) -> "CountingSkip":
+        """`skip` for Node.iter_children that counts generated successors and duplicates."""
+        return CountingSkip(skip, self)
+
+    def timed_goal_test(self, goal_test: Callable[[Any], bool]) -> Callable[[Any], bool]:
+        """goal_test wrapped to count its calls and time."""
+        clock = time.perf_counter
+
+        def timed(state: Any) -> bool:
+            t0 = clock()
+            is_goal = goal_test(state)
+            self.goal_test_time_s += clock() - t0
+            self.goal_tests += 1
+            return is_goal
+
+        return timed
+
+    def timed_heuristic(self, h: Callable[[Any], float]) -> Callable[[Any], float]:
+        """h wrapped to count its calls and time."""
+        clock = time.perf_counter
+
+        @wraps(h)
+        def timed(node: Any) -> float:
+            t0 = clock()
+            value = h(node)
+            self.heuristic_time_s += clock() - t0
+            self.heuristic_calls += 1
+            return value
+
+        return timed
+
+    @contextmanager
+    def measure(self) -> Iterator["SearchStats"]:
+        """Time the enclosed search (and trace its peak memory if asked to)."""
+        was_tracing = tracemalloc.is_tracing()
+        if self.track_memory:
+            if not was_tracing:
+                tracemalloc.start()  # fresh peak
+            elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.stop()  # Python 3.8: restarting is the only way to reset the peak
+                tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_time_s += time.perf_counter() - t0
+            if self.track_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                self.peak_memory_bytes = max(peak, self.peak_memory_bytes or 0)
+                if not was_tracing:
+                    tracemalloc.stop()
+
+
+class CountingSkip:
+    """Wraps the closed set an engine passes to Node.iter_children as `skip`.
+
+    iter_children tests every successor state against it before building a
+    Node, so each test is one generated successor and each hit a duplicate
+    of an already expanded state.
+    """
+
+    __slots__ = ("skip", "stats")
+
+    def __init__(self, skip: Container[Any], stats: SearchStats) -> None:
+        self.skip = skip
+        self.stats = stats
+
+    def __contains__(self, state: Any) -> bool:
+        self.stats.generated += 1
+        if state in self.skip:
+            self.stats.duplicates += 1
+            return True
+        return False
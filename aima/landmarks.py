@@ -0,0 +1,263 @@
+"""aima/landmarks.py
+
+ALT heuristics (A*, Landmarks, Triangle inequality) for `Graph` problems.
+
+Preprocessing picks k landmark nodes and stores exact shortest-path
+distances from every landmark to every node (and back, for directed
+graphs). By the triangle inequality, for any landmark L
+
+    d(v, t) >= d(L, t) - d(L, v)      and      d(v, t) >= d(v, L) - d(t, L)
+
+so the largest of these bounds is an admissible, consistent heuristic that
+knows about the graph's actual connectivity -- unlike `GraphProblem.h`,
+which needs coordinates and returns inf without them.
+
+Selection methods (Goldberg & Harrelson, 2005), implemented once in
+`select_landmarks` for any backend that can produce distance rows:
+  - "farthest": each new landmark is the node farthest from the ones
+    chosen so far (the first is farthest from a random node)
+  - "avoid": grow a shortest-path tree from a random root, weight every
+    node by how badly the current landmarks bound its distance from the
+    root, and descend into the heaviest subtree that holds no landmark yet;
+    the leaf reached becomes the next landmark
+
+Distances are float32 arrays of shape (k, n) (inf = unreachable).
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .search import Graph, Node
+
+METHODS = ("farthest", "avoid")
+
+
+# -----------------------------------------------------------------------------
+# Shortest paths
+
+
+def dijkstra(graph_dict: Dict[Any, Dict[Any, float]], source: Any) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+    """(distance, parent) maps of the shortest-path tree from `source`."""
+    dist = {source: 0.0}
+    parent: Dict[Any, Any] = {source: None}
+    heap: List[Tuple[float, int, Any]] = [(0.0, 0, source)]
+    counter = 0
+    done = set()
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        for v, w in graph_dict.get(u, {}).items():
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                parent[v] = u
+                counter += 1
+                heapq.heappush(heap, (nd, counter, v))
+    return dist, parent
+
+
+def reverse_graph(graph_dict: Dict[Any, Dict[Any, float]]) -> Dict[Any, Dict[Any, float]]:
+    rev: Dict[Any, Dict[Any, float]] = {}
+    for a, links in graph_dict.items():
+        for b, d in links.items():
+            rev.setdefault(b, {})[a] = d
+    return rev
+
+
+# -----------------------------------------------------------------------------
+# Landmark selection (shared with mazeescape/heuristics/landmarks.py)
+
+
+def select_landmarks(
+    candidates: np.ndarray,
+    k: int,
+    distances_from: Callable[[int], np.ndarray],
+    *,
+    method: str = "farthest",
+    seed: int = 0,
+    shortest_path_tree: Optional[Callable[[int], Tuple[np.ndarray, np.ndarray]]] = None,
+    symmetric: bool = True,
+) -> Tuple[List[int], List[np.ndarray]]:
+    """Pick k landmarks among `candidates` (node indices 0..n-1).
+
+    distances_from(i):     float array of d(i, v) for every node v (inf =
+                           unreachable)
+    shortest_path_tree(i): (distances, parent index or -1) of a shortest-path
+                           tree rooted at i; needed by "avoid"
+    symmetric:             d(a, b) == d(b, a), so the avoid rule may also
+                           use the reverse triangle bound
+
+    Returns the chosen indices and their distances_from rows.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    if method == "avoid" and shortest_path_tree is None:
+        raise ValueError('method "avoid" needs shortest_path_tree')
+    candidates = np.asarray(candidates)
+    if candidates.size == 0:
+        raise ValueError("no candidate nodes to place landmarks on")
+    rng = random.Random(seed)
+    chosen: List[int] = []
+    rows: List[np.ndarray] = []
+
+    def farthest(closest: np.ndarray) -> int:
+        # Unreachable nodes (inf) count as the farthest, so other components get landmarks too
+        masked = np.full(closest.size, -1.0)
+        masked[candidates] = closest[candidates]
+        masked[chosen] = -1.0
+        return int(np.argmax(masked))
+
+    first = farthest(distances_from(int(candidates[rng.randrange(candidates.size)])))
+    chosen.append(first)
+    rows.append(distances_from(first))
+    while len(chosen) < min(k, candidates.size):
+        pick = None
+        if method == "avoid":
+            root = int(candidates[rng.randrange(candidates.size)])
+            pick = _avoid_pick(root, chosen, rows, shortest_path_tree, symmetric)
+        if pick is None or pick in chosen:
+            pick = farthest(np.min(rows, axis=0))  # also the fallback of "avoid"
+        chosen.append(pick)
+        rows.append(distances_from(pick))
+    return chosen, rows
+
+
+def _avoid_pick(
+    root: int,
+    chosen: List[int],
+    rows: List[np.ndarray],
+    shortest_path_tree: Callable[[int], Tuple[np.ndarray, np.ndarray]],
+    symmetric: bool,
+) -> Optional[int]:
+    """Leaf of the heaviest landmark-free subtree of the tree rooted at `root` (None if none)."""
+    dist, parent = shortest_path_tree(root)
+    reached = np.flatnonzero(np.isfinite(dist))
+
+    # weight(v) = d(root, v) - current ALT bound on it
+    bound = np.zeros(dist.size)
+    with np.errstate(invalid="ignore"):  # inf - inf: landmark useless for this pair
+        for row in rows:
+            np.fmax(bound, row - row[root], out=bound)
+            if symmetric:
+                np.fmax(bound, row[root] - row, out=bound)
+    weight = np.zeros(dist.size)
+    weight[reached] = dist[reached] - bound[reached]
+
+    # Subtree weights, leaves first; remember each node's heaviest landmark-free child
+    size = weight.tolist()
+    parents = parent.tolist()
+    covered = bytearray(dist.size)
+    for c in chosen:
+        covered[c] = 1
+    best_child = [-1] * dist.size
+    for c in reached[np.argsort(-dist[reached], kind="stable")].tolist():
+        p = parents[c]
+        if p < 0:
+            continue
+        size[p] += size[c]
+        if covered[c]:
+            covered[p] = 1
+        elif size[c] > 0 and (best_child[p] < 0 or size[c] > size[best_child[p]]):
+            best_child[p] = c
+
+    node = root
+    while best_child[node] >= 0 and not covered[best_child[node]]:
+        node = best_child[node]
+    return node if node != root else None
+
+
+# -----------------------------------------------------------------------------
+# Landmark tables
+
+
+class Landmarks:
+    """Exact distances from / to k landmarks, and the ALT lower bound they give."""
+
+    def __init__(
+        self,
+        nodes: List[Any],
+        landmarks: List[Any],
+        dist_from: np.ndarray,
+        dist_to: Optional[np.ndarray] = None,
+    ) -> None:
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.landmarks = landmarks
+        self.dist_from = dist_from                                  # d(L, v)
+        self.dist_to = dist_from if dist_to is None else dist_to    # d(v, L)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, k: int = 4, method: str = "farthest", seed: int = 0) -> "Landmarks":
+        forward = graph.graph_dict
+        nodes = sorted(set(forward) | {b for links in forward.values() for b in links}, key=str)
+        if not nodes:
+            raise ValueError("graph has no nodes")
+        index = {node: i for i, node in enumerate(nodes)}
+
+        def row(dist: Dict[Any, float]) -> np.ndarray:
+            out = np.full(len(nodes), np.inf, dtype=np.float32)
+            for node, d in dist.items():
+                out[index[node]] = d
+            return out
+
+        def tree(i: int) -> Tuple[np.ndarray, np.ndarray]:
+            dist, parent = dijkstra(forward, nodes[i])
+            parents = np.full(len(nodes), -1, dtype=np.int64)
+            for node, p in parent.items():
+                if p is not None:
+                    parents[index[node]] = index[p]
+            return row(dist), parents
+
+        chosen, rows_from = select_landmarks(
+            np.arange(len(nodes)),
+            k,
+            lambda i: row(dijkstra(forward, nodes[i])[0]),
+            method=method,
+            seed=seed,
+            shortest_path_tree=tree,
+            symmetric=not graph.directed,
+        )
+        dist_to = None
+        if graph.directed:
+            backward = reverse_graph(forward)
+            dist_to = np.array([row(dijkstra(backward, nodes[i])[0]) for i in chosen])
+        return cls(nodes, [nodes[i] for i in chosen], np.array(rows_from), dist_to)
+
+    @property
+    def nbytes(self) -> int:
+        extra = 0 if self.dist_to is self.dist_from else self.dist_to.nbytes
+        return self.dist_from.nbytes + extra
+
+    def lower_bound(self, a: Any, b: Any) -> float:
+        """max over landmarks of the triangle-inequality bounds on d(a, b)."""
+        i, j = self.index.get(a), self.index.get(b)
+        if i is None or j is None:
+            return 0.0
+        return self._bound(i, self.dist_from[:, j], self.dist_to[:, j])
+
+    def _bound(self, i: int, landmark_to_goal: np.ndarray, goal_to_landmark: np.ndarray) -> float:
+        with np.errstate(invalid="ignore"):  # inf - inf: landmark useless for this pair
+            bounds = np.fmax(landmark_to_goal - self.dist_from[:, i], self.dist_to[:, i] - goal_to_landmark)
+        bounds = bounds[~np.isnan(bounds)]
+        return max(0.0, float(bounds.max())) if bounds.size else 0.0
+
+    def node_heuristic(self, goal: Any) -> Callable[[Node], float]:
+        """h(node) for astar_search(problem, h=...) towards `goal`."""
+        j = self.index.get(goal)
+        if j is None:
+            return lambda node: 0.0
+        from_column, to_column = self.dist_from[:, j].copy(), self.dist_to[:, j].copy()
+        index, bound = self.index, self._bound
+
+        def h(node: Node) -> float:
+            i = index.get(node.state)
+            return 0.0 if i is None else bound(i, from_column, to_column)
+
+        return h
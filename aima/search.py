@@ -8,16 +8,19 @@ and run standard examples (e.g., Romania route finding) on a simplified codebase
 This file intentionally focuses on:
   - Problem / Node abstractions
   - Best-first graph search engine (shared by Greedy / UCS / A*)
+  - Bidirectional A* (MM) for problems that can enumerate predecessors
   - Graph + GraphProblem (Romania map)
-  - A small, measurable execution surface (metrics)
+  - A small, measurable execution surface (metrics, opt-in SearchStats)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import copy
+import heapq
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .utils import PriorityQueue, distance, is_in, memoize
+from .instrumentation import SearchStats
+from .utils import HeuristicCache, PriorityQueue, distance, is_in, memoize
 
 
 # -----------------------------------------------------------------------------
@@ -45,23 +48,43 @@ class Problem:
     def path_cost(self, c: float, state1: Any, action: Any, state2: Any) -> float:
         return c + 1
 
+    def predecessors(self, state: Any) -> Iterable[Tuple[Any, Any]]:
+        """(previous_state, action) pairs with result(previous_state, action) == state.
+
+        Only needed by bidirectional search.
+        """
+        raise NotImplementedError
+
     def h(self, node: "Node") -> float:
         return 0.0
 
 
-@dataclass
 class Node:
-    """A node in a search tree."""
+    """A node in a search tree.
 
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-    depth: int = 0
+    Uses __slots__ (no per-instance __dict__). The `f` and `h` slots hold the
+    values cached by `memoize(fn, "f")` / `memoize(fn, "h")`, and `metrics`
+    is filled in by the search engine on the returned goal node; all three
+    stay unset until assigned.
+    """
 
-    def __post_init__(self) -> None:
-        if self.parent is not None:
-            self.depth = self.parent.depth + 1
+    __slots__ = ("state", "parent", "action", "path_cost", "depth", "f", "h", "metrics")
+
+    def __init__(
+        self,
+        state: Any,
+        parent: Optional["Node"] = None,
+        action: Optional[Any] = None,
+        path_cost: float = 0.0,
+    ) -> None:
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+    def __repr__(self) -> str:
+        return f"<Node {self.state!r}>"
 
     # IMPORTANT: frontier update relies on equality-by-state
     def __eq__(self, other: object) -> bool:
@@ -73,31 +96,60 @@ class Node:
     def expand(self, problem: Problem) -> List["Node"]:
         return [self.child_node(problem, a) for a in problem.actions(self.state)]
 
+    def iter_children(self, problem: Problem, skip: Container[Any] = ()) -> Iterator["Node"]:
+        """Lazily yield child nodes, skipping states in `skip` before any Node is built."""
+        state, cost, path_cost = self.state, self.path_cost, problem.path_cost
+        for action in problem.actions(state):
+            next_state = problem.result(state, action)
+            if next_state in skip:
+                continue
+            yield Node(next_state, self, action, path_cost(cost, state, action, next_state))
+
     def child_node(self, problem: Problem, action: Any) -> "Node":
         next_state = problem.result(self.state, action)
         new_cost = problem.path_cost(self.path_cost, self.state, action, next_state)
         return Node(next_state, self, action, new_cost)
 
     def solution(self) -> List[Any]:
-        return [n.action for n in self.path()[1:]]
+        actions: List[Any] = [None] * self.depth
+        node = self
+        for i in range(self.depth - 1, -1, -1):
+            actions[i] = node.action
+            node = node.parent
+        return actions
 
     def path(self) -> List["Node"]:
-        node, path_back = self, []
-        while node is not None:
-            path_back.append(node)
+        nodes: List[Any] = [None] * (self.depth + 1)
+        node = self
+        for i in range(self.depth, -1, -1):
+            nodes[i] = node
+            node = node.parent
+        return nodes
+
+    def path_states(self) -> List[Any]:
+        """States from the root to this node (`[n.state for n in self.path()]`)."""
+        states: List[Any] = [None] * (self.depth + 1)
+        node = self
+        for i in range(self.depth, -1, -1):
+            states[i] = node.state
             node = node.parent
-        return list(reversed(path_back))
+        return states
 
 
 # -----------------------------------------------------------------------------
 # Heuristic Search (Best-first engine + specializations)
 
 
+ENGINES = ("classic", "best_g")
+
+
 def best_first_graph_search(
     problem: Problem,
     f: Callable[[Node], float],
     *,
     collect_metrics: bool = True,
+    engine: str = "classic",
+    stats: Optional[SearchStats] = None,
 ) -> Optional[Node]:
     """Best-first graph search.
 
@@ -106,56 +158,344 @@ def best_first_graph_search(
       - Uniform Cost Search (f = g)
       - A* Search (f = g + h)
 
+    engine:
+      - "classic": AIMA frontier (PriorityQueue) + explored set
+      - "best_g" : plain heap + a state -> best node table; superseded frontier
+                   entries are skipped when popped instead of being removed.
+    Both engines return the same path and the same metrics.
+
     If collect_metrics=True, attaches a dict to the returned Node:
       node.metrics = {"expanded_nodes": ..., "frontier_max": ..., "explored": ...}
+
+    If a SearchStats is passed as `stats`, the chosen engine also counts,
+    times and calls hooks (aima/instrumentation.py) and fills `stats` in,
+    also when no goal is found. Without it the engines skip all of that.
     """
 
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}")
+    search = _best_g_search if engine == "best_g" else _classic_search
+    if stats is None:
+        return search(problem, f, collect_metrics, None)
+    with stats.measure():
+        return search(problem, f, collect_metrics, stats)
+
+
+def _classic_search(
+    problem: Problem, f: Callable[[Node], float], collect_metrics: bool, stats: Optional[SearchStats]
+) -> Optional[Node]:
+    """`best_first_graph_search(engine="classic")`."""
+
     f = memoize(f, "f")
     node = Node(problem.initial)
     frontier = PriorityQueue(order="min", f=f)
     frontier.append(node)
     explored = set()
 
+    # Instrumentation: wrappers and hooks only when a SearchStats is given
+    counting = stats is not None
+    skip = stats.counting_skip(explored) if counting else explored
+    goal_test = stats.timed_goal_test(problem.goal_test) if counting else problem.goal_test
+    hooks = stats.on_expand if counting else ()
+
     expanded_nodes = 0
     frontier_max = len(frontier)
+    found = None
 
     while frontier:
         frontier_max = max(frontier_max, len(frontier))
 
         node = frontier.pop()
-        if problem.goal_test(node.state):
-            if collect_metrics:
-                node.metrics = {
-                    "expanded_nodes": expanded_nodes,
-                    "frontier_max": frontier_max,
-                    "explored": len(explored),
-                }
-            return node
+        if goal_test(node.state):
+            found = node
+            break
 
         explored.add(node.state)
         expanded_nodes += 1
+        for hook in hooks:
+            hook(node, stats)
 
-        for child in node.expand(problem):
-            if child.state not in explored and child not in frontier:
+        for child in node.iter_children(problem, skip):
+            if child not in frontier:
                 frontier.append(child)
-            elif child in frontier and f(child) < frontier[child]:
+            elif f(child) < frontier[child]:
                 del frontier[child]
                 frontier.append(child)
+                if counting:
+                    stats.reinsertions += 1
+            elif counting:
+                stats.duplicates += 1
+
+    return _finish_search(found, collect_metrics, stats, expanded_nodes, frontier_max, len(explored))
+
+
+def _best_g_search(
+    problem: Problem, f: Callable[[Node], float], collect_metrics: bool, stats: Optional[SearchStats]
+) -> Optional[Node]:
+    """`best_first_graph_search(engine="best_g")`.
+
+    `best` maps every open state to the cheapest node reached so far (hence
+    its best g); a state moves to `closed` when it is expanded. A child only
+    enters the heap if it improves f over the tabled node, exactly like the
+    classic replace-in-frontier rule, so results and tie-breaking match.
+    """
+
+    f = memoize(f, "f")
+    node = Node(problem.initial)
+    best: Dict[Any, Node] = {node.state: node}
+    closed: set = set()
+    heap: List[Tuple[float, int, Node]] = [(f(node), 0, node)]
+    counter = 0
+
+    counting = stats is not None
+    skip = stats.counting_skip(closed) if counting else closed
+    goal_test = stats.timed_goal_test(problem.goal_test) if counting else problem.goal_test
+    hooks = stats.on_expand if counting else ()
 
-    return None
+    expanded_nodes = 0
+    frontier_max = 1
+    push, pop = heapq.heappush, heapq.heappop
+    found = None
+
+    while heap:
+        node = pop(heap)[2]
+        state = node.state
+        if best.get(state) is not node:
+            continue  # superseded by a cheaper node, or already expanded
+        # len(best) == live heap entries == classic len(frontier)
+        if len(best) > frontier_max:
+            frontier_max = len(best)
+
+        if goal_test(state):
+            found = node
+            break
+
+        del best[state]
+        closed.add(state)
+        expanded_nodes += 1
+        for hook in hooks:
+            hook(node, stats)
+
+        for child in node.iter_children(problem, skip):
+            old = best.get(child.state)
+            if old is not None:
+                if not f(child) < f(old):
+                    if counting:
+                        stats.duplicates += 1
+                    continue
+                if counting:
+                    stats.reinsertions += 1
+            best[child.state] = child
+            counter += 1
+            push(heap, (f(child), counter, child))
+
+    return _finish_search(found, collect_metrics, stats, expanded_nodes, frontier_max, len(closed))
+
+
+def _finish_search(
+    node: Optional[Node],
+    collect_metrics: bool,
+    stats: Optional[SearchStats],
+    expanded_nodes: int,
+    frontier_max: int,
+    explored: int,
+) -> Optional[Node]:
+    """Attach node.metrics to a found goal node and record the run in `stats`."""
+    if node is not None and collect_metrics:
+        node.metrics = {
+            "expanded_nodes": expanded_nodes,
+            "frontier_max": frontier_max,
+            "explored": explored,
+        }
+    if stats is not None:
+        stats.record(node, expanded_nodes, frontier_max, explored)
+    return node
+
+
+def greedy_best_first_graph_search(
+    problem: Problem, *, engine: str = "classic", stats: Optional[SearchStats] = None
+) -> Optional[Node]:
+    h = problem.h if stats is None else stats.timed_heuristic(problem.h)
+    return best_first_graph_search(problem, lambda n: h(n), engine=engine, stats=stats)
+
+
+def uniform_cost_search(
+    problem: Problem, *, engine: str = "classic", stats: Optional[SearchStats] = None
+) -> Optional[Node]:
+    return best_first_graph_search(problem, lambda n: n.path_cost, engine=engine, stats=stats)
+
+
+def astar_search(
+    problem: Problem,
+    h: Optional[Callable[[Node], float]] = None,
+    *,
+    engine: str = "classic",
+    cache: Optional[HeuristicCache] = None,
+    stats: Optional[SearchStats] = None,
+) -> Optional[Node]:
+    """A* search (f = g + h).
+
+    cache: optional HeuristicCache; h values are then shared by state with
+           every other search using the same cache (e.g. the replans of one
+           online run).
+    stats: optional SearchStats filled in by the search (see
+           best_first_graph_search).
+    """
+    h = h or problem.h
+    if stats is not None:
+        h = stats.timed_heuristic(h)
+    if cache is not None:
+        h = cache.bind(h)
+    h = memoize(h, "h")
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), engine=engine, stats=stats)
 
 
-def greedy_best_first_graph_search(problem: Problem) -> Optional[Node]:
-    return best_first_graph_search(problem, lambda n: problem.h(n))
+# -----------------------------------------------------------------------------
+# Bidirectional A* (MM)
+
+
+class _Direction:
+    """One side of a bidirectional search: heap, best node per state, closed set."""
+
+    __slots__ = ("h", "heap", "reached", "closed", "counter", "expanded_nodes", "frontier_max")
+
+    def __init__(self, root: Node, h: Callable[[Node], float]) -> None:
+        self.h = h
+        self.heap: List[Tuple[float, int, Node]] = []
+        self.reached: Dict[Any, Node] = {}  # open or closed, cheapest node so far
+        self.closed: set = set()
+        self.counter = 0
+        self.expanded_nodes = 0
+        self.frontier_max = 1
+        self.add(root)
+
+    def add(self, node: Node) -> None:
+        g = node.path_cost
+        self.reached[node.state] = node
+        self.counter += 1
+        heapq.heappush(self.heap, (max(g + self.h(node), 2 * g), self.counter, node))
+
+    def min_priority(self) -> float:
+        """Smallest live priority (superseded entries are dropped on the way)."""
+        heap, reached = self.heap, self.reached
+        while heap and reached.get(heap[0][2].state) is not heap[0][2]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else float("inf")
 
+    def frontier(self) -> int:
+        return len(self.reached) - len(self.closed)
 
-def uniform_cost_search(problem: Problem) -> Optional[Node]:
-    return best_first_graph_search(problem, lambda n: n.path_cost)
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "expanded_nodes": self.expanded_nodes,
+            "frontier_max": self.frontier_max,
+            "explored": len(self.closed),
+        }
 
 
-def astar_search(problem: Problem, h: Optional[Callable[[Node], float]] = None) -> Optional[Node]:
-    h = memoize(h or problem.h, "h")
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+def bidirectional_astar_search(
+    problem: Problem,
+    h: Optional[Callable[[Node], float]] = None,
+    *,
+    h_backward: Optional[Callable[[Node], float]] = None,
+    collect_metrics: bool = True,
+) -> Optional[Node]:
+    """Bidirectional A* with the MM rule (Holte et al., 2016).
+
+    A forward search from `problem.initial` and a backward search from the
+    (single) `problem.goal` over `problem.predecessors` each order their open
+    list by pr(n) = max(g(n) + h(n), 2 g(n)); the side with the smaller
+    minimum priority C is expanded next. Every state reached from both
+    sides closes a path, and the cheapest one (U) is returned once U <= C,
+    at which point no cheaper path can exist. The 2g term keeps either side
+    from running past the midpoint of the optimal path.
+
+    h estimates the cost to the goal (default: problem.h). h_backward
+    estimates the cost back to the initial state; by default it is `h` of a
+    shallow copy of the problem with initial and goal swapped, which is
+    right for problems whose h reads self.goal (e.g. GraphProblem). Like the
+    unidirectional engines, closed states are never reopened, so heuristics
+    should be consistent.
+
+    The returned node is an ordinary forward path (solution(), path()...).
+    If collect_metrics=True, node.metrics holds the best_first_graph_search
+    fields summed over both sides, plus the same fields per side:
+      {"expanded_nodes", "frontier_max", "explored",
+       "forward": {...}, "backward": {...}}
+    """
+
+    if isinstance(problem.goal, list):
+        raise ValueError("bidirectional search needs a single goal state")
+    if h_backward is None:
+        reverse = copy.copy(problem)
+        reverse.initial, reverse.goal = problem.goal, problem.initial
+        h_backward = reverse.h
+
+    fwd = _Direction(Node(problem.initial), memoize(h or problem.h, "h"))
+    bwd = _Direction(Node(problem.goal), memoize(h_backward, "h"))
+    path_cost, predecessors = problem.path_cost, problem.predecessors
+
+    best_cost = float("inf")
+    meeting: Optional[Tuple[Node, Node]] = None  # (forward node, backward node)
+    if problem.initial == problem.goal:
+        best_cost, meeting = 0.0, (fwd.reached[problem.initial], bwd.reached[problem.goal])
+    frontier_max = 2
+
+    while True:
+        pr_forward, pr_backward = fwd.min_priority(), bwd.min_priority()
+        if meeting is not None and best_cost <= min(pr_forward, pr_backward):
+            break
+        # An exhausted side has seen every state it can reach, meetings included
+        if not fwd.heap or not bwd.heap:
+            break
+        frontier_max = max(frontier_max, fwd.frontier() + bwd.frontier())
+
+        side, other = (fwd, bwd) if pr_forward <= pr_backward else (bwd, fwd)
+        node = heapq.heappop(side.heap)[2]
+        state = node.state
+        side.frontier_max = max(side.frontier_max, side.frontier())
+        side.closed.add(state)
+        side.expanded_nodes += 1
+
+        if side is fwd:
+            children: Iterable[Node] = node.iter_children(problem, side.closed)
+        else:
+            children = (
+                Node(prev, node, action, path_cost(node.path_cost, prev, action, state))
+                for prev, action in predecessors(state)
+                if prev not in side.closed
+            )
+
+        for child in children:
+            old = side.reached.get(child.state)
+            if old is not None and not child.path_cost < old.path_cost:
+                continue
+            side.add(child)
+            match = other.reached.get(child.state)
+            if match is not None and child.path_cost + match.path_cost < best_cost:
+                best_cost = child.path_cost + match.path_cost
+                meeting = (child, match) if side is fwd else (match, child)
+
+    if meeting is None:
+        return None
+
+    # Forward path to the meeting state, then the backward chain replayed forwards
+    node, back = meeting
+    while back.parent is not None:
+        nxt = back.parent.state
+        node = Node(nxt, node, back.action, path_cost(node.path_cost, node.state, back.action, nxt))
+        back = back.parent
+
+    if collect_metrics:
+        forward, backward = fwd.metrics(), bwd.metrics()
+        node.metrics = {
+            "expanded_nodes": forward["expanded_nodes"] + backward["expanded_nodes"],
+            "frontier_max": frontier_max,
+            "explored": forward["explored"] + backward["explored"],
+            "forward": forward,
+            "backward": backward,
+        }
+    return node
 
 
 # -----------------------------------------------------------------------------
@@ -203,6 +543,11 @@ class GraphProblem(Problem):
     def path_cost(self, c: float, A: Any, action: Any, B: Any) -> float:
         return c + (self.graph.get(A, B) or float("inf"))
 
+    def predecessors(self, B: Any) -> Iterable[Tuple[Any, Any]]:
+        if self.graph.directed:
+            return [(A, B) for A, links in self.graph.graph_dict.items() if B in links]
+        return [(A, B) for A in self.graph.get(B)]
+
     def h(self, node: Node) -> float:
         if self.graph.locations and node.state in self.graph.locations and self.goal in self.graph.locations:
             return distance(self.graph.locations[node.state], self.graph.locations[self.goal])
@@ -10,8 +10,9 @@ from __future__ import annotations
 
 import heapq
 import math
+from collections import OrderedDict
 from functools import lru_cache, wraps
-from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
@@ -21,11 +22,13 @@ def is_in(elt: Any, seq: Iterable[Any]) -> bool:
     return any(elt is x for x in seq)
 
 
-def memoize(fn: Callable[..., T], slot: Optional[str] = None) -> Callable[..., T]:
+def memoize(fn: Callable[..., T], slot: Optional[str] = None, maxsize: Optional[int] = None) -> Callable[..., T]:
     """Memoize a function.
 
     - If `slot` is provided, cache the result on the first argument object.
-    - Otherwise cache by arguments using an unbounded LRU cache.
+    - Otherwise cache by arguments using an LRU cache: unbounded by default,
+      or at most `maxsize` entries if given; `cache_info()` /
+      `cache_clear()` are exposed.
     """
 
     if slot:
@@ -40,15 +43,103 @@ def memoize(fn: Callable[..., T], slot: Optional[str] = None) -> Callable[..., T
 
         return memoized
 
-    cached = lru_cache(maxsize=None)(fn)
+    cached = lru_cache(maxsize=maxsize)(fn)
 
     @wraps(fn)
     def memoized(*args, **kwargs):
         return cached(*args, **kwargs)
 
+    memoized.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    memoized.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
     return memoized
 
 
+class HeuristicCache:
+    """Heuristic values keyed by state, shareable across searches.
+
+    `memoize(h, "h")` caches on the Node, so the same state reached through
+    another node -- or in the next search -- calls h again. Wrap the
+    heuristic with `cache.bind(h)` (astar_search(..., cache=cache) does it)
+    and every state is evaluated once while it stays cached.
+
+    - maxsize: entries kept (None = unbounded)
+    - policy:  which entry a full cache drops,
+               "lru" (least recently used) or "fifo" (oldest insertion)
+    - key:     maps the heuristic's argument to the cache key
+               (default: node.state)
+
+    Values are only valid while the heuristic is: share a cache between
+    searches toward the same goal with the same h, and `clear()` it otherwise.
+    """
+
+    POLICIES = ("lru", "fifo")
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        policy: str = "lru",
+        key: Callable[[Any], Any] = lambda node: node.state,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be positive or None")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.values: "OrderedDict[Any, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self.values
+
+    def bind(self, h: Callable[[Any], float]) -> Callable[[Any], float]:
+        """h wrapped to read from and fill this cache."""
+        values, key, maxsize = self.values, self.key, self.maxsize
+        lru = self.policy == "lru"
+
+        @wraps(h)
+        def cached(arg: Any) -> float:
+            k = key(arg)
+            val = values.get(k)
+            if val is not None:
+                self.hits += 1
+                if lru:
+                    values.move_to_end(k)
+                return val
+            self.misses += 1
+            val = values[k] = h(arg)
+            if maxsize is not None and len(values) > maxsize:
+                values.popitem(last=False)
+                self.evictions += 1
+            return val
+
+        return cached
+
+    def clear(self) -> None:
+        """Drop every value and reset the counters (a fresh caching regime)."""
+        self.values.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": float(self.hits),
+            "misses": float(self.misses),
+            "evictions": float(self.evictions),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": float(len(self.values)),
+        }
+
+
+_REMOVED = object()  # placeholder marking a lazily deleted heap entry
+
+
 class PriorityQueue:
     """Priority queue with the operations used by AIMA best-first search.
 
@@ -58,6 +149,13 @@ class PriorityQueue:
     - `item in pq`
     - `pq[item]`    -> priority
     - `del pq[item]`
+    - decrease_key(item)
+
+    Implementation: a binary heap with lazy deletion plus a position map
+    (item -> heap entry). Membership and priority lookup are O(1); delete is
+    O(1) (the heap entry is only marked dead) and decrease-key is O(log n).
+    Items are keyed by hash/equality, so at most one entry per key is live:
+    appending an item equal to a queued one replaces it.
     """
 
     def __init__(self, order: str = "min", f: Callable[[Any], Any] = lambda x: x):
@@ -68,48 +166,76 @@ class PriorityQueue:
         # IMPORTANT: we include an ever-increasing counter to avoid Python trying
         # to compare `item` values when priorities tie (Nodes are not orderable).
         self._counter = 0
-        self.heap: List[Tuple[Any, int, Any]] = []  # (priority, counter, item)
+        self.heap: List[List[Any]] = []  # [priority, counter, item]
+        self._entries: Dict[Any, List[Any]] = {}  # item -> live heap entry
 
     def append(self, item: Any) -> None:
         pr = self.f(item)
         if self.order == "max":
             pr = -pr
-        self._counter += 1
-        heapq.heappush(self.heap, (pr, self._counter, item))
+        self._push(item, pr)
 
     def extend(self, items: Iterable[Any]) -> None:
         for it in items:
             self.append(it)
 
     def pop(self) -> Any:
-        if not self.heap:
-            raise KeyError("pop from empty PriorityQueue")
-        return heapq.heappop(self.heap)[2]
+        heap = self.heap
+        while heap:
+            item = heapq.heappop(heap)[2]
+            if item is not _REMOVED:
+                del self._entries[item]
+                return item
+        raise KeyError("pop from empty PriorityQueue")
+
+    def decrease_key(self, item: Any) -> bool:
+        """Replace the queued entry equal to `item` if `item` has a better priority.
+
+        Returns True if the queue changed. Items not yet queued are appended.
+        """
+        pr = self.f(item)
+        if self.order == "max":
+            pr = -pr
+        entry = self._entries.get(item)
+        if entry is not None and not pr < entry[0]:
+            return False
+        self._push(item, pr)
+        return True
+
+    def _push(self, item: Any, pr: Any) -> None:
+        old = self._entries.get(item)
+        if old is not None:
+            old[2] = _REMOVED
+        self._counter += 1
+        entry = [pr, self._counter, item]
+        self._entries[item] = entry
+        heapq.heappush(self.heap, entry)
+        # Keep dead entries from dominating the heap after many updates.
+        if len(self.heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self.heap = [e for e in self.heap if e[2] is not _REMOVED]
+        heapq.heapify(self.heap)
 
     def __len__(self) -> int:
-        return len(self.heap)
+        return len(self._entries)
 
     def __iter__(self) -> Iterator[Any]:
         for _, _, item in self.heap:
-            yield item
+            if item is not _REMOVED:
+                yield item
 
     def __contains__(self, item: Any) -> bool:
-        return any(it == item for _, _, it in self.heap)
+        return item in self._entries
 
     def __getitem__(self, key: Any) -> Any:
-        for pr, _, it in self.heap:
-            if it == key:
-                return -pr if self.order == "max" else pr
-        raise KeyError(key)
+        pr = self._entries[key][0]
+        return -pr if self.order == "max" else pr
 
     def __delitem__(self, key: Any) -> None:
-        # Remove first matching item; O(n) but good enough for HW4.
-        for i, (_, _, it) in enumerate(self.heap):
-            if it == key:
-                self.heap.pop(i)
-                heapq.heapify(self.heap)
-                return
-        raise KeyError(key)
+        entry = self._entries.pop(key)
+        entry[2] = _REMOVED
 
 
 def distance(a: Tuple[float, float], b: Tuple[float, float]) -> float:
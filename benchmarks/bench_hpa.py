@@ -0,0 +1,134 @@
+"""benchmarks/bench_hpa.py
+
+HPA* (mazeescape.algorithms.hierarchical_astar) vs. flat grid A* on large
+generated mazes.
+
+For every maze kind x size the cluster map is built once, then the same
+seeded random start/goal pairs (free cells, solvable ones only) are solved
+by both searches. Flat A* is grid_astar_search, the fastest flat engine.
+Reported per maze:
+  - build      : ClusterMap preprocessing time and abstract graph size
+  - query ms   : mean wall time per query (HPA* includes refinement)
+  - expansions : mean expansions per query (HPA*: abstract + local cells)
+  - subopt     : mean HPA* path cost / optimal cost
+  - break-even : queries after which the build time has paid for itself
+
+Usage:
+  python benchmarks/bench_hpa.py
+  python benchmarks/bench_hpa.py --sizes 1024 2048 4096 --kinds kruskal --queries 5
+  python benchmarks/bench_hpa.py --cluster-size 32 --json hpa.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Allow running via: `python benchmarks/<file>.py`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from mazeescape.algorithms.grid_astar import grid_astar_search, index_heuristic
+from mazeescape.algorithms.hierarchical_astar import ClusterMap
+from mazeescape.environments.maze_generator import generate_maze
+from mazeescape.heuristics.heuristics import manhattan_distance
+
+
+def query_pairs(walls: np.ndarray, count: int, seed: int) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """`count` random (start, goal) pairs of free cells."""
+    free = np.flatnonzero(~walls.ravel())
+    rng = random.Random(seed)
+    width = walls.shape[1]
+    pairs = []
+    for _ in range(count):
+        a, b = (int(free[rng.randrange(free.size)]) for _ in range(2))
+        pairs.append(((a % width, a // width), (b % width, b // width)))
+    return pairs
+
+
+def bench(kind: str, size: int, queries: int, cluster_size: int, seed: int) -> Dict[str, float]:
+    world = generate_maze(kind, size, seed=seed)
+    adjacency = world.compile_adjacency()
+    w = world.width
+    cluster_map = ClusterMap.from_world(world, cluster_size)
+
+    hpa_ms: List[float] = []
+    flat_ms: List[float] = []
+    hpa_exp: List[int] = []
+    flat_exp: List[int] = []
+    ratios: List[float] = []
+    for start, goal in query_pairs(world.walls, queries, seed):
+        t0 = time.perf_counter()
+        search = cluster_map.search(start, goal)
+        path = list(cluster_map.refine(search))
+        t1 = time.perf_counter()
+        flat = grid_astar_search(
+            adjacency, start[1] * w + start[0], goal[1] * w + goal[0], index_heuristic(manhattan_distance, w, goal)
+        )
+        t2 = time.perf_counter()
+        if not flat.found:
+            continue  # different components (obstacle mazes)
+        hpa_ms.append((t1 - t0) * 1000)
+        flat_ms.append((t2 - t1) * 1000)
+        hpa_exp.append(search.expansions)
+        flat_exp.append(flat.expansions)
+        optimal = flat.g[goal[1] * w + goal[0]]
+        if optimal:
+            ratios.append((len(path) - 1) / optimal)
+
+    saved = statistics.mean(flat_ms) - statistics.mean(hpa_ms) if hpa_ms else 0.0
+    return {
+        "kind": kind,
+        "size": size,
+        "queries": len(hpa_ms),
+        "build_ms": cluster_map.build_ms,
+        "abstract_nodes": cluster_map.node_count,
+        "abstract_edges": cluster_map.edge_count,
+        "hpa_ms": statistics.mean(hpa_ms) if hpa_ms else math.nan,
+        "flat_ms": statistics.mean(flat_ms) if flat_ms else math.nan,
+        "hpa_expansions": statistics.mean(hpa_exp) if hpa_exp else math.nan,
+        "flat_expansions": statistics.mean(flat_exp) if flat_exp else math.nan,
+        "subopt": statistics.mean(ratios) if ratios else math.nan,
+        "break_even": cluster_map.build_ms / saved if saved > 0 else math.inf,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HPA* vs. flat A* on large mazes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 2048])
+    parser.add_argument("--kinds", nargs="+", default=["kruskal", "rooms", "obstacles"])
+    parser.add_argument("--queries", type=int, default=10, help="start/goal pairs per maze")
+    parser.add_argument("--cluster-size", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    print(f"=== HPA* (cluster {args.cluster_size}) vs. flat A*, {args.queries} queries per maze ===")
+    results = []
+    for size in args.sizes:
+        for kind in args.kinds:
+            r = bench(kind, size, args.queries, args.cluster_size, args.seed)
+            results.append(r)
+            print(
+                f"{kind:10s} {size:5d}^2 | build={r['build_ms'] / 1000:6.2f} s "
+                f"({r['abstract_nodes']} nodes, {r['abstract_edges']} edges) | "
+                f"query ms hpa={r['hpa_ms']:8.1f} flat={r['flat_ms']:8.1f} | "
+                f"exp hpa={r['hpa_expansions']:9.0f} flat={r['flat_expansions']:9.0f} | "
+                f"subopt={r['subopt']:.3f} | break-even={r['break_even']:.1f} queries"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""benchmarks/bench_import_time.py
+
+Startup latency of the CLI entry points, measured with `python -X importtime`.
+
+Each target is imported in a fresh interpreter (so nothing is cached in
+sys.modules) and the importtime report on stderr is parsed:
+  - import   : sum of the top-level cumulative import times (ms)
+  - wall     : wall-clock time of the whole subprocess (ms)
+  - heaviest : the slowest top-level package and its cumulative time
+  - mpl      : whether matplotlib ended up in sys.modules
+
+The search core (aima.search + MazeWorld) and the headless runners must not
+load matplotlib; plotting is imported by the visualization entry points only.
+
+Usage:
+  python benchmarks/bench_import_time.py
+  python benchmarks/bench_import_time.py --repeat 9 --json import_times.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# name -> import statement run in the child interpreter
+TARGETS: Dict[str, str] = {
+    "search-core": "import aima.search, mazeescape.environments.maze_grid_world",
+    "main": "import main",
+    "run_offline": "import mazeescape.experiments.run_offline",
+    "run_online": "import mazeescape.experiments.run_online",
+    "plot_results": "import mazeescape.experiments.plot_results",
+    "replay_trace": "import mazeescape.experiments.replay_trace",
+}
+
+_PROBE = "import sys; {stmt}; sys.stdout.write(str(int('matplotlib' in sys.modules)))"
+
+
+def parse_importtime(report: str) -> List[Tuple[str, int]]:
+    """Top-level (module, cumulative_us) pairs from an -X importtime report."""
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Nested imports are indented under their importer; keep the roots.
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        rows.append((name.strip(), int(cumulative)))
+    return rows
+
+
+def measure(stmt: str) -> Tuple[float, float, Tuple[str, float], bool]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(stmt=stmt)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - t0) * 1000
+    rows = parse_importtime(proc.stderr)
+    name, heaviest = max(rows, key=lambda r: r[1])
+    import_ms = sum(us for _, us in rows) / 1000
+    return import_ms, wall_ms, (name, heaviest / 1000), proc.stdout.strip() == "1"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="python -X importtime startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per target (median is reported)")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS), help="limit to these targets")
+    parser.add_argument("--json", help="also write the medians to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"=== import time (median of {args.repeat}) ===")
+    for name in args.target or TARGETS:
+        runs = [measure(TARGETS[name]) for _ in range(args.repeat)]
+        import_ms = statistics.median(r[0] for r in runs)
+        wall_ms = statistics.median(r[1] for r in runs)
+        heaviest, heaviest_ms = runs[-1][2]
+        mpl = runs[-1][3]
+        results[name] = {"import_ms": import_ms, "wall_ms": wall_ms, "matplotlib": mpl}
+        print(
+            f"{name:13s} | import={import_ms:8.1f} ms | wall={wall_ms:8.1f} ms | "
+            f"mpl={'yes' if mpl else 'no ':3s} | heaviest={heaviest} ({heaviest_ms:.1f} ms)"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
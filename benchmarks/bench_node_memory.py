@@ -0,0 +1,80 @@
+"""benchmarks/bench_node_memory.py
+
+tracemalloc benchmark for search-tree memory on a large maze.
+
+Builds a seeded W x H maze (random obstacles, start top-left, goal
+bottom-right), runs A* with the Manhattan heuristic on both
+best_first_graph_search engines and reports:
+  - peak traced memory during the search (MiB)
+  - traced memory still held by the result path (MiB)
+  - wall time (tracing makes this several times slower than untraced)
+
+Usage:
+  python benchmarks/bench_node_memory.py            # 1000 x 1000
+  python benchmarks/bench_node_memory.py --size 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Allow running via: `python benchmarks/<file>.py`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from aima.search import ENGINES, astar_search
+from mazeescape.environments.maze_grid_world import MazeWorld
+from mazeescape.heuristics.heuristics import manhattan_distance
+from mazeescape.problems.maze_grid_problem import MazeGridProblem
+
+
+def make_world(size: int, density: float, seed: int) -> MazeWorld:
+    rng = random.Random(seed)
+    rows = [["#" if rng.random() < density else "." for _ in range(size)] for _ in range(size)]
+    rows[0][0] = "S"
+    rows[size - 1][size - 1] = "G"
+    return MazeWorld(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="tracemalloc numbers for A* on a large maze")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--density", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    world = make_world(args.size, args.density, args.seed)
+    goal = world.goal
+
+    def h(node) -> float:
+        return manhattan_distance(node.state, goal)
+
+    print(f"=== A* node memory ({args.size}x{args.size}, density={args.density}) ===")
+    for engine in ENGINES:
+        problem = MazeGridProblem(world, world.start, world.goal)
+        gc.collect()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        node = astar_search(problem, h=h, engine=engine)
+        t1 = time.perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        metrics = getattr(node, "metrics", {}) if node is not None else {}
+        print(
+            f"{engine:8s} | peak={peak / 2**20:8.1f} MiB | held={held / 2**20:8.1f} MiB | "
+            f"expanded={metrics.get('expanded_nodes', 0):>8} | "
+            f"cost={getattr(node, 'path_cost', float('nan')):.0f} | time={t1 - t0:6.2f} s"
+        )
+        del node, problem
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""benchmarks/bench_priority_queue.py
+
+Micro-benchmark: indexed `aima.utils.PriorityQueue` vs. the original
+scan-based queue, on frontiers of 10^3 .. 10^6 items.
+
+Each size measures, per operation:
+  - build    : append n items
+  - contains : `item in pq`
+  - getitem  : `pq[item]`
+  - decrease : decrease-key (delete + re-append on the scan-based queue)
+  - pop      : pop the best item
+
+The scan-based queue is O(n) per lookup, so it only runs `--legacy-ops`
+lookups per size (default 50) and reports the per-operation average.
+
+Usage:
+  python benchmarks/bench_priority_queue.py
+  python benchmarks/bench_priority_queue.py --sizes 1000 10000 --ops 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Allow running via: `python benchmarks/<file>.py`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from aima.utils import PriorityQueue
+
+
+class ScanPriorityQueue:
+    """Snapshot of the original O(n)-lookup PriorityQueue (reference only)."""
+
+    def __init__(self, order: str = "min", f: Callable[[Any], Any] = lambda x: x):
+        self.order = order
+        self.f = f
+        self._counter = 0
+        self.heap: List[Tuple[Any, int, Any]] = []
+
+    def append(self, item: Any) -> None:
+        pr = self.f(item)
+        if self.order == "max":
+            pr = -pr
+        self._counter += 1
+        heapq.heappush(self.heap, (pr, self._counter, item))
+
+    def pop(self) -> Any:
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: Any) -> bool:
+        return any(it == item for _, _, it in self.heap)
+
+    def __getitem__(self, key: Any) -> Any:
+        for pr, _, it in self.heap:
+            if it == key:
+                return -pr if self.order == "max" else pr
+        raise KeyError(key)
+
+    def __delitem__(self, key: Any) -> None:
+        for i, (_, _, it) in enumerate(self.heap):
+            if it == key:
+                self.heap.pop(i)
+                heapq.heapify(self.heap)
+                return
+        raise KeyError(key)
+
+    def decrease_key(self, item: Any) -> bool:
+        # What best_first_graph_search did before the queue had decrease-key.
+        if self.f(item) < self[item]:
+            del self[item]
+            self.append(item)
+            return True
+        return False
+
+
+class _Item:
+    """Hashable item keyed by `key`, ordered only via `priority` (like Node)."""
+
+    __slots__ = ("key", "priority")
+
+    def __init__(self, key: int, priority: float):
+        self.key = key
+        self.priority = priority
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Item) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+def _per_op_us(fn: Callable[[], None], ops: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / max(ops, 1) * 1e6
+
+
+def bench_queue(factory: Callable[[], Any], n: int, ops: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    items = [_Item(k, rng.random() * n) for k in range(n)]
+    probes = [items[rng.randrange(n)] for _ in range(ops)]
+    better = [_Item(p.key, p.priority - n) for p in probes]
+
+    pq = factory()
+    t0 = time.perf_counter()
+    for it in items:
+        pq.append(it)
+    build_us = (time.perf_counter() - t0) / n * 1e6
+
+    def contains() -> None:
+        for p in probes:
+            p in pq
+
+    def getitem() -> None:
+        for p in probes:
+            pq[p]
+
+    def decrease() -> None:
+        for b in better:
+            pq.decrease_key(b)
+
+    def pop() -> None:
+        for _ in range(ops):
+            pq.pop()
+
+    return {
+        "build": build_us,
+        "contains": _per_op_us(contains, ops),
+        "getitem": _per_op_us(getitem, ops),
+        "decrease": _per_op_us(decrease, ops),
+        "pop": _per_op_us(pop, ops),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--ops", type=int, default=10_000, help="lookups per size (indexed queue)")
+    parser.add_argument("--legacy-ops", type=int, default=50, help="lookups per size (scan queue)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    key = lambda it: it.priority  # noqa: E731
+    ops_names = ["build", "contains", "getitem", "decrease", "pop"]
+
+    print("=== PriorityQueue benchmark (microseconds per operation) ===")
+    print(f"{'n':>9s} {'queue':>8s} " + " ".join(f"{name:>10s}" for name in ops_names))
+    for n in args.sizes:
+        indexed = bench_queue(lambda: PriorityQueue("min", key), n, min(args.ops, n), args.seed)
+        scan = bench_queue(lambda: ScanPriorityQueue("min", key), n, min(args.legacy_ops, n), args.seed)
+        for label, res in (("scan", scan), ("indexed", indexed)):
+            print(f"{n:>9d} {label:>8s} " + " ".join(f"{res[name]:>10.2f}" for name in ops_names))
+        speedup = " ".join(
+            f"{scan[name] / indexed[name]:>9.1f}x" if indexed[name] else f"{'-':>10s}" for name in ops_names
+        )
+        print(f"{'':>9s} {'speedup':>8s} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""benchmarks/search_suite.py
+
+Search benchmark suite: scaling curves + stored JSON baselines.
+
+Cases are algorithm x maze size x obstacle density on seeded
+`obstacles` mazes from maze_generator (which carves a path between S
+and G, so every case has one). Algorithms:
+  greedy, ucs, astar, astar_best_g   best_first_graph_search on MazeGridProblem
+  astar_bidirectional                bidirectional_astar_search on MazeGridProblem
+  astar_alt                          astar_search with 8 ALT landmarks (selection
+                                     included in the timing)
+  offline_astar, grid_astar, jps,    the offline runners' engines (hpa
+  hpa, field                         includes building its cluster map,
+                                     field its distance field: no caching)
+  online_astar, online_dstar_lite,   online_astar with the given planner
+  online_jps, online_hpa, online_field
+
+Recorded per case:
+  wall_ms       median wall time over --repeat untraced runs
+  expansions    node expansions (deterministic)
+  exp_per_s     expansions / median wall time
+  peak_mem_mib  tracemalloc peak of one extra traced run
+  frontier_max  largest frontier (None where the algorithm does not report it)
+  path_cost
+
+Commands:
+  run      measure and write a results JSON (--save-baseline also stores it
+           as the baseline, default benchmarks/baselines/search_suite.json)
+  compare  compare results with a baseline; cases whose wall_ms, peak_mem_mib
+           or expansions grew by more than --threshold are flagged and the
+           exit status is 1. Without a results file the suite is re-run
+           with the baseline's configuration first. Wall times depend on
+           the machine, so no baseline is committed: on a fresh checkout
+           run `run --save-baseline` once (until then compare only says so
+           and exits 0).
+  plot     log-log scaling curves (wall time vs. cells) per algorithm/density
+
+Usage:
+  python benchmarks/search_suite.py run --save-baseline
+  python benchmarks/search_suite.py compare
+  python benchmarks/search_suite.py compare baseline.json current.json --threshold 0.1
+  python benchmarks/search_suite.py plot current.json --out scaling.png
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Allow running via: `python benchmarks/<file>.py`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from aima.search import (
+    astar_search,
+    bidirectional_astar_search,
+    greedy_best_first_graph_search,
+    uniform_cost_search,
+)
+from mazeescape.algorithms.grid_astar import grid_astar
+from mazeescape.algorithms.hierarchical_astar import hpa_star
+from mazeescape.algorithms.jump_point_search import jump_point_search
+from mazeescape.algorithms.offline_astar import offline_astar
+from mazeescape.algorithms.online_astar import online_astar
+from mazeescape.environments.maze_generator import generate_maze
+from mazeescape.environments.maze_grid_world import MazeWorld
+from mazeescape.heuristics.distance_field import FieldCache, distance_field_search
+from mazeescape.heuristics.heuristics import manhattan_distance
+from mazeescape.heuristics.landmarks import MazeLandmarks
+from mazeescape.problems.maze_grid_problem import MazeGridProblem
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "search_suite.json")
+
+# Metrics where a larger value is a regression
+TRACKED = ("wall_ms", "peak_mem_mib", "expansions")
+
+Result = Dict[str, Optional[float]]
+
+
+# =========================================================
+# ALGORITHMS
+# =========================================================
+# Each runner takes a fresh MazeWorld and returns
+# (expansions, path_cost, frontier_max or None).
+
+def _aima(search: Callable[..., Any], **kwargs) -> Callable[[MazeWorld], Tuple]:
+    def run(world: MazeWorld) -> Tuple:
+        goal = world.goal
+        problem = MazeGridProblem(world, world.start, goal)
+        problem.h = lambda node: manhattan_distance(node.state, goal)  # used by greedy
+        problem.h_backward = lambda node: manhattan_distance(node.state, world.start)
+        node = search(problem, **kwargs)
+        metrics = node.metrics
+        return metrics["expanded_nodes"], node.path_cost, metrics["frontier_max"]
+
+    return run
+
+
+def _offline(engine: Callable[..., Tuple]) -> Callable[[MazeWorld], Tuple]:
+    def run(world: MazeWorld) -> Tuple:
+        _, metrics = engine(world, heuristic=manhattan_distance)
+        return metrics["node_expansions"], metrics["path_cost"], metrics.get("frontier_max")
+
+    return run
+
+
+def _online(planner: str) -> Callable[[MazeWorld], Tuple]:
+    def run(world: MazeWorld) -> Tuple:
+        _, _, metrics = online_astar(world, manhattan_distance, planner=planner)
+        return metrics["node_expansions"], metrics["path_cost"], metrics.get("frontier_max")
+
+    return run
+
+
+ALGORITHMS: Dict[str, Callable[[MazeWorld], Tuple]] = {
+    "greedy": _aima(greedy_best_first_graph_search),
+    "ucs": _aima(uniform_cost_search),
+    "astar": _aima(lambda p: astar_search(p, h=p.h)),
+    "astar_best_g": _aima(lambda p: astar_search(p, h=p.h, engine="best_g")),
+    "astar_bidirectional": _aima(lambda p: bidirectional_astar_search(p, h=p.h, h_backward=p.h_backward)),
+    "astar_alt": _aima(lambda p: astar_search(p, h=MazeLandmarks(p.world).node_heuristic(p.goal))),
+    "offline_astar": _offline(offline_astar),
+    "grid_astar": _offline(grid_astar),
+    "jps": _offline(jump_point_search),
+    "hpa": _offline(hpa_star),
+    "field": _offline(lambda world, heuristic: distance_field_search(world, heuristic, cache=FieldCache())),
+    "online_astar": _online("astar"),
+    "online_dstar_lite": _online("dstar_lite"),
+    "online_jps": _online("jps"),
+    "online_hpa": _online("hpa"),
+    "online_field": _online("field"),
+}
+
+
+# =========================================================
+# MEASUREMENT
+# =========================================================
+
+def solvable_maze(size: int, density: float, seed: int) -> Tuple[np.ndarray, Tuple, Tuple, int]:
+    """Walls / start / goal / seed of the obstacle maze for `seed` (always solvable)."""
+    world = generate_maze("obstacles", size, seed=seed, density=density)
+    return np.array(world.walls), world.start, world.goal, seed
+
+
+def measure(run: Callable[[MazeWorld], Tuple], maze: Tuple, repeat: int) -> Result:
+    walls, start, goal, _ = maze
+    times = []
+    for _ in range(repeat):
+        world = MazeWorld.from_array(walls, start, goal)
+        gc.collect()
+        t0 = time.perf_counter()
+        expansions, path_cost, frontier_max = run(world)
+        times.append(time.perf_counter() - t0)
+
+    world = MazeWorld.from_array(walls, start, goal)
+    gc.collect()
+    tracemalloc.start()
+    run(world)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    wall = statistics.median(times)
+    return {
+        "wall_ms": wall * 1000,
+        "expansions": float(expansions),
+        "exp_per_s": expansions / wall if wall > 0 else None,
+        "peak_mem_mib": peak / 2**20,
+        "frontier_max": None if frontier_max is None else float(frontier_max),
+        "path_cost": float(path_cost),
+    }
+
+
+def case_key(algorithm: str, size: int, density: float) -> str:
+    return f"{algorithm}/{size}/{density:g}"
+
+
+def run_suite(config: Dict[str, Any]) -> Dict[str, Any]:
+    cases: Dict[str, Any] = {}
+    print(f"{'case':32s} {'wall_ms':>10s} {'expansions':>11s} {'exp/s':>11s} {'peak_MiB':>9s} {'frontier':>9s}")
+    for size in config["sizes"]:
+        for density in config["densities"]:
+            maze = solvable_maze(size, density, config["seed"])
+            for algorithm in config["algorithms"]:
+                key = case_key(algorithm, size, density)
+                result = measure(ALGORITHMS[algorithm], maze, config["repeat"])
+                cases[key] = {"algorithm": algorithm, "size": size, "density": density, "seed": maze[3], **result}
+                frontier = "-" if result["frontier_max"] is None else f"{result['frontier_max']:.0f}"
+                print(
+                    f"{key:32s} {result['wall_ms']:10.2f} {result['expansions']:11.0f} "
+                    f"{result['exp_per_s'] or 0:11.0f} {result['peak_mem_mib']:9.2f} {frontier:>9s}"
+                )
+
+    return {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": f"{platform.system()} {platform.machine()}",
+            "config": config,
+        },
+        "cases": cases,
+    }
+
+
+# =========================================================
+# COMPARE
+# =========================================================
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a per-case comparison; returns the regressed case/metric labels."""
+    regressions = []
+    print(f"{'case':32s} " + " ".join(f"{m:>22s}" for m in TRACKED))
+    for key, base in baseline["cases"].items():
+        cur = current["cases"].get(key)
+        if cur is None:
+            print(f"{key:32s} missing from current results")
+            continue
+        cells = []
+        for metric in TRACKED:
+            old, new = base.get(metric), cur.get(metric)
+            if not old or new is None:
+                cells.append(f"{'-':>22s}")
+                continue
+            ratio = new / old
+            flag = "  "
+            if ratio > 1 + threshold:
+                flag = "!!"
+                regressions.append(f"{key} {metric}")
+            elif ratio < 1 - threshold:
+                flag = "++"
+            cells.append(f"{old:9.4g} -> {new:9.4g}{flag}")
+        print(f"{key:32s} " + " ".join(cells))
+
+    for key in current["cases"].keys() - baseline["cases"].keys():
+        print(f"{key:32s} new case (no baseline)")
+    return regressions
+
+
+# =========================================================
+# PLOT
+# =========================================================
+
+def plot(results: Dict[str, Any], out: str) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    curves: Dict[str, List[Tuple[int, float]]] = {}
+    for case in results["cases"].values():
+        label = f"{case['algorithm']} (d={case['density']:g})"
+        curves.setdefault(label, []).append((case["size"] ** 2, case["wall_ms"]))
+
+    plt.figure(figsize=(7, 5))
+    for label, points in sorted(curves.items()):
+        points.sort()
+        plt.loglog([p[0] for p in points], [p[1] for p in points], marker="o", label=label)
+    plt.xlabel("Cells")
+    plt.ylabel("Wall time (ms)")
+    plt.title("Search scaling")
+    plt.legend(fontsize=7)
+    plt.tight_layout()
+    plt.savefig(out)
+    plt.close()
+    print(f"Saved: {out}")
+
+
+# =========================================================
+# MAIN
+# =========================================================
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _dump(results: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    print(f"Saved: {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search benchmark suite with regression baselines")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run the suite")
+    run_p.add_argument("--sizes", nargs="+", type=int, default=[32, 64, 128])
+    run_p.add_argument("--densities", nargs="+", type=float, default=[0.1, 0.25])
+    run_p.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    run_p.add_argument("--repeat", type=int, default=3)
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--out", help="write results JSON here")
+    run_p.add_argument("--save-baseline", nargs="?", const=BASELINE, metavar="PATH",
+                       help=f"also store the results as baseline (default {BASELINE})")
+
+    cmp_p = sub.add_parser("compare", help="flag regressions against a baseline")
+    cmp_p.add_argument("baseline", nargs="?", default=BASELINE)
+    cmp_p.add_argument("current", nargs="?", help="results JSON (default: re-run the baseline config)")
+    cmp_p.add_argument("--threshold", type=float, default=0.2, help="allowed relative growth (default 0.2)")
+
+    plot_p = sub.add_parser("plot", help="scaling curves from a results JSON")
+    plot_p.add_argument("results")
+    plot_p.add_argument("--out", default="search_scaling.png")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        config = {k: getattr(args, k) for k in ("sizes", "densities", "algorithms", "repeat", "seed")}
+        results = run_suite(config)
+        if args.out:
+            _dump(results, args.out)
+        if args.save_baseline:
+            _dump(results, args.save_baseline)
+
+    elif args.command == "compare":
+        if not os.path.exists(args.baseline):
+            # Baselines are machine-specific, so none is committed: nothing to compare yet
+            print(f"No baseline at {args.baseline}; run `run --save-baseline` first.")
+            return
+        baseline = _load(args.baseline)
+        current = _load(args.current) if args.current else run_suite(baseline["meta"]["config"])
+        print()
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for label in regressions:
+                print(f"  {label}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+
+    else:
+        plot(_load(args.results), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import sys
+
+# Allow running via: `python demos/<file>.py`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from aima.landmarks import Landmarks
+from aima.search import Graph, GraphProblem, astar_search, romania_map, uniform_cost_search
+
+
+def main():
+    print("=== A* with Landmark (ALT) Heuristic Demo (Romania Map) ===")
+    # Same roads, no coordinates: GraphProblem.h has nothing to work with
+    roads = Graph({a: dict(links) for a, links in romania_map.graph_dict.items()})
+    landmarks = Landmarks.from_graph(roads, k=4, method="avoid")
+    print("Landmarks:", landmarks.landmarks)
+
+    problem = GraphProblem("Arad", "Bucharest", roads)
+    for name, node in [
+        ("Uniform Cost Search (UCS)", uniform_cost_search(problem)),
+        ("A* Search (ALT heuristic)", astar_search(problem, h=landmarks.node_heuristic("Bucharest"))),
+    ]:
+        print(f"\n{name}")
+        if node is None:
+            print("No solution found.")
+            continue
+        print("Path:", [n.state for n in node.path()])
+        print("Cost:", node.path_cost)
+        print("Expanded nodes:", node.metrics.get("expanded_nodes"))
+
+
+if __name__ == "__main__":
+    main()
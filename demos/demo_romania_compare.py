@@ -7,6 +7,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from aima.search import (
     GraphProblem,
     astar_search,
+    bidirectional_astar_search,
     greedy_best_first_graph_search,
     uniform_cost_search,
     romania_map,
@@ -23,6 +24,9 @@ def _print_result(name: str, node):
         print("Expanded nodes:", metrics.get("expanded_nodes"))
         print("Frontier max:", metrics.get("frontier_max"))
         print("Explored set size:", metrics.get("explored"))
+        for side in ("forward", "backward"):
+            if side in metrics:
+                print(f"  {side}:", metrics[side])
 
 
 def run_demo():
@@ -32,10 +36,12 @@ def run_demo():
     node_greedy = greedy_best_first_graph_search(problem)
     node_ucs = uniform_cost_search(problem)
     node_astar = astar_search(problem)
+    node_bidirectional = bidirectional_astar_search(problem)
 
     _print_result("Greedy Best-First Search", node_greedy)
     _print_result("Uniform Cost Search (UCS)", node_ucs)
     _print_result("A* Search", node_astar)
+    _print_result("Bidirectional A* Search (MM)", node_bidirectional)
 
 
 if __name__ == "__main__":
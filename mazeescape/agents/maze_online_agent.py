@@ -11,19 +11,36 @@ mazeescape.algorithms.online_astar.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..environments.maze_grid_world import Coordinate, MazeWorld
 from ..algorithms.online_astar import online_astar
+from ..events.event_sinks import EventSink
 
 
 @dataclass
 class MazeEscapeOnlineAgent:
-    """Agent that navigates a partially known maze using Repeated A*."""
+    """Agent that navigates a partially known maze using Repeated A*.
+
+    `planner` selects the replanning algorithm (see online_astar.PLANNERS),
+    e.g. "dstar_lite" for incremental D* Lite, and `planner_options` is
+    passed to it, e.g. {"expansion_budget": 50, "time_budget_ms": 1.0}
+    for real-time "rtaa" with a hard per-move budget. `events` receives
+    the run's log events (silent by default, ConsoleSink() to print).
+    """
 
     true_world: MazeWorld
     heuristic: Callable[[Coordinate, Coordinate], float]
+    planner: str = "astar"
+    planner_options: Dict[str, Any] = field(default_factory=dict)
+    events: Optional[EventSink] = None
 
     def run(self) -> Tuple[List[Coordinate], int, Dict[str, float]]:
-        return online_astar(self.true_world, heuristic=self.heuristic)
+        return online_astar(
+            self.true_world,
+            heuristic=self.heuristic,
+            planner=self.planner,
+            planner_options=self.planner_options,
+            events=self.events,
+        )
@@ -0,0 +1,85 @@
+"""
+mazeescape/algorithms/adaptive_astar.py
+
+Adaptive A* (Koenig & Likhachev, 2005) planner for the online agent.
+
+Each replan is an ordinary A* search (grid engine, belief map, unknown
+cells free). After a successful search every expanded state s gets
+
+    h(s) := g(goal) - g(s)
+
+which is still admissible and consistent (sensed walls only ever raise
+edge costs), and at least as large as the previous h(s). The learned
+values are kept for the whole run, so later searches are better informed
+and expand fewer states.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional
+
+from mazeescape.algorithms.grid_astar import grid_astar_search, index_heuristic
+from mazeescape.environments.maze_grid_world import Coordinate
+
+
+class AdaptiveAStarPlanner:
+    """Repeated A* that learns tighter heuristic values from its own searches."""
+
+    label = "Adaptive A*"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+    ) -> None:
+        self.world = world
+        self.goal = goal
+        self.adjacency = world.adjacency or world.compile_adjacency()
+        self.width = self.adjacency.width
+        self.static_h = index_heuristic(heuristic, self.width, goal)
+
+        self.learned: Dict[int, float] = {}  # cell index -> learned h
+        self.expansions = 0
+        self.replan_expansions: List[int] = []
+
+    def h(self, i: int) -> float:
+        static = self.static_h(i)
+        learned = self.learned.get(i)
+        return learned if learned is not None and learned > static else static
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        w = self.width
+        goal = self.goal[1] * w + self.goal[0]
+        search = grid_astar_search(self.adjacency, current[1] * w + current[0], goal, self.h)
+
+        self.expansions += search.expansions
+        self.replan_expansions.append(search.expansions)
+        if not search.found:
+            return None
+
+        g, g_goal, learned = search.g, search.g[goal], self.learned
+        for i in search.expanded:
+            value = g_goal - g[i]
+            if value > learned.get(i, 0.0):
+                learned[i] = value
+        return search.path()
+
+    def wall_added(self, cell: Coordinate) -> None:
+        pass  # the belief world patches the shared adjacency itself
+
+    # ---------------- LEARNED TABLE ----------------
+
+    @property
+    def learned_h(self) -> Dict[Coordinate, float]:
+        """Learned h-values keyed by cell."""
+        w = self.width
+        return {(i % w, i // w): v for i, v in self.learned.items()}
+
+    def summary(self) -> Dict[str, float]:
+        """How much learning raised h over the static heuristic."""
+        gains = [v - self.static_h(i) for i, v in self.learned.items()]
+        return {
+            "learned_states": float(len(self.learned)),
+            "learned_h_gain": float(sum(gains) / len(gains)) if gains else 0.0,
+        }
@@ -0,0 +1,158 @@
+"""
+mazeescape/algorithms/dstar_lite.py
+
+D* Lite (Koenig & Likhachev, 2002) incremental replanner for the online agent.
+
+The search runs BACKWARD from the goal over the agent's belief map
+(unknown cells count as free), so g/rhs values stay valid while the agent
+moves. When new walls are sensed only the vertices whose edge costs
+changed are updated, and `compute_shortest_path` repairs just the part of
+the search tree they affect instead of searching from scratch.
+
+The planner exposes the same small interface as the Repeated A* planner
+in online_astar (`plan`, `wall_added`, `expansions`).
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mazeescape.environments.maze_grid_world import DIRECTIONS4, Coordinate
+
+INF = float("inf")
+Key = Tuple[float, float]
+
+
+class DStarLitePlanner:
+    """Incremental D* Lite planner over a `_BeliefWorld`-style map.
+
+    `world` must provide `is_free(x, y)` and `neighbors4(state)`; a compiled
+    `adjacency` is used for neighbor lookups when present.
+    """
+
+    label = "D* Lite"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+    ) -> None:
+        self.world = world
+        self.goal = goal
+        self.heuristic = heuristic
+
+        self.g: Dict[Coordinate, float] = {}
+        self.rhs: Dict[Coordinate, float] = {goal: 0.0}
+        self.km = 0.0
+        self.last: Optional[Coordinate] = None
+        self.start: Optional[Coordinate] = None
+
+        self._open: Dict[Coordinate, Key] = {}  # state -> current key
+        self._heap: List[Tuple[Key, Coordinate]] = []
+
+        self.expansions = 0
+
+    # ---------------- PRIORITY QUEUE (lazy deletion) ----------------
+
+    def _push(self, s: Coordinate, key: Key) -> None:
+        self._open[s] = key
+        heapq.heappush(self._heap, (key, s))
+
+    def _top(self) -> Tuple[Key, Optional[Coordinate]]:
+        heap, open_ = self._heap, self._open
+        while heap:
+            key, s = heap[0]
+            if open_.get(s) == key:
+                return key, s
+            heapq.heappop(heap)  # stale entry
+        return (INF, INF), None
+
+    # ---------------- D* LITE CORE ----------------
+
+    def _neighbors(self, s: Coordinate) -> List[Coordinate]:
+        adjacency = getattr(self.world, "adjacency", None)
+        if adjacency is not None:
+            return adjacency.neighbors(s)
+        return self.world.neighbors4(s)
+
+    def _key(self, s: Coordinate) -> Key:
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self.heuristic(self.start, s) + self.km, m)
+
+    def _update_vertex(self, u: Coordinate) -> None:
+        if u != self.goal:
+            g = self.g
+            best = INF
+            if self.world.is_free(*u):
+                for s in self._neighbors(u):
+                    c = 1.0 + g.get(s, INF)
+                    if c < best:
+                        best = c
+            self.rhs[u] = best
+        self._open.pop(u, None)
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self._push(u, self._key(u))
+
+    def compute_shortest_path(self) -> None:
+        g, rhs, start = self.g, self.rhs, self.start
+        while True:
+            k_old, u = self._top()
+            if u is None:
+                return
+            if not (k_old < self._key(start) or rhs.get(start, INF) != g.get(start, INF)):
+                return
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u, k_new)
+                continue
+            heapq.heappop(self._heap)
+            del self._open[u]
+            self.expansions += 1
+            if g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+                for s in self._neighbors(u):
+                    self._update_vertex(s)
+            else:
+                g[u] = INF
+                self._update_vertex(u)
+                for s in self._neighbors(u):
+                    self._update_vertex(s)
+
+    # ---------------- PLANNER INTERFACE ----------------
+
+    def wall_added(self, cell: Coordinate) -> None:
+        """Edge costs around `cell` became infinite: update the affected vertices.
+
+        Call after the wall has been recorded in the belief world.
+        """
+        x, y = cell
+        self._update_vertex(cell)
+        for dx, dy in DIRECTIONS4:
+            nx, ny = x + dx, y + dy
+            if self.world.is_free(nx, ny):
+                self._update_vertex((nx, ny))
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        """Repair the search tree and return the greedy path current -> goal."""
+        if self.start is None:
+            self.start = self.last = current
+            self._push(self.goal, self._key(self.goal))
+        else:
+            self.km += self.heuristic(self.last, current)
+            self.start = self.last = current
+
+        self.compute_shortest_path()
+
+        g = self.g
+        if g.get(current, INF) == INF:
+            return None
+
+        path = [current]
+        s = current
+        limit = len(g) + 1  # g strictly decreases along the greedy path
+        while s != self.goal and len(path) <= limit:
+            s = min(self._neighbors(s), key=lambda n: 1.0 + g.get(n, INF))
+            path.append(s)
+        return path
@@ -0,0 +1,228 @@
+"""
+mazeescape/algorithms/grid_astar.py
+
+Specialized A* engine for 4-connected maze grids.
+
+Unlike offline_astar, this does not go through the generic AIMA
+Problem/Node stack:
+  - states are flat cell indices (i = y * width + x)
+  - neighbors come straight from the world's CSR GridAdjacency
+  - g-values and parent pointers live in int32 arrays
+  - the closed list is a bitset (one bit per cell)
+  - the heuristic is evaluated on indices (Manhattan is inlined)
+
+`grid_astar` returns the same (path, metrics) contract as offline_astar.
+`grid_astar_search` is the reusable core (also used by the online planners).
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mazeescape.environments.grid_adjacency import GridAdjacency
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.heuristics.heuristics import manhattan_distance
+
+UNREACHED = 2**31 - 1  # g-value of cells not generated yet
+
+
+class _SparseArray(dict):
+    """Dict standing in for a dense array: missing keys read as `default`.
+
+    Used for bounded lookaheads, which touch only a few cells, so their cost
+    does not include allocating O(width * height) arrays.
+    """
+
+    def __init__(self, default: int) -> None:
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key: int) -> int:
+        return self.default
+
+
+@dataclass
+class GridSearch:
+    """Search state left behind by `grid_astar_search`."""
+
+    width: int
+    start: int
+    goal: int
+    found: bool
+    g: array                      # int32 g-values (UNREACHED if not generated)
+    parent: array                 # int32 parent index (-1 for the start)
+    closed: bytearray             # bitset of expanded cells
+    # (with sparse=True the three fields are _SparseArray dicts instead)
+    expanded: List[int] = field(default_factory=list)  # expansion order
+    frontier: List[Tuple[float, float, int]] = field(default_factory=list)  # remaining heap
+    frontier_max: int = 0         # most open cells at once (stale heap entries not counted)
+
+    @property
+    def expansions(self) -> int:
+        return len(self.expanded)
+
+    def is_closed(self, i: int) -> bool:
+        return bool(self.closed[i >> 3] >> (i & 7) & 1)
+
+    def path_indices(self, to: Optional[int] = None) -> List[int]:
+        """Cell indices from the start to `to` (default: the goal)."""
+        i = self.goal if to is None else to
+        parent, path = self.parent, []
+        while i != -1:
+            path.append(i)
+            i = parent[i]
+        path.reverse()
+        return path
+
+    def path(self, to: Optional[int] = None) -> List[Coordinate]:
+        w = self.width
+        return [(i % w, i // w) for i in self.path_indices(to)]
+
+
+def index_heuristic(
+    heuristic: Callable[[Coordinate, Coordinate], float],
+    width: int,
+    goal: Coordinate,
+) -> Callable[[int], float]:
+    """Adapt a coordinate heuristic h(a, goal) to cell indices."""
+    gx, gy = goal
+    if heuristic is manhattan_distance:
+
+        def h(i: int) -> float:
+            y, x = divmod(i, width)
+            return abs(x - gx) + abs(y - gy)
+
+        return h
+
+    def h(i: int) -> float:
+        y, x = divmod(i, width)
+        return heuristic((x, y), goal)
+
+    return h
+
+
+def grid_astar_search(
+    adjacency: GridAdjacency,
+    start: int,
+    goal: int,
+    h: Callable[[int], float],
+    *,
+    max_expansions: Optional[int] = None,
+    deadline: Optional[float] = None,
+    sparse: bool = False,
+) -> GridSearch:
+    """A* over cell indices with unit step costs.
+
+    Ties on f are broken towards smaller h (deeper nodes). With
+    `max_expansions` and/or `deadline` (a time.perf_counter() value) the
+    search stops early (found=False) and leaves its open list in
+    `frontier`, whose first entry is then the best open cell; this is what
+    bounded-lookahead agents need. The deadline is checked before every
+    expansion but the first (an agent always gets one step), so it is
+    overrun by at most one expansion. `sparse=True` keeps g, parents and
+    the closed bitset in dicts, so a short lookahead costs O(expansions)
+    rather than O(cells).
+    """
+
+    n = adjacency.width * adjacency.height
+    if sparse:
+        g, parent, closed = _SparseArray(UNREACHED), _SparseArray(-1), _SparseArray(0)
+    else:
+        g = array("i", [UNREACHED]) * n
+        parent = array("i", [-1]) * n
+        closed = bytearray((n + 7) >> 3)
+    expanded: List[int] = []
+
+    off, end, tgt = adjacency._off, adjacency._end, adjacency._tgt
+    push, pop = heapq.heappush, heapq.heappop
+
+    g[start] = 0
+    h0 = h(start)
+    heap: List[Tuple[float, float, int]] = [(h0, h0, start)]
+    open_cells = frontier_max = 1  # live cells only; stale heap entries don't count
+    budget = n + 1 if max_expansions is None else max_expansions
+    found = False
+
+    while heap:
+        entry = heap[0]
+        i = entry[2]
+        byte, bit = i >> 3, 1 << (i & 7)
+        if closed[byte] & bit:
+            pop(heap)
+            continue  # stale duplicate
+        if i == goal:
+            found = True
+            break
+        if len(expanded) >= budget:
+            break
+        if deadline is not None and expanded and time.perf_counter() >= deadline:
+            break
+        pop(heap)
+        closed[byte] |= bit
+        expanded.append(i)
+        open_cells -= 1
+
+        gi = g[i] + 1
+        for k in range(off[i], end[i]):
+            t = tgt[k]
+            gt = g[t]
+            if gi < gt and not closed[t >> 3] & (1 << (t & 7)):
+                if gt == UNREACHED:
+                    open_cells += 1
+                g[t] = gi
+                parent[t] = i
+                ht = h(t)
+                push(heap, (gi + ht, ht, t))
+        if open_cells > frontier_max:
+            frontier_max = open_cells
+
+    return GridSearch(
+        width=adjacency.width,
+        start=start,
+        goal=goal,
+        found=found,
+        g=g,
+        parent=parent,
+        closed=closed,
+        expanded=expanded,
+        frontier=heap,
+        frontier_max=frontier_max,
+    )
+
+
+def grid_astar(
+    world: MazeWorld,
+    heuristic: Callable[[Coordinate, Coordinate], float],
+) -> Tuple[List[Coordinate], Dict[str, float]]:
+    """Drop-in replacement for offline_astar using the integer-state engine.
+
+    Metrics returned:
+      - node_expansions
+      - path_cost
+      - path_length
+      - frontier_max
+    """
+
+    if world.start is None or world.goal is None:
+        raise ValueError("MazeWorld must define start (S) and goal (G).")
+
+    adjacency = world.adjacency or world.compile_adjacency()
+    w = world.width
+    sx, sy = world.start
+    gx, gy = world.goal
+
+    search = grid_astar_search(adjacency, sy * w + sx, gy * w + gx, index_heuristic(heuristic, w, world.goal))
+    if not search.found:
+        raise RuntimeError("Grid A*: no solution found.")
+
+    path = search.path()
+    return path, {
+        "node_expansions": float(search.expansions),
+        "path_cost": float(search.g[search.goal]),
+        "path_length": float(len(path)),
+        "frontier_max": float(search.frontier_max),
+    }
@@ -0,0 +1,545 @@
+"""
+mazeescape/algorithms/hierarchical_astar.py
+
+Hierarchical path-finding A* (HPA*, Botea, Mueller & Schaeffer, 2004).
+
+The grid is cut into square clusters (cluster_size x cluster_size cells).
+Preprocessing (ClusterMap) builds a small abstract graph:
+
+  entrances   along every border between two neighboring clusters, each
+              maximal run of cell pairs that are free on both sides is an
+              entrance; runs shorter than 6 get one transition in the
+              middle, longer ones one at each end. The two cells of a
+              transition are abstract nodes joined by an edge of cost 1.
+  intra edges inside each cluster, the exact distance between every pair
+              of its nodes (BFS restricted to the cluster; plain Manhattan
+              for clusters without walls).
+
+A query links start and goal into their clusters with two more local
+searches, runs A* on the abstract graph and refines the abstract path into
+cells segment by segment, on demand (`ClusterMap.refine` is a generator);
+refined segments are cached per cluster. Paths are near-optimal: they
+only cross borders at transitions and may miss shortcuts between them.
+
+The map can be edited: `block(cell)` marks the cluster(s) it touches
+dirty, and the next query rebuilds only those clusters' entrances and
+intra edges. The online agent uses this through HierarchicalPlanner
+(planner="hpa"), which refines one cluster of the abstract path per plan;
+the offline runner through `hpa_star` (engine "hpa"), which needs the
+whole path and refines all of it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.heuristics.heuristics import manhattan_distance
+
+Cluster = Tuple[int, int]
+Border = Tuple[str, int, int]  # ("v", cx, cy): (cx, cy) | (cx + 1, cy); ("h", cx, cy): (cx, cy) / (cx, cy + 1)
+
+MIN_DOUBLE_ENTRANCE = 6  # runs at least this long get two transitions
+
+
+@dataclass
+class HierarchicalSearch:
+    """Result of `ClusterMap.search` (abstract path over cell indices)."""
+
+    start: int
+    goal: int
+    found: bool
+    cost: float = 0.0
+    abstract_path: List[int] = field(default_factory=list)
+    abstract_expansions: int = 0
+    local_expansions: int = 0  # cells visited linking start / goal into their clusters
+    frontier_max: int = 0
+
+    @property
+    def expansions(self) -> int:
+        return self.abstract_expansions + self.local_expansions
+
+
+def _runs(both: np.ndarray) -> List[Tuple[int, int]]:
+    """Maximal runs [a, b] (inclusive) of True in a 1-D bool array."""
+    edges = np.diff(np.concatenate(([False], both, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+class ClusterMap:
+    """Abstract graph of a 4-connected grid (True = passable) for HPA*."""
+
+    def __init__(self, passable: np.ndarray, cluster_size: int = 16) -> None:
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        self.passable = np.array(passable, dtype=bool)
+        self.height, self.width = self.passable.shape
+        self.size = cluster_size
+        self.ncx = -(-self.width // cluster_size)
+        self.ncy = -(-self.height // cluster_size)
+
+        self.borders: Dict[Border, List[Tuple[int, int]]] = {}
+        self.inter: Dict[int, Set[int]] = {}                            # node -> nodes across a border
+        self.intra: Dict[Cluster, Dict[int, List[Tuple[int, int]]]] = {}  # node -> [(node, cost)]
+        self.segments: Dict[Cluster, Dict[Tuple[int, int], List[int]]] = {}
+        self.dirty_borders: Set[Border] = set()
+        self.dirty_clusters: Set[Cluster] = set()
+        self.clusters_rebuilt = 0
+
+        t0 = time.perf_counter()
+        for cy in range(self.ncy):
+            for cx in range(self.ncx):
+                if cx + 1 < self.ncx:
+                    self._build_border(("v", cx, cy))
+                if cy + 1 < self.ncy:
+                    self._build_border(("h", cx, cy))
+        for cy in range(self.ncy):
+            for cx in range(self.ncx):
+                self._build_cluster((cx, cy))
+        self.build_ms = (time.perf_counter() - t0) * 1000.0
+
+    @classmethod
+    def from_world(cls, world: MazeWorld, cluster_size: int = 16) -> "ClusterMap":
+        return cls(~world.walls, cluster_size)
+
+    # ---------------- GEOMETRY ----------------
+
+    def cluster_of(self, i: int) -> Cluster:
+        y, x = divmod(i, self.width)
+        return x // self.size, y // self.size
+
+    def _bounds(self, cluster: Cluster) -> Tuple[int, int, int, int]:
+        x0, y0 = cluster[0] * self.size, cluster[1] * self.size
+        return x0, y0, min(x0 + self.size, self.width), min(y0 + self.size, self.height)
+
+    def _local(self, cluster: Cluster) -> Tuple[bytearray, int, int, int, bool]:
+        """Padded passability buffer of one cluster: (buf, stride, x0, y0, open)."""
+        x0, y0, x1, y1 = self._bounds(cluster)
+        block = self.passable[y0:y1, x0:x1]
+        return bytearray(np.pad(block, 1).tobytes()), x1 - x0 + 2, x0, y0, bool(block.all())
+
+    @property
+    def node_count(self) -> int:
+        return sum(len(nodes) for nodes in self.intra.values())
+
+    @property
+    def edge_count(self) -> int:
+        pairs = sum(len(edges) for nodes in self.intra.values() for edges in nodes.values())
+        return pairs // 2 + sum(len(v) for v in self.inter.values()) // 2
+
+    # ---------------- PREPROCESSING ----------------
+
+    def _build_border(self, border: Border) -> None:
+        """Recompute the transitions of one border (and their inter edges)."""
+        for a, b in self.borders.pop(border, ()):
+            self.inter[a].discard(b)
+            self.inter[b].discard(a)
+
+        kind, cx, cy = border
+        w = self.width
+        x0, y0, x1, y1 = self._bounds((cx, cy))
+        if kind == "v":  # column x1 - 1 | x1, rows y0..y1
+            both = self.passable[y0:y1, x1 - 1] & self.passable[y0:y1, x1]
+            pair = lambda k: ((y0 + k) * w + x1 - 1, (y0 + k) * w + x1)  # noqa: E731
+        else:            # row y1 - 1 / y1, columns x0..x1
+            both = self.passable[y1 - 1, x0:x1] & self.passable[y1, x0:x1]
+            pair = lambda k: ((y1 - 1) * w + x0 + k, y1 * w + x0 + k)  # noqa: E731
+
+        transitions = []
+        for a, b in _runs(both):
+            if b - a + 1 < MIN_DOUBLE_ENTRANCE:
+                transitions.append(pair((a + b) // 2))
+            else:
+                transitions.extend((pair(a), pair(b)))
+        inter = self.inter
+        for a, b in transitions:
+            inter.setdefault(a, set()).add(b)
+            inter.setdefault(b, set()).add(a)
+        self.borders[border] = transitions
+
+    def _cluster_nodes(self, cluster: Cluster) -> Set[int]:
+        cx, cy = cluster
+        nodes: Set[int] = set()
+        for border, side in (
+            (("v", cx - 1, cy), 1),
+            (("v", cx, cy), 0),
+            (("h", cx, cy - 1), 1),
+            (("h", cx, cy), 0),
+        ):
+            nodes.update(t[side] for t in self.borders.get(border, ()))
+        return nodes
+
+    def _build_cluster(self, cluster: Cluster) -> None:
+        """Intra edges between the nodes of one cluster."""
+        nodes = sorted(self._cluster_nodes(cluster))
+        edges: Dict[int, List[Tuple[int, int]]] = {n: [] for n in nodes}
+        self.segments.pop(cluster, None)
+        if len(nodes) > 1:
+            local = self._local(cluster)
+            for k, a in enumerate(nodes[:-1]):
+                rest = nodes[k + 1:]
+                for b, d in self._distances(local, a, rest)[0].items():
+                    edges[a].append((b, d))
+                    edges[b].append((a, d))
+        self.intra[cluster] = edges
+
+    # ---------------- LOCAL SEARCH ----------------
+
+    def _distances(
+        self,
+        local: Tuple[bytearray, int, int, int, bool],
+        source: int,
+        targets: List[int],
+    ) -> Tuple[Dict[int, int], int]:
+        """({target: distance} within the cluster, cells visited)."""
+        buf, ls, x0, y0, is_open = local
+        w = self.width
+        sy, sx = divmod(source, w)
+        if is_open:
+            out = {}
+            for t in targets:
+                ty, tx = divmod(t, w)
+                out[t] = abs(tx - sx) + abs(ty - sy)
+            return out, 0
+
+        def to_local(i: int) -> int:
+            y, x = divmod(i, w)
+            return (y - y0 + 1) * ls + x - x0 + 1
+
+        wanted = {to_local(t): t for t in targets}
+        out: Dict[int, int] = {}
+        start = to_local(source)
+        if start in wanted:
+            out[wanted.pop(start)] = 0
+        seen = bytearray(len(buf))
+        seen[start] = 1
+        layer, depth, visited = [start], 0, 1
+        while layer and wanted:
+            depth += 1
+            nxt = []
+            for p in layer:
+                for q in (p - ls, p + ls, p - 1, p + 1):
+                    if buf[q] and not seen[q]:
+                        seen[q] = 1
+                        nxt.append(q)
+                        if q in wanted:
+                            out[wanted.pop(q)] = depth
+            visited += len(nxt)
+            layer = nxt
+        return out, visited
+
+    def _segment(self, a: int, b: int) -> Optional[List[int]]:
+        """Cells after `a` up to `b` along a shortest path inside their cluster.
+
+        None if walls added by block() since the last refresh() cut them apart.
+        """
+        cluster = self.cluster_of(a)
+        cache = self.segments.setdefault(cluster, {})
+        cells = cache.get((a, b))
+        if cells is not None:
+            return cells
+
+        buf, ls, x0, y0, is_open = self._local(cluster)
+        w = self.width
+        (ay, ax), (by, bx) = divmod(a, w), divmod(b, w)
+        if is_open:
+            # Any monotone path stays inside a wall-free rectangle
+            step = 1 if bx > ax else -1
+            cells = [ay * w + x for x in range(ax + step, bx + step, step)] if ax != bx else []
+            step = 1 if by > ay else -1
+            cells += [y * w + bx for y in range(ay + step, by + step, step)] if ay != by else []
+        else:
+            start = (ay - y0 + 1) * ls + ax - x0 + 1
+            goal = (by - y0 + 1) * ls + bx - x0 + 1
+            parent = {start: -1}
+            layer = [start]
+            while layer and goal not in parent:
+                nxt = []
+                for p in layer:
+                    for q in (p - ls, p + ls, p - 1, p + 1):
+                        if buf[q] and q not in parent:
+                            parent[q] = p
+                            nxt.append(q)
+                layer = nxt
+            if goal not in parent:
+                return None
+            cells = []
+            p = goal
+            while p != start:
+                y, x = divmod(p, ls)
+                cells.append((y0 + y - 1) * w + x0 + x - 1)
+                p = parent[p]
+            cells.reverse()
+        if a in self.inter and b in self.inter:
+            cache[(a, b)] = cells  # node-to-node segments are reused across queries
+        return cells
+
+    # ---------------- EDITS ----------------
+
+    def block(self, cell: Coordinate) -> None:
+        """Mark a cell as a wall; affected clusters are rebuilt by refresh()."""
+        x, y = cell
+        if not self.passable[y, x]:
+            return
+        self.passable[y, x] = False
+        s = self.size
+        cx, cy = x // s, y // s
+        self.dirty_clusters.add((cx, cy))
+        for near, border, on_edge in (
+            ((cx - 1, cy), ("v", cx - 1, cy), x % s == 0 and cx > 0),
+            ((cx + 1, cy), ("v", cx, cy), x % s == s - 1 and cx + 1 < self.ncx),
+            ((cx, cy - 1), ("h", cx, cy - 1), y % s == 0 and cy > 0),
+            ((cx, cy + 1), ("h", cx, cy), y % s == s - 1 and cy + 1 < self.ncy),
+        ):
+            if on_edge:
+                self.dirty_borders.add(border)
+                self.dirty_clusters.add(near)
+
+    def refresh(self) -> None:
+        """Rebuild the borders and clusters invalidated by block()."""
+        for border in self.dirty_borders:
+            self._build_border(border)
+        for cluster in self.dirty_clusters:
+            self._build_cluster(cluster)
+        self.clusters_rebuilt += len(self.dirty_clusters)
+        self.dirty_borders.clear()
+        self.dirty_clusters.clear()
+
+    # ---------------- QUERIES ----------------
+
+    def search(
+        self,
+        start: Coordinate,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float] = manhattan_distance,
+    ) -> HierarchicalSearch:
+        """A* on the abstract graph with start and goal linked in."""
+        if self.dirty_clusters:
+            self.refresh()
+        w = self.width
+        s, g = start[1] * w + start[0], goal[1] * w + goal[0]
+        result = HierarchicalSearch(start=s, goal=g, found=False)
+        if not (self.passable[start[1], start[0]] and self.passable[goal[1], goal[0]]):
+            return result
+
+        cs, cg = self.cluster_of(s), self.cluster_of(g)
+        local_s = self._local(cs)
+        local_g = local_s if cg == cs else self._local(cg)
+        s_nodes = list(self.intra[cs])
+        if cs == cg:
+            s_nodes.append(g)
+        start_edges, visited_s = self._distances(local_s, s, s_nodes)
+        goal_edges, visited_g = self._distances(local_g, g, list(self.intra[cg]))
+        result.local_expansions = visited_s + visited_g
+
+        intra, inter, cluster_of = self.intra, self.inter, self.cluster_of
+        gx, gy = goal
+
+        def h(i: int) -> float:
+            y, x = divmod(i, w)
+            if heuristic is manhattan_distance:
+                return abs(x - gx) + abs(y - gy)
+            return heuristic((x, y), goal)
+
+        def successors(n: int):
+            if n == s:
+                yield from start_edges.items()
+            if inter.get(n):
+                yield from intra[cluster_of(n)].get(n, ())
+                for m in inter[n]:
+                    yield m, 1
+            d = goal_edges.get(n)
+            if d is not None:
+                yield g, d
+
+        cost: Dict[int, float] = {s: 0}
+        parent: Dict[int, int] = {s: -1}
+        closed: Set[int] = set()
+        heap = [(h(s), h(s), s)]
+        frontier_max = 1
+        while heap:
+            if len(heap) > frontier_max:
+                frontier_max = len(heap)
+            _, _, n = heapq.heappop(heap)
+            if n in closed:
+                continue
+            if n == g:
+                result.found = True
+                break
+            closed.add(n)
+            result.abstract_expansions += 1
+            cn = cost[n]
+            for m, d in successors(n):
+                cm = cn + d
+                if m not in closed and cm < cost.get(m, cm + 1):
+                    cost[m] = cm
+                    parent[m] = n
+                    hm = h(m)
+                    heapq.heappush(heap, (cm + hm, hm, m))
+
+        result.frontier_max = frontier_max
+        if result.found:
+            result.cost = cost[g]
+            n, path = g, []
+            while n != -1:
+                path.append(n)
+                n = parent[n]
+            path.reverse()
+            result.abstract_path = path
+        return result
+
+    def edge_cells(self, a: int, b: int) -> Optional[List[int]]:
+        """Cells after `a` up to `b` for one edge of an abstract path (None: see _segment)."""
+        if self.cluster_of(a) == self.cluster_of(b):
+            return self._segment(a, b)
+        return [b]  # transition across a border
+
+    def refine(self, search: HierarchicalSearch) -> Iterator[Coordinate]:
+        """Cells of the path, refined one abstract edge at a time as consumed."""
+        w = self.width
+        path = search.abstract_path
+        if not path:
+            return
+        yield path[0] % w, path[0] // w
+        for a, b in zip(path, path[1:]):
+            for i in self.edge_cells(a, b):
+                yield i % w, i // w
+
+
+def hpa_star(
+    world: MazeWorld,
+    heuristic: Callable[[Coordinate, Coordinate], float],
+    *,
+    cluster_size: int = 16,
+    cluster_map: Optional[ClusterMap] = None,
+) -> Tuple[List[Coordinate], Dict[str, float]]:
+    """offline_astar's contract on top of HPA*.
+
+    Pass a prebuilt `cluster_map` to reuse the preprocessing across queries
+    on the same maze. node_expansions counts abstract expansions plus the
+    cells visited linking start and goal into the abstract graph.
+
+    Metrics returned:
+      - node_expansions
+      - path_cost
+      - path_length
+      - frontier_max
+      - abstract_nodes
+      - build_ms (0 when cluster_map was given)
+    """
+
+    if world.start is None or world.goal is None:
+        raise ValueError("MazeWorld must define start (S) and goal (G).")
+    built = cluster_map is None
+    if cluster_map is None:
+        cluster_map = ClusterMap.from_world(world, cluster_size)
+
+    search = cluster_map.search(world.start, world.goal, heuristic)
+    if not search.found:
+        raise RuntimeError("HPA*: no solution found.")
+
+    path = list(cluster_map.refine(search))
+    return path, {
+        "node_expansions": float(search.expansions),
+        "path_cost": float(len(path) - 1),
+        "path_length": float(len(path)),
+        "frontier_max": float(search.frontier_max),
+        "abstract_nodes": float(cluster_map.node_count),
+        "build_ms": cluster_map.build_ms if built else 0.0,
+    }
+
+
+class HierarchicalPlanner:
+    """Repeated HPA* over the belief map; sensed walls rebuild only their clusters.
+
+    The abstract path is refined lazily: plan() returns the cells up to the
+    next border crossing only (a prefix, like the real-time planners), and
+    the next call refines the following cluster of the same abstract path
+    with the walls known by then. A new abstract search runs when the agent
+    is not where the last prefix ended (it was blocked) or the next stretch
+    cannot be refined around the known walls. online_astar counts every
+    call as a replan; `abstract_searches` in the summary counts searches.
+    """
+
+    label = "HPA*"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+        cluster_size: int = 16,
+    ) -> None:
+        true_world = world.true_world
+        passable = np.ones((true_world.height, true_world.width), dtype=bool)
+        for x, y in world.known_walls:
+            passable[y, x] = False
+        self.map = ClusterMap(passable, cluster_size)
+        self.goal = goal
+        self.heuristic = heuristic
+        self.expansions = 0
+        self.frontier_max = 0
+        self.searches = 0
+        self.route: Optional[List[int]] = None  # abstract path still being followed
+        self.leg = 0  # route[leg] is where the last prefix ended
+        self.route_end: Optional[Coordinate] = None
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        fresh = self.route is None or current != self.route_end
+        if fresh:
+            search = self.map.search(current, self.goal, self.heuristic)
+            self.searches += 1
+            self.expansions += search.expansions
+            self.frontier_max = max(self.frontier_max, search.frontier_max)
+            if not search.found:
+                self.route = None
+                return None
+            self.route, self.leg = search.abstract_path, 0
+
+        prefix = self._advance(current)
+        if prefix is None and not fresh:
+            self.route = None  # the rest of the route crosses new walls
+            return self.plan(current)
+        return prefix
+
+    def _advance(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        """Refine the route up to and including its next border crossing."""
+        route, leg = self.route, self.leg
+        cluster_of, passable, w = self.map.cluster_of, self.map.passable, self.map.width
+        cells: List[int] = []
+        while leg < len(route) - 1:
+            a, b = route[leg], route[leg + 1]
+            leg += 1
+            edge = self.map.edge_cells(a, b)
+            if edge is None:
+                return None
+            cells += edge
+            if cluster_of(a) != cluster_of(b):
+                break
+        if not all(passable[i // w, i % w] for i in cells):
+            return None  # cached segment or transition now walled
+        prefix = [current] + [(i % w, i // w) for i in cells]
+        self.leg = leg
+        if leg < len(route) - 1:
+            self.route_end = prefix[-1]
+        else:
+            self.route = None
+        return prefix
+
+    def wall_added(self, cell: Coordinate) -> None:
+        self.map.block(cell)  # the route is checked against it when refined
+
+    def summary(self) -> Dict[str, float]:
+        """Largest frontier, abstract searches run and cluster rebuilds caused by walls."""
+        return {
+            "frontier_max": float(self.frontier_max),
+            "abstract_searches": float(self.searches),
+            "clusters_rebuilt": float(self.map.clusters_rebuilt),
+        }
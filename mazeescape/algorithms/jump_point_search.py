@@ -0,0 +1,267 @@
+"""
+mazeescape/algorithms/jump_point_search.py
+
+Jump Point Search (Harabor & Grastien, 2011), 4-connected variant.
+
+With unit step costs an open area has a huge number of equal-cost paths
+that differ only in the order of their moves, and plain A* expands all of
+them. JPS fixes a canonical order -- horizontal runs first, vertical moves
+only where needed -- and only ever puts "jump points" on the open list:
+
+  horizontal scan  runs until a forced neighbor: (x, y +- 1) is free while
+                   (x - dx, y +- 1) is blocked, i.e. the cell above/below
+                   can only be reached optimally through (x, y)
+  vertical scan    stops at a forced neighbor ((x +- 1, y) free while
+                   (x +- 1, y - dy) is blocked), and at any cell from which
+                   a horizontal scan finds a jump point or the goal
+
+A jump point reached horizontally continues horizontally or turns
+vertically; one reached vertically continues vertically or turns
+horizontally. The start expands all four directions. Costs between jump
+points are their Manhattan distance, so A* over jump points returns an
+optimal path, which is then unrolled into the usual list of cells.
+
+Scans read a padded passability buffer (one blocked cell of border), so
+they need no bounds checks. The same core serves the offline runner
+(`jump_point_search`, same (path, metrics) contract as offline_astar) and
+the online agent (`JumpPointPlanner`, planner="jps").
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.heuristics.heuristics import manhattan_distance
+
+
+@dataclass
+class JumpSearch:
+    """Search state left behind by `jps_search` (padded cell indices)."""
+
+    stride: int
+    start: int
+    goal: int
+    found: bool
+    g: Dict[int, int]
+    parent: Dict[int, int]
+    expanded: List[int] = field(default_factory=list)  # jump points, expansion order
+    frontier_max: int = 0
+
+    @property
+    def expansions(self) -> int:
+        return len(self.expanded)
+
+    def jump_points(self) -> List[int]:
+        i, parent, out = self.goal, self.parent, []
+        while i != -1:
+            out.append(i)
+            i = parent[i]
+        out.reverse()
+        return out
+
+    def path(self) -> List[Coordinate]:
+        """Every cell from the start to the goal (jump segments unrolled)."""
+        s = self.stride
+        points = self.jump_points()
+        cells = [points[0]]
+        for a, b in zip(points, points[1:]):
+            step = (1 if b > a else -1) if a // s == b // s else (s if b > a else -s)
+            cells.extend(range(a + step, b + step, step))
+        return [(i % s - 1, i // s - 1) for i in cells]
+
+
+def padded_heuristic(
+    heuristic: Callable[[Coordinate, Coordinate], float],
+    stride: int,
+    goal: Coordinate,
+) -> Callable[[int], float]:
+    """Adapt a coordinate heuristic h(a, goal) to padded cell indices."""
+    gx, gy = goal[0] + 1, goal[1] + 1
+    if heuristic is manhattan_distance:
+
+        def h(i: int) -> float:
+            y, x = divmod(i, stride)
+            return abs(x - gx) + abs(y - gy)
+
+        return h
+
+    def h(i: int) -> float:
+        y, x = divmod(i, stride)
+        return heuristic((x - 1, y - 1), goal)
+
+    return h
+
+
+def jps_search(
+    free,
+    stride: int,
+    start: int,
+    goal: int,
+    h: Callable[[int], float],
+) -> JumpSearch:
+    """A* over jump points on a padded passability buffer.
+
+    `free[i]` is truthy for passable cells; index i = (y + 1) * stride + x + 1
+    with stride = width + 2, and the one-cell border must be blocked.
+    Ties on f are broken towards smaller h, as in grid_astar_search.
+    """
+    s = stride
+
+    def jump_h(p: int, d: int) -> int:
+        while True:
+            p += d
+            if not free[p]:
+                return -1
+            if p == goal:
+                return p
+            if (free[p - s] and not free[p - d - s]) or (free[p + s] and not free[p - d + s]):
+                return p
+
+    def jump_v(p: int, d: int) -> int:
+        while True:
+            p += d
+            if not free[p]:
+                return -1
+            if p == goal:
+                return p
+            if (free[p - 1] and not free[p - 1 - d]) or (free[p + 1] and not free[p + 1 - d]):
+                return p
+            if jump_h(p, 1) != -1 or jump_h(p, -1) != -1:
+                return p
+
+    g: Dict[int, int] = {start: 0}
+    parent: Dict[int, int] = {start: -1}
+    closed = set()
+    expanded: List[int] = []
+    h0 = h(start)
+    heap: List[Tuple[float, float, int]] = [(h0, h0, start)]
+    frontier_max = 1
+    found = False
+    push, pop = heapq.heappush, heapq.heappop
+
+    while heap:
+        if len(heap) > frontier_max:
+            frontier_max = len(heap)
+        _, _, p = pop(heap)
+        if p in closed:
+            continue  # stale duplicate
+        if p == goal:
+            found = True
+            break
+        closed.add(p)
+        expanded.append(p)
+
+        # Directions allowed by the canonical order (see module docstring)
+        q = parent[p]
+        if q == -1:
+            dirs = (1, -1, s, -s)
+        elif q // s == p // s:
+            d = 1 if p > q else -1
+            dirs = (d, s, -s)
+        else:
+            d = s if p > q else -s
+            dirs = (d, 1, -1)
+
+        gp = g[p]
+        for d in dirs:
+            if d == 1 or d == -1:
+                j = jump_h(p, d)
+                if j == -1:
+                    continue
+                gj = gp + abs(j - p)
+            else:
+                j = jump_v(p, d)
+                if j == -1:
+                    continue
+                gj = gp + abs(j - p) // s
+            if j not in closed and gj < g.get(j, gj + 1):
+                g[j] = gj
+                parent[j] = p
+                hj = h(j)
+                push(heap, (gj + hj, hj, j))
+
+    return JumpSearch(
+        stride=s,
+        start=start,
+        goal=goal,
+        found=found,
+        g=g,
+        parent=parent,
+        expanded=expanded,
+        frontier_max=frontier_max,
+    )
+
+
+def jump_point_search(
+    world: MazeWorld,
+    heuristic: Callable[[Coordinate, Coordinate], float],
+) -> Tuple[List[Coordinate], Dict[str, float]]:
+    """Drop-in replacement for offline_astar using Jump Point Search.
+
+    Metrics returned (node_expansions counts expanded jump points):
+      - node_expansions
+      - path_cost
+      - path_length
+      - frontier_max
+    """
+
+    if world.start is None or world.goal is None:
+        raise ValueError("MazeWorld must define start (S) and goal (G).")
+
+    s = world.width + 2
+    (sx, sy), (gx, gy) = world.start, world.goal
+    goal = (gy + 1) * s + gx + 1
+    search = jps_search(world._free, s, (sy + 1) * s + sx + 1, goal, padded_heuristic(heuristic, s, world.goal))
+    if not search.found:
+        raise RuntimeError("Jump Point Search: no solution found.")
+
+    path = search.path()
+    return path, {
+        "node_expansions": float(search.expansions),
+        "path_cost": float(search.g[goal]),
+        "path_length": float(len(path)),
+        "frontier_max": float(search.frontier_max),
+    }
+
+
+class JumpPointPlanner:
+    """Repeated Jump Point Search over the belief map (unknown cells free)."""
+
+    label = "JPS"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+    ) -> None:
+        true_world = world.true_world
+        self.goal = goal
+        self.stride = true_world.width + 2
+        passable = np.ones((true_world.height, true_world.width), dtype=bool)
+        for x, y in world.known_walls:
+            passable[y, x] = False
+        self.free = bytearray(np.pad(passable, 1).tobytes())
+        self.h = padded_heuristic(heuristic, self.stride, goal)
+        self.expansions = 0
+        self.frontier_max = 0
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        s = self.stride
+        goal = (self.goal[1] + 1) * s + self.goal[0] + 1
+        search = jps_search(self.free, s, (current[1] + 1) * s + current[0] + 1, goal, self.h)
+        self.expansions += search.expansions
+        self.frontier_max = max(self.frontier_max, search.frontier_max)
+        return search.path() if search.found else None
+
+    def wall_added(self, cell: Coordinate) -> None:
+        self.free[(cell[1] + 1) * self.stride + cell[0] + 1] = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Largest frontier seen by any replan."""
+        return {"frontier_max": float(self.frontier_max)}
@@ -8,42 +8,73 @@ Returns a path and performance metrics.
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from aima.search import Node, astar_search
-from environments.maze_grid_world import Coordinate, MazeWorld
-from problems.maze_grid_problem import MazeGridProblem
+from aima.instrumentation import SearchStats
+from aima.search import Node, astar_search, bidirectional_astar_search
+from mazeescape.algorithms.jump_point_search import jump_point_search
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.problems.maze_grid_problem import MazeGridProblem
 
 def offline_astar(
     world: MazeWorld,
     heuristic: Callable[[Coordinate, Coordinate], float],
+    *,
+    jump_points: bool = False,
+    bidirectional: bool = False,
+    stats: Optional[SearchStats] = None,
 ) -> Tuple[List[Coordinate], Dict[str, float]]:
     """Run classical A* assuming the agent knows the full maze.
 
+    jump_points=True searches with Jump Point Search instead (same optimal
+    path cost; node_expansions then counts expanded jump points).
+    bidirectional=True runs bidirectional A* (MM) from both ends and adds
+    forward_expansions / backward_expansions to the metrics.
+    stats: optional aima.instrumentation.SearchStats, filled in by the
+    (plain) A* search even when it finds no path.
+
     Metrics returned:
       - node_expansions
       - path_cost
       - path_length
+      - frontier_max
     """
 
     if world.start is None or world.goal is None:
         raise ValueError("MazeWorld must define start (S) and goal (G).")
+    if stats is not None and (jump_points or bidirectional):
+        raise ValueError("stats is only collected by the plain A* search")
+    if jump_points:
+        return jump_point_search(world, heuristic)
 
     problem = MazeGridProblem(world, world.start, world.goal)
 
     def h(node: Node) -> float:
         return heuristic(node.state, world.goal)  # type: ignore[arg-type]
 
-    goal_node = astar_search(problem, h=h)
+    if bidirectional:
+        start = world.start
+
+        def h_backward(node: Node) -> float:
+            return heuristic(node.state, start)  # type: ignore[arg-type]
+
+        goal_node = bidirectional_astar_search(problem, h=h, h_backward=h_backward)
+    else:
+        goal_node = astar_search(problem, h=h, stats=stats)
     if goal_node is None:
         raise RuntimeError("Offline A*: no solution found.")
 
-    path = [n.state for n in goal_node.path()]
+    path = goal_node.path_states()
     metrics = getattr(goal_node, "metrics", {})
     node_expansions = float(metrics.get("expanded_nodes", 0))
 
-    return path, {
+    result = {
         "node_expansions": node_expansions,
         "path_cost": float(goal_node.path_cost),
         "path_length": float(len(path)),
+        "frontier_max": float(metrics.get("frontier_max", 0)),
     }
+    if bidirectional:
+        result["forward_expansions"] = float(metrics["forward"]["expanded_nodes"])
+        result["backward_expansions"] = float(metrics["backward"]["expanded_nodes"])
+    return path, result
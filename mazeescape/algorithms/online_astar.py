@@ -5,18 +5,34 @@ Online / Repeated A* in a PARTIALLY KNOWN grid world.
 
 This version:
 - Keeps matplotlib FIGURE generation (via callbacks)
-- Prints ASCII GRID snapshots at each step
-- Produces clear ACADEMIC LOG OUTPUT
+- Reports ASCII GRID snapshots at each step (on request)
+- Produces clear ACADEMIC LOG OUTPUT through an event sink
+  (mazeescape.events.event_sinks; quiet by default, ConsoleSink prints it)
 - Explicitly proves ONLINE / REPLANNING behavior
 """
 
 from __future__ import annotations
 
+import math
+import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from aima.search import Node, astar_search
+from aima.utils import HeuristicCache
+from mazeescape.algorithms.adaptive_astar import AdaptiveAStarPlanner
+from mazeescape.algorithms.dstar_lite import DStarLitePlanner
+from mazeescape.algorithms.hierarchical_astar import HierarchicalPlanner
+from mazeescape.algorithms.jump_point_search import JumpPointPlanner
+from mazeescape.algorithms.realtime_astar import RealTimeAStarPlanner
+from mazeescape.environments.grid_adjacency import GridAdjacency
 from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.events import event_sinks as ev
+from mazeescape.events.event_sinks import EventSink, MultiSink, NullSink
+from mazeescape.events.trace_recorder import TraceRecorder
+from mazeescape.heuristics.distance_field import DistanceFieldPlanner
 from mazeescape.problems.maze_grid_problem import MazeGridProblem
 
 
@@ -24,22 +40,18 @@ from mazeescape.problems.maze_grid_problem import MazeGridProblem
 # FINAL ASCII (classic output – old style, hocaya tanıdık)
 # =========================================================
 
+def render_final_ascii(world: MazeWorld, path: List[Coordinate]) -> str:
+    rows = np.where(world.walls, "#", ".").astype("<U1")
+    for x, y in path:
+        rows[y, x] = "*"
+    for symbol, cell in (("S", world.start), ("G", world.goal)):
+        if cell is not None:
+            rows[cell[1], cell[0]] = symbol
+    return "\n".join("".join(row) for row in rows)
+
+
 def print_final_ascii(world: MazeWorld, path: List[Coordinate]) -> None:
-    path_set = set(path)
-    for y in range(world.height):
-        row = ""
-        for x in range(world.width):
-            if (x, y) == world.start:
-                row += "S"
-            elif (x, y) == world.goal:
-                row += "G"
-            elif (x, y) in path_set:
-                row += "*"
-            elif world.is_wall(x, y):
-                row += "#"
-            else:
-                row += "."
-        print(row)
+    print(render_final_ascii(world, path))
 
 
 # =========================================================
@@ -50,6 +62,7 @@ def print_final_ascii(world: MazeWorld, path: List[Coordinate]) -> None:
 class _BeliefWorld:
     true_world: MazeWorld
     known_walls: Set[Coordinate]
+    adjacency: Optional[GridAdjacency] = None
 
     @property
     def start(self):
@@ -78,6 +91,107 @@ class _BeliefWorld:
             if self.is_free(nx, ny)
         ]
 
+    def compile_adjacency(self) -> GridAdjacency:
+        """CSR adjacency of the belief map (unknown cells count as free)."""
+        passable = np.ones((self.true_world.height, self.true_world.width), dtype=bool)
+        for x, y in self.known_walls:
+            passable[y, x] = False
+        self.adjacency = GridAdjacency.from_passable(passable)
+        return self.adjacency
+
+    def add_wall(self, cell: Coordinate) -> None:
+        """Record a sensed wall and patch the compiled adjacency in place."""
+        if cell in self.known_walls:
+            return
+        self.known_walls.add(cell)
+        if self.adjacency is not None:
+            self.adjacency.block(*cell)
+
+
+# =========================================================
+# PLANNERS
+# =========================================================
+#
+# A planner owns whatever search state it keeps between moves:
+#   plan(current)    -> path [current, ..., goal] or None (real-time planners
+#                       may return a prefix that stops short of the goal)
+#   wall_added(cell) -> called after a sensed wall is added to the belief world
+#   expansions       -> total node expansions so far
+#   label            -> name used in the log lines
+# and optionally:
+#   summary()        -> extra metrics merged into online_astar's result
+#   learned_h        -> learned heuristic table, keyed by cell
+
+class RepeatedAStarPlanner:
+    """Classic Repeated A*: a fresh A* search from the current cell on every plan.
+
+    The goal and heuristic never change during a run, so h values are kept
+    in one HeuristicCache shared by all replans (at most `h_cache_size`
+    cells, evicted by `h_cache_policy`; size 0 disables the cache).
+    """
+
+    label = "A*"
+
+    def __init__(
+        self,
+        world: _BeliefWorld,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+        h_cache_size: Optional[int] = None,
+        h_cache_policy: str = "lru",
+    ) -> None:
+        self.world = world
+        self.goal = goal
+        self.heuristic = heuristic
+        self.expansions = 0
+        self.frontier_max = 0
+        self.h_cache = None if h_cache_size == 0 else HeuristicCache(h_cache_size, h_cache_policy)
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        goal, heuristic = self.goal, self.heuristic
+        problem = MazeGridProblem(self.world, current, goal)  # type: ignore
+
+        def h(node: Node) -> float:
+            return heuristic(node.state, goal)
+
+        goal_node = astar_search(problem, h=h, cache=self.h_cache)
+        if goal_node is None:
+            return None
+
+        metrics = getattr(goal_node, "metrics", {})
+        self.expansions += metrics.get("expanded_nodes", 0)
+        self.frontier_max = max(self.frontier_max, metrics.get("frontier_max", 0))
+        return goal_node.path_states()
+
+    def wall_added(self, cell: Coordinate) -> None:
+        pass  # walls do not change h; the cached values stay valid
+
+    def summary(self) -> Dict[str, float]:
+        """Largest frontier seen by any replan, and the heuristic cache's counters."""
+        metrics = {"frontier_max": float(self.frontier_max)}
+        if self.h_cache is not None:
+            metrics.update({f"h_cache_{name}": value for name, value in self.h_cache.stats().items()})
+        return metrics
+
+
+PLANNERS = {
+    "astar": RepeatedAStarPlanner,
+    "dstar_lite": DStarLitePlanner,
+    "adaptive": AdaptiveAStarPlanner,
+    "rtaa": RealTimeAStarPlanner,
+    "jps": JumpPointPlanner,
+    "hpa": HierarchicalPlanner,
+    "field": DistanceFieldPlanner,
+}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100.0 * len(ordered)) - 1)]
+
 
 # =========================================================
 # PERCEPTION
@@ -98,24 +212,15 @@ def _sense_walls(true_world: MazeWorld, pos: Coordinate) -> Set[Coordinate]:
 # ASCII GRID SNAPSHOT (partial observability proof)
 # =========================================================
 
-def _print_ascii_known_map(world: MazeWorld, agent_pos: Coordinate, step: int) -> None:
-    print(f"\n[GRID] Step {step}")
-    for y in range(world.height):
-        row = []
-        for x in range(world.width):
-            if (x, y) == agent_pos:
-                row.append("A")
-            elif world.goal and (x, y) == world.goal:
-                row.append("G")
-            else:
-                v = world.known_map[y, x]
-                if v == -1:
-                    row.append("?")
-                elif v == 0:
-                    row.append(".")
-                else:
-                    row.append("#")
-        print(" ".join(row))
+_KNOWN_MAP_CHARS = np.array(["?", ".", "#"])  # indexed by known_map + 1
+
+
+def _render_known_map(world: MazeWorld, agent_pos: Coordinate) -> str:
+    rows = _KNOWN_MAP_CHARS[world.known_map + 1]
+    if world.goal:
+        rows[world.goal[1], world.goal[0]] = "G"
+    rows[agent_pos[1], agent_pos[0]] = "A"
+    return "\n".join(" ".join(row) for row in rows)
 
 
 # =========================================================
@@ -127,102 +232,149 @@ def online_astar(
     heuristic: Callable[[Coordinate, Coordinate], float],
     step_callback: Optional[Callable[[Coordinate], None]] = None,
     replan_callback: Optional[Callable[[Coordinate], None]] = None,
+    planner: str = "astar",
+    learned_h: Optional[Dict[Coordinate, float]] = None,
+    planner_options: Optional[Dict[str, Any]] = None,
+    events: Optional[EventSink] = None,
+    trace_path: Optional[str] = None,
 ) -> Tuple[List[Coordinate], int, Dict[str, float]]:
+    """Navigate the partially known maze, replanning when the plan is blocked.
+
+    planner: one of PLANNERS ("astar" = Repeated A*, "dstar_lite" = D* Lite,
+             "adaptive" = Adaptive A*, "rtaa" = real-time RTAA*,
+             "jps" = Repeated Jump Point Search, "hpa" = Repeated HPA*,
+             "field" = descent along the belief map's goal distance field).
+    learned_h: optional dict filled with the planner's learned heuristic
+               table at the end of the run (Adaptive A* / RTAA*).
+    planner_options: extra keyword arguments for the planner, e.g.
+               {"expansion_budget": 100, "time_budget_ms": 2.0} for "rtaa".
+    events:    EventSink receiving the run's log events (default: NullSink,
+               i.e. silent). Use ConsoleSink() for the classic console log.
+    trace_path: if given, also record a compact columnar trace of the run
+               (TraceRecorder) and save it there (.npz or a .npy directory),
+               also when the run raises (no plan found, stuck...).
+
+    Besides the usual metrics, plan_latency_max_ms / plan_latency_p99_ms
+    report the worst-case and p99 wall time of a single planning step.
+    """
 
     if true_world.start is None or true_world.goal is None:
         raise ValueError("MazeWorld must define start (S) and goal (G).")
+    if planner not in PLANNERS:
+        raise ValueError(f"planner must be one of {sorted(PLANNERS)}")
 
     current: Coordinate = true_world.start
     goal: Coordinate = true_world.goal
-
-    known_walls: Set[Coordinate] = set()
+    recorder = TraceRecorder(true_world) if trace_path else None
+    if recorder is not None:
+        events = MultiSink(events, recorder) if events is not None else recorder
+    events = events or NullSink()
+    emit, snapshots = events.emit, events.wants_snapshots
+
+    belief_world = _BeliefWorld(true_world, set())
+    belief_world.compile_adjacency()
+    known_walls = belief_world.known_walls
     path_taken: List[Coordinate] = [current]
+    search = PLANNERS[planner](belief_world, goal, heuristic, **(planner_options or {}))
+    plan_latencies_ms: List[float] = []
 
     astar_calls = 0
     replans = 0
-    total_expansions = 0.0
     step_id = 0
 
-    # Initial sensing
-    true_world.sense(current)
-
-    print(f"\n[STATE] Agent at {current}")
-    print(f"[GOAL] Goal at {goal}")
-    _print_ascii_known_map(true_world, current, step_id)
-
-    if step_callback:
-        step_callback(current)
-
-    # ================= MAIN LOOP =================
-    while current != goal:
-
-        print(f"\n[SEARCH] A* planning (heuristic = {heuristic.__name__})")
-        astar_calls += 1
-        print(f"[SEARCH] A* called (call #{astar_calls})")
-
-        if replan_callback:
-            replan_callback(current)
-
-        belief_world = _BeliefWorld(true_world, known_walls)
-        problem = MazeGridProblem(belief_world, current, goal)  # type: ignore
-
-        def h(node: Node) -> float:
-            return heuristic(node.state, goal)
-
-        goal_node = astar_search(problem, h=h)
-        replans += 1
-
-        if goal_node is None:
-            raise RuntimeError("Online A*: no plan found")
-
-        metrics = getattr(goal_node, "metrics", {})
-        total_expansions += float(metrics.get("expanded_nodes", 0))
-
-        planned_path = [n.state for n in goal_node.path()]
-        progressed = False
-
-        # =============== EXECUTION =================
-        for next_cell in planned_path[1:]:
-
-            newly_sensed = _sense_walls(true_world, current)
-            for w in newly_sensed - known_walls:
-                print(f"[PERCEPT] Obstacle discovered at {w}")
-            known_walls |= newly_sensed
-
-            if next_cell in known_walls:
-                print("[SEARCH] Current plan invalid")
-                print("[SEARCH] Replanning with A*")
-                break
-
-            print(f"[ACTION] Moving to {next_cell}")
-            current = next_cell
-            path_taken.append(current)
-            progressed = True
-            step_id += 1
-
-            true_world.sense(current)
-            _print_ascii_known_map(true_world, current, step_id)
-
-            if step_callback:
-                step_callback(current)
-
-            if current == goal:
-                break
-
-        if not progressed and current != goal:
-            raise RuntimeError("Online A*: stuck (no progress possible)")
-
-    # ================= SUMMARY =================
-    print("\n[SUMMARY]")
-    print(f"A* calls : {astar_calls}")
-    print(f"Replans  : {replans}")
-
-    print("\n[FINAL PATH – ASCII]")
-    print_final_ascii(true_world, path_taken)
-
-    return path_taken, replans, {
-        "node_expansions": float(total_expansions),
-        "path_cost": float(len(path_taken) - 1),
-        "path_length": float(len(path_taken)),
-        "replans": float(replans),
-    }
+    # The trace is saved even if the run fails (that is when it is most useful)
+    try:
+        # Initial sensing
+        true_world.sense(current)
+
+        emit(ev.START, agent=current, goal=goal)
+        if snapshots:
+            emit(ev.SNAPSHOT, step=step_id, ascii=_render_known_map(true_world, current))
+
+        if step_callback:
+            step_callback(current)
+
+        # ================= MAIN LOOP =================
+        while current != goal:
+
+            astar_calls += 1
+            emit(ev.SEARCH, planner=search.label, heuristic=heuristic.__name__, call=astar_calls)
+
+            if replan_callback:
+                replan_callback(current)
+
+            expansions_before = search.expansions
+            t0 = time.perf_counter()
+            planned_path = search.plan(current)
+            plan_latencies_ms.append((time.perf_counter() - t0) * 1000.0)
+            replans += 1
+            emit(
+                ev.PLAN,
+                call=astar_calls,
+                expansions=search.expansions - expansions_before,
+                latency_ms=plan_latencies_ms[-1],
+                length=len(planned_path) if planned_path else 0,
+            )
+
+            if planned_path is None:
+                raise RuntimeError("Online A*: no plan found")
+
+            progressed = False
+            learned = False
+
+            # =============== EXECUTION =================
+            for next_cell in planned_path[1:]:
+
+                newly_sensed = _sense_walls(true_world, current)
+                for w in newly_sensed - known_walls:
+                    emit(ev.PERCEPT, wall=w)
+                    belief_world.add_wall(w)
+                    search.wall_added(w)
+                    learned = True
+
+                if next_cell in known_walls:
+                    emit(ev.REPLAN, planner=search.label)
+                    break
+
+                current = next_cell
+                path_taken.append(current)
+                progressed = True
+                step_id += 1
+                emit(ev.ACTION, cell=current, step=step_id)
+
+                true_world.sense(current)
+                if snapshots:
+                    emit(ev.SNAPSHOT, step=step_id, ascii=_render_known_map(true_world, current))
+
+                if step_callback:
+                    step_callback(current)
+
+                if current == goal:
+                    break
+
+            # A blocked first step is fine as long as it taught us a new wall.
+            if not progressed and not learned and current != goal:
+                raise RuntimeError("Online A*: stuck (no progress possible)")
+
+        # ================= SUMMARY =================
+        emit(ev.SUMMARY, calls=astar_calls, replans=replans)
+        if snapshots:
+            emit(ev.FINAL_PATH, ascii=render_final_ascii(true_world, path_taken))
+
+        metrics = {
+            "node_expansions": float(search.expansions),
+            "path_cost": float(len(path_taken) - 1),
+            "path_length": float(len(path_taken)),
+            "replans": float(replans),
+            "plan_latency_max_ms": max(plan_latencies_ms, default=0.0),
+            "plan_latency_p99_ms": _percentile(plan_latencies_ms, 99),
+        }
+        if hasattr(search, "summary"):
+            metrics.update(search.summary())
+        if learned_h is not None and hasattr(search, "learned_h"):
+            learned_h.update(search.learned_h)
+
+        return path_taken, replans, metrics
+    finally:
+        if recorder is not None:
+            recorder.save(trace_path)
@@ -0,0 +1,74 @@
+"""
+mazeescape/algorithms/realtime_astar.py
+
+Real-Time Adaptive A* (RTAA*, Koenig & Likhachev, 2006) planner.
+
+Each decision runs a bounded A* lookahead from the current cell: at most
+`expansion_budget` expansions and/or `time_budget_ms` of wall-clock time.
+With s_bar the best state left on the open list and f_bar = g(s_bar) +
+h(s_bar), every expanded state s is updated locally to
+
+    h(s) := f_bar - g(s)
+
+and the agent moves along the lookahead path towards s_bar (or the goal,
+if the lookahead reached it) before searching again. Planning latency per
+decision is therefore bounded independently of the maze size.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, List, Optional
+
+from mazeescape.algorithms.adaptive_astar import AdaptiveAStarPlanner
+from mazeescape.algorithms.grid_astar import grid_astar_search
+from mazeescape.environments.maze_grid_world import Coordinate
+
+
+class RealTimeAStarPlanner(AdaptiveAStarPlanner):
+    """RTAA*: bounded lookahead + local heuristic updates, then move."""
+
+    label = "RTAA*"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+        expansion_budget: Optional[int] = 64,
+        time_budget_ms: Optional[float] = None,
+    ) -> None:
+        if expansion_budget is None and time_budget_ms is None:
+            raise ValueError("RTAA* needs an expansion_budget and/or a time_budget_ms")
+        if expansion_budget is not None and expansion_budget < 1:
+            raise ValueError("expansion_budget must be >= 1")
+        super().__init__(world, goal, heuristic)
+        self.expansion_budget = expansion_budget
+        self.time_budget_ms = time_budget_ms
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        deadline = None
+        if self.time_budget_ms is not None:
+            deadline = time.perf_counter() + self.time_budget_ms / 1000.0
+
+        w = self.width
+        search = grid_astar_search(
+            self.adjacency,
+            current[1] * w + current[0],
+            self.goal[1] * w + self.goal[0],
+            self.h,
+            max_expansions=self.expansion_budget,
+            deadline=deadline,
+            sparse=True,
+        )
+        self.expansions += search.expansions
+        self.replan_expansions.append(search.expansions)
+        if not search.frontier:
+            return None  # open list exhausted: goal unreachable on the belief map
+
+        best = search.frontier[0][2]
+        f_best = search.g[best] + self.h(best)
+        g, learned = search.g, self.learned
+        for i in search.expanded:
+            learned[i] = f_best - g[i]
+        return search.path(best)
@@ -0,0 +1,104 @@
+"""
+mazeescape/environments/grid_adjacency.py
+
+Compressed sparse row (CSR) adjacency for 4-connected maze grids.
+
+Cells are numbered row-major (i = y * width + x). Row i of the structure
+lists the passable 4-neighbors of cell i in DIRECTIONS4 order:
+
+    targets[offsets[i] : ends[i]]
+
+`offsets` is the usual CSR row pointer (int32, n + 1 entries) and
+`targets` the flat int32 neighbor array. `ends` marks the live end of each
+row, so discovering a wall only shortens the rows involved (`block`)
+instead of recompiling the whole grid.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from .maze_grid_world import DIRECTIONS4
+
+Coordinate = Tuple[int, int]
+
+
+class GridAdjacency:
+    """CSR neighbor lists for the passable cells of a grid."""
+
+    def __init__(self, width: int, height: int, offsets: np.ndarray, targets: np.ndarray) -> None:
+        self.width = width
+        self.height = height
+        self.offsets = offsets
+        self.targets = targets
+        self.ends = offsets[1:].copy()
+        # memoryviews give fast per-element access from Python (plain ints)
+        self._off = memoryview(self.offsets)
+        self._end = memoryview(self.ends)
+        self._tgt = memoryview(self.targets)
+
+    @classmethod
+    def from_passable(cls, passable: np.ndarray) -> "GridAdjacency":
+        """Compile a (height, width) bool array (True = passable)."""
+        passable = np.asarray(passable, dtype=bool)
+        height, width = passable.shape
+        n = height * width
+        padded = np.pad(passable, 1)
+
+        # masks[d][i]: cell i is passable and so is its neighbor in direction d
+        masks = [
+            (padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] & passable).ravel()
+            for dx, dy in DIRECTIONS4
+        ]
+        degree = np.zeros(n, dtype=np.int32)
+        for m in masks:
+            degree += m
+
+        offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(degree, out=offsets[1:])
+
+        # Scatter direction by direction; `slot` is the next free position per row.
+        targets = np.empty(int(offsets[-1]), dtype=np.int32)
+        slot = offsets[:-1].copy()
+        for m, (dx, dy) in zip(masks, DIRECTIONS4):
+            cells = np.flatnonzero(m).astype(np.int32)
+            targets[slot[cells]] = cells + (dy * width + dx)
+            slot[cells] += 1
+        return cls(width, height, offsets, targets)
+
+    # ---------------- QUERIES ----------------
+
+    def degree(self, i: int) -> int:
+        return self._end[i] - self._off[i]
+
+    def neighbor_indices(self, i: int) -> List[int]:
+        return self._tgt[self._off[i]:self._end[i]].tolist()
+
+    def neighbors(self, state: Coordinate) -> List[Coordinate]:
+        """Passable 4-neighbors of (x, y), in the same order as `neighbors4`."""
+        w = self.width
+        i = state[1] * w + state[0]
+        tgt = self._tgt
+        return [(t % w, t // w) for t in tgt[self._off[i]:self._end[i]]]
+
+    # ---------------- INCREMENTAL UPDATES ----------------
+
+    def block(self, x: int, y: int) -> None:
+        """Mark (x, y) as a wall: drop its row and remove it from its neighbors' rows."""
+        i = y * self.width + x
+        off, end, tgt = self._off, self._end, self._tgt
+        for k in range(off[i], end[i]):
+            self._remove_target(tgt[k], i)
+        end[i] = off[i]
+
+    def _remove_target(self, row: int, target: int) -> None:
+        # Shift-delete (rows hold at most 4 entries) to keep DIRECTIONS4 order.
+        tgt, last = self._tgt, self._end[row] - 1
+        for k in range(self._off[row], last + 1):
+            if tgt[k] == target:
+                for j in range(k, last):
+                    tgt[j] = tgt[j + 1]
+                self._end[row] = last
+                return
@@ -0,0 +1,138 @@
+"""
+mazeescape/environments/maze_binary.py
+
+Bit-packed binary maze format (.maze), opened with np.memmap.
+
+Layout (little-endian):
+  0   8s   magic  b"MZBITS01"
+  8   u32  width
+  12  u32  height
+  16  i32  start x, start y   (-1, -1 if the maze has no start)
+  24  i32  goal x,  goal y    (-1, -1 if the maze has no goal)
+  32  ...  zero padding up to HEADER_SIZE (64)
+  64  u8   wall bitmap: `height` rows of ceil(width / 8) bytes, bit x % 8 of
+           byte x // 8 set = wall (np.packbits(..., bitorder="little"))
+
+One bit per cell, so a 10k x 10k maze is 12.5 MB on disk. load_binary
+reads the 64-byte header and maps the bitmap; MazeWorld.from_packed
+defers unpacking until the wall array is first used, so opening costs the
+same few milliseconds at any size.
+
+Usage:
+  python -m mazeescape.environments.maze_binary convert mazes/maze1.txt mazes/maze1.maze
+  python -m mazeescape.environments.maze_binary info mazes/maze1.maze
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+
+MAGIC = b"MZBITS01"
+SUFFIX = ".maze"
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<8sIIiiii")
+
+
+def _cell(value: Optional[Coordinate]) -> Tuple[int, int]:
+    return (-1, -1) if value is None else (int(value[0]), int(value[1]))
+
+
+def read_header(path: str) -> Tuple[int, int, Optional[Coordinate], Optional[Coordinate]]:
+    """(width, height, start, goal) from a .maze header (validates size)."""
+    with open(path, "rb") as fh:
+        raw = fh.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or raw[:8] != MAGIC:
+        raise ValueError(f"{path}: not a bit-packed maze file")
+    _, width, height, sx, sy, gx, gy = _HEADER.unpack_from(raw)
+
+    expected = HEADER_SIZE + height * ((width + 7) // 8)
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"{path}: expected {expected} bytes for a {width}x{height} maze")
+    start = None if sx < 0 else (sx, sy)
+    goal = None if gx < 0 else (gx, gy)
+    return width, height, start, goal
+
+
+def write_binary(
+    path: str,
+    walls: np.ndarray,
+    start: Optional[Coordinate],
+    goal: Optional[Coordinate],
+) -> None:
+    """Write a (height, width) boolean wall array as a .maze file."""
+    walls = np.asarray(walls, dtype=bool)
+    height, width = walls.shape
+    header = _HEADER.pack(MAGIC, width, height, *_cell(start), *_cell(goal))
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(HEADER_SIZE, b"\0"))
+        # Row blocks bound the packed temporary for very large mazes
+        rows = max(1, (1 << 24) // max(width, 1))
+        for y in range(0, height, rows):
+            fh.write(np.packbits(walls[y:y + rows], axis=1, bitorder="little").tobytes())
+
+
+def save_binary(world: MazeWorld, path: str) -> None:
+    packed = world.__dict__.get("_packed")
+    if packed is not None and "walls" not in world.__dict__:
+        # Still-packed world: copy the bitmap through without unpacking it
+        header = _HEADER.pack(MAGIC, world.width, world.height, *_cell(world.start), *_cell(world.goal))
+        with open(path, "wb") as fh:
+            fh.write(header.ljust(HEADER_SIZE, b"\0"))
+            fh.write(np.ascontiguousarray(packed).tobytes())
+        return
+    write_binary(path, world.walls, world.start, world.goal)
+
+
+def load_binary(path: str, mmap: bool = True) -> MazeWorld:
+    """Open a .maze file. With mmap=True the bitmap is a read-only np.memmap."""
+    width, height, start, goal = read_header(path)
+    shape = (height, (width + 7) // 8)
+    if mmap and height > 0:
+        packed = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=shape)
+    else:
+        packed = np.fromfile(path, dtype=np.uint8, offset=HEADER_SIZE).reshape(shape)
+    return MazeWorld.from_packed(packed, width, start, goal)
+
+
+def convert_text(src: str, dst: str) -> MazeWorld:
+    """Convert a text maze (mazes/*.txt format) to the binary format."""
+    world = MazeWorld.from_file(src)
+    save_binary(world, dst)
+    return world
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bit-packed binary maze files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    conv = sub.add_parser("convert", help="text maze -> .maze")
+    conv.add_argument("src")
+    conv.add_argument("dst", nargs="?", help="default: src with a .maze suffix")
+    info = sub.add_parser("info", help="print the header and the open time")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        dst = args.dst or os.path.splitext(args.src)[0] + SUFFIX
+        t0 = time.perf_counter()
+        world = convert_text(args.src, dst)
+        t1 = time.perf_counter()
+        print(
+            f"{args.src} -> {dst}: {world.width}x{world.height}, "
+            f"{os.path.getsize(dst)} bytes, {(t1 - t0) * 1000:.1f} ms"
+        )
+    else:
+        t0 = time.perf_counter()
+        world = load_binary(args.path)
+        t1 = time.perf_counter()
+        print(
+            f"{args.path}: {world.width}x{world.height}, S={world.start}, G={world.goal}, "
+            f"opened in {(t1 - t0) * 1000:.2f} ms"
+        )
@@ -0,0 +1,343 @@
+"""
+mazeescape/environments/maze_generator.py
+
+Seeded procedural mazes for scaling workloads (16^2 .. 8192^2).
+
+Every generator returns a (height, width) boolean wall array; generate_maze
+wraps it with MazeWorld.from_array (no text round-trip) and places S / G on
+the free cells nearest the top-left / bottom-right corners.
+
+Kinds:
+  backtracker  perfect maze, recursive backtracker (iterative DFS). Long
+               winding corridors; inherently sequential, so it is the one
+               pure-Python generator (~1M lattice cells in a few seconds).
+  kruskal      perfect maze, randomized Kruskal. Computed as the minimum
+               spanning tree of random edge weights with a vectorized
+               Boruvka, which yields the same tree Kruskal would.
+               Option: loops (fraction of extra carved walls -> braid maze).
+  obstacles    independent random walls. Option: density (default 0.25).
+               A random monotone staircase from the top-left to the
+               bottom-right corner is carved free, so S reaches G.
+  rooms        rooms-and-corridors: one random room per block, rooms joined
+               along a random spanning tree of the blocks plus extra loops.
+               Options: room (block side, default 16), loops (default 0.1).
+  open         no walls. Option: border (default False).
+
+Perfect mazes use the usual lattice layout: cells on odd coordinates, walls
+on even ones, so odd width/height give a closed outer wall.
+
+Usage:
+  python -m mazeescape.environments.maze_generator kruskal 4097 --seed 1
+  python -m mazeescape.environments.maze_generator rooms 256 --out mazes/rooms256.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import FREE, GOAL, START, WALL, Coordinate, MazeWorld
+
+
+# =========================================================
+# SPANNING TREES ON A CELL LATTICE
+# =========================================================
+
+def _lattice_edges(cw: int, ch: int) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Endpoints of all lattice edges: east edges first (row-major), then south."""
+    idx = np.arange(cw * ch, dtype=np.int32).reshape(ch, cw)
+    u = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+    v = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+    return u, v, ch * (cw - 1)
+
+
+def random_spanning_tree(cw: int, ch: int, rng: np.random.Generator, loops: float = 0.0) -> np.ndarray:
+    """Carved-edge mask of a random spanning tree of the lattice (see _lattice_edges).
+
+    Every edge gets a distinct random weight, so the minimum spanning tree
+    is unique and equals what randomized Kruskal produces. Boruvka finds it
+    in O(log n) rounds of whole-array numpy operations: every component
+    picks its cheapest outgoing edge, then components are merged by pointer
+    jumping and relabelled densely so the per-component arrays shrink.
+    `loops` additionally carves that fraction of the remaining edges.
+    """
+    edge_u, edge_v, _ = _lattice_edges(cw, ch)
+    carved = np.zeros(len(edge_u), dtype=bool)
+
+    # key = random weight (high 32 bits) | edge id (low 32 bits): distinct
+    # weights with the edge id recoverable from the minimum
+    key = rng.integers(0, 2**32, size=len(edge_u), dtype=np.uint64) << np.uint64(32)
+    key |= np.arange(len(edge_u), dtype=np.uint64)
+    low = np.uint64(2**32 - 1)
+
+    k = cw * ch
+    comp = np.arange(k, dtype=np.int32)
+    cu, cv = edge_u.copy(), edge_v.copy()
+
+    while k > 1:
+        live = cu != cv
+        cu, cv, key = cu[live], cv[live], key[live]
+
+        # Cheapest outgoing edge per component
+        best = np.full(k, np.iinfo(np.uint64).max, dtype=np.uint64)
+        np.minimum.at(best, cu, key)
+        np.minimum.at(best, cv, key)
+        chosen = (best & low).astype(np.int64)
+        carved[chosen] = True
+
+        # Hook every component onto the one across its edge; two components
+        # that picked the same edge point at each other -> keep the smaller root
+        ids = np.arange(k, dtype=np.int32)
+        a, b = comp[edge_u[chosen]], comp[edge_v[chosen]]
+        parent = np.where(a == ids, b, a)
+        mutual = (parent[parent] == ids) & (ids < parent)
+        parent[mutual] = ids[mutual]
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+        roots = parent == ids
+        label = (np.cumsum(roots, dtype=np.int32) - 1)[parent]
+        k = int(roots.sum())
+        comp, cu, cv = label[comp], label[cu], label[cv]
+
+    if loops > 0:
+        carved |= rng.random(len(carved)) < loops
+    return carved
+
+
+def _carve_lattice(width: int, height: int, carved: np.ndarray) -> np.ndarray:
+    """Wall grid for a perfect maze whose lattice edges are `carved`."""
+    cw, ch = (width - 1) // 2, (height - 1) // 2
+    walls = np.ones((height, width), dtype=bool)
+    walls[1:2 * ch:2, 1:2 * cw:2] = False
+
+    n_east = ch * (cw - 1)
+    east = carved[:n_east].reshape(ch, cw - 1)
+    south = carved[n_east:].reshape(ch - 1, cw)
+    walls[1:2 * ch:2, 2:2 * cw - 1:2] = ~east
+    walls[2:2 * ch - 1:2, 1:2 * cw:2] = ~south
+    return walls
+
+
+def _lattice_size(width: int, height: int) -> Tuple[int, int]:
+    if width < 3 or height < 3:
+        raise ValueError("perfect mazes need width and height >= 3")
+    return (width - 1) // 2, (height - 1) // 2
+
+
+# =========================================================
+# GENERATORS
+# =========================================================
+
+def backtracker_walls(width: int, height: int, rng: np.random.Generator) -> np.ndarray:
+    cw, ch = _lattice_size(width, height)
+    n = cw * ch
+    py_rng = random.Random(int(rng.integers(2**63)))
+    randrange = py_rng.randrange
+
+    carved = np.zeros(ch * (cw - 1) + (ch - 1) * cw, dtype=bool)
+    n_east = ch * (cw - 1)
+    visited = bytearray(n)
+    visited[0] = 1
+    stack = [0]
+    picked = []
+
+    while stack:
+        i = stack[-1]
+        y, x = divmod(i, cw)
+        options = []
+        # (neighbor, edge index into the carved mask)
+        if x > 0 and not visited[i - 1]:
+            options.append((i - 1, y * (cw - 1) + x - 1))
+        if x < cw - 1 and not visited[i + 1]:
+            options.append((i + 1, y * (cw - 1) + x))
+        if y > 0 and not visited[i - cw]:
+            options.append((i - cw, n_east + i - cw))
+        if y < ch - 1 and not visited[i + cw]:
+            options.append((i + cw, n_east + i))
+        if not options:
+            stack.pop()
+            continue
+        j, edge = options[randrange(len(options))] if len(options) > 1 else options[0]
+        visited[j] = 1
+        picked.append(edge)
+        stack.append(j)
+
+    carved[np.asarray(picked, dtype=np.int64)] = True
+    return _carve_lattice(width, height, carved)
+
+
+def kruskal_walls(width: int, height: int, rng: np.random.Generator, loops: float = 0.0) -> np.ndarray:
+    cw, ch = _lattice_size(width, height)
+    return _carve_lattice(width, height, random_spanning_tree(cw, ch, rng, loops))
+
+
+def obstacle_walls(width: int, height: int, rng: np.random.Generator, density: float = 0.25) -> np.ndarray:
+    walls = np.empty((height, width), dtype=bool)
+    # Row chunks keep the float32 temporaries bounded at ~16 MiB
+    rows = max(1, (1 << 22) // width)
+    for y in range(0, height, rows):
+        chunk = walls[y:y + rows]
+        chunk[...] = rng.random(chunk.shape, dtype=np.float32) < density
+
+    # Carve a random right/down staircase between the corners (S and G)
+    steps = np.zeros(width + height - 2, dtype=bool)  # True = step down
+    steps[:height - 1] = True
+    steps = rng.permutation(steps)
+    ys = np.concatenate([[0], np.cumsum(steps)])
+    xs = np.concatenate([[0], np.cumsum(~steps)])
+    walls[ys, xs] = False
+    return walls
+
+
+def rooms_walls(
+    width: int,
+    height: int,
+    rng: np.random.Generator,
+    room: int = 16,
+    loops: float = 0.1,
+) -> np.ndarray:
+    if room < 5:
+        raise ValueError("room block size must be >= 5")
+    if width < 4 or height < 4:
+        raise ValueError("rooms mazes need width and height >= 4")  # a 2x2 room plus its wall margin
+    nbx, nby = max(1, width // room), max(1, height // room)
+    bw, bh = min(room, width), min(room, height)
+
+    # Room size within its block (at least a one-cell wall margin) and offset
+    rw = rng.integers(max(2, bw // 3), bw - 1, size=(nby, nbx))
+    rh = rng.integers(max(2, bh // 3), bh - 1, size=(nby, nbx))
+    ox = 1 + (rng.random((nby, nbx)) * (bw - 1 - rw)).astype(np.int64)
+    oy = 1 + (rng.random((nby, nbx)) * (bh - 1 - rh)).astype(np.int64)
+
+    lx, ly = np.arange(bw), np.arange(bh)
+    in_x = (lx >= ox[..., None]) & (lx < (ox + rw)[..., None])          # (nby, nbx, bw)
+    in_y = (ly >= oy[..., None]) & (ly < (oy + rh)[..., None])          # (nby, nbx, bh)
+    free = in_y.transpose(0, 2, 1)[:, :, :, None] & in_x[:, None, :, :]  # (nby, bh, nbx, bw)
+
+    walls = np.ones((height, width), dtype=bool)
+    walls[:nby * bh, :nbx * bw] = ~free.reshape(nby * bh, nbx * bw)
+
+    # L-shaped corridors between the centers of rooms joined in the block tree
+    cx = (np.arange(nbx) * bw)[None, :] + ox + rw // 2
+    cy = (np.arange(nby) * bh)[:, None] + oy + rh // 2
+    if nbx * nby > 1:
+        carved = random_spanning_tree(nbx, nby, rng, loops)
+        u, v, _ = _lattice_edges(nbx, nby)
+        for a, b in zip(u[carved].tolist(), v[carved].tolist()):
+            (ay, ax), (by, bx) = divmod(a, nbx), divmod(b, nbx)
+            x0, y0, x1, y1 = cx[ay, ax], cy[ay, ax], cx[by, bx], cy[by, bx]
+            walls[y0, min(x0, x1):max(x0, x1) + 1] = False
+            walls[min(y0, y1):max(y0, y1) + 1, x1] = False
+    return walls
+
+
+def open_walls(width: int, height: int, rng: np.random.Generator, border: bool = False) -> np.ndarray:
+    walls = np.zeros((height, width), dtype=bool)
+    if border:
+        walls[[0, -1], :] = walls[:, [0, -1]] = True
+    return walls
+
+
+GENERATORS: Dict[str, Callable[..., np.ndarray]] = {
+    "backtracker": backtracker_walls,
+    "kruskal": kruskal_walls,
+    "obstacles": obstacle_walls,
+    "rooms": rooms_walls,
+    "open": open_walls,
+}
+
+
+# =========================================================
+# PUBLIC API
+# =========================================================
+
+def corner_endpoints(walls: np.ndarray) -> Tuple[Coordinate, Coordinate]:
+    """Free cells closest (x + y) to the top-left and bottom-right corners."""
+    height, width = walls.shape
+
+    def nearest(view: np.ndarray) -> Optional[Coordinate]:
+        k = 1
+        while True:
+            window = ~view[:k, :k]
+            if window.any():
+                ys, xs = np.nonzero(window)
+                i = int(np.argmin(xs + ys))
+                return int(xs[i]), int(ys[i])
+            if k >= max(height, width):
+                return None
+            k *= 2
+
+    start = nearest(walls)
+    end = nearest(walls[::-1, ::-1])
+    if start is None or end is None:
+        raise ValueError("maze has no free cell")
+    return start, (width - 1 - end[0], height - 1 - end[1])
+
+
+def generate_walls(
+    kind: str,
+    width: int,
+    height: Optional[int] = None,
+    *,
+    seed: Optional[int] = None,
+    **options,
+) -> np.ndarray:
+    """Seeded (height, width) boolean wall array of the given kind."""
+    if kind not in GENERATORS:
+        raise ValueError(f"unknown maze kind {kind!r}; expected one of {sorted(GENERATORS)}")
+    height = width if height is None else height
+    return GENERATORS[kind](width, height, np.random.default_rng(seed), **options)
+
+
+def generate_maze(
+    kind: str,
+    width: int,
+    height: Optional[int] = None,
+    *,
+    seed: Optional[int] = None,
+    **options,
+) -> MazeWorld:
+    """Seeded MazeWorld of the given kind with S / G at opposite corners."""
+    walls = generate_walls(kind, width, height, seed=seed, **options)
+    start, goal = corner_endpoints(walls)
+    return MazeWorld.from_array(walls, start, goal)
+
+
+def save_text(world: MazeWorld, path: str) -> None:
+    """Write a world in the mazes/*.txt format (one row per line)."""
+    rows = np.where(world.walls, ord(WALL), ord(FREE)).astype(np.uint8)
+    for symbol, (x, y) in ((START, world.start), (GOAL, world.goal)):
+        rows[y, x] = ord(symbol)
+    with open(path, "wb") as fh:
+        for row in rows:
+            fh.write(row.tobytes() + b"\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a seeded maze")
+    parser.add_argument("kind", choices=sorted(GENERATORS))
+    parser.add_argument("width", type=int)
+    parser.add_argument("height", type=int, nargs="?")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the maze as text (mazes/*.txt format)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    world = generate_maze(args.kind, args.width, args.height, seed=args.seed)
+    t1 = time.perf_counter()
+    print(
+        f"{args.kind} {world.width}x{world.height} seed={args.seed}: "
+        f"{world.free_cell_count()} free cells, S={world.start}, G={world.goal}, "
+        f"built in {(t1 - t0) * 1000:.1f} ms"
+    )
+    if args.out:
+        save_text(world, args.out)
+        print(f"Saved: {args.out}")
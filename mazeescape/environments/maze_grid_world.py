@@ -3,49 +3,167 @@ maze_grid_world.py
 
 Grid-based maze world with PARTIAL OBSERVABILITY.
 Produces PNG visualizations of the agent's belief map.
+
+matplotlib is only imported by visualize_known_map, so search code that
+just needs the world model does not pay for the plotting stack.
 """
 
 from __future__ import annotations
 
-import matplotlib
-matplotlib.use("Agg")  # FORCE FILE OUTPUT (no GUI)
-
 import numpy as np
-import matplotlib.pyplot as plt
 import os
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 Coordinate = Tuple[int, int]
 
+# Neighbor order used by neighbors4 and the bulk queries: up, down, left, right
+DIRECTIONS4: Tuple[Coordinate, ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+WALL, START, GOAL, FREE = "#", "S", "G", "."
+
+# Array attributes a from_packed world builds on first access (see __getattr__)
+_LAZY_ATTRS = frozenset(("walls", "_stride", "_free"))
+
+
+class _GridView:
+    """Read-only `grid[y][x]` view over the wall array (rows are str).
+
+    The walls never change, so each row string is built once, on first
+    read; 'S' and 'G' are patched in per read since start and goal may move.
+    """
+
+    def __init__(self, world: "MazeWorld") -> None:
+        self._world = world
+        self._rows: List[Optional[str]] = [None] * world.height
+
+    def __len__(self) -> int:
+        return self._world.height
+
+    def __getitem__(self, y: int) -> str:
+        world = self._world
+        if y < 0:
+            y += world.height
+        row = self._rows[y]
+        if row is None:
+            row = np.where(world.walls[y], ord(WALL), ord(FREE)).astype(np.uint8).tobytes().decode("ascii")
+            self._rows[y] = row
+        for symbol, cell in ((START, world.start), (GOAL, world.goal)):
+            if cell is not None and cell[1] == y:
+                x = cell[0]
+                row = row[:x] + symbol + row[x + 1:]
+        return row
+
+    def __iter__(self):
+        for y in range(len(self)):
+            yield self[y]
+
 
 class MazeWorld:
-    def __init__(self, grid: List[List[str]]) -> None:
-        self.grid = grid
-        self.height = len(grid)
-        self.width = len(grid[0]) if grid else 0
+    """Maze grid backed by a contiguous boolean wall array (`walls[y, x]`).
+
+    `grid` keeps the old row-of-characters view ('#', 'S', 'G', '.') for
+    callers that index `grid[y][x]`; per-cell queries (`is_wall`,
+    `neighbors4`) read a padded flat passability buffer instead. The
+    int8 belief map `known_map` (-1 unknown, 0 free, 1 wall) is allocated
+    on first access.
+    """
 
-        self.start = self._find_symbol("S")
-        self.goal = self._find_symbol("G")
+    def __init__(self, grid: Sequence[Sequence[str]]) -> None:
+        cells = _char_array(grid)
+        walls = cells == ord(WALL)
+        self._init_arrays(walls, _find_byte(cells, START), _find_byte(cells, GOAL))
 
-        # -1 unknown, 0 free, 1 wall
-        self.known_map = np.full((self.height, self.width), -1, dtype=int)
+    @classmethod
+    def from_array(
+        cls,
+        walls: np.ndarray,
+        start: Optional[Coordinate] = None,
+        goal: Optional[Coordinate] = None,
+    ) -> "MazeWorld":
+        """Build a world directly from a (height, width) boolean wall array."""
+        world = cls.__new__(cls)
+        world._init_arrays(np.asarray(walls, dtype=bool), start, goal)
+        return world
+
+    def _init_arrays(
+        self,
+        walls: np.ndarray,
+        start: Optional[Coordinate],
+        goal: Optional[Coordinate],
+    ) -> None:
+        if walls.ndim != 2:
+            raise ValueError("walls must be a 2-D array")
+        self.walls = np.ascontiguousarray(walls, dtype=bool)
+        self.walls.flags.writeable = False
+        self.height, self.width = self.walls.shape
 
-        if self.start:
-            x, y = self.start
-            self.known_map[y, x] = 0
+        self.start = start
+        self.goal = goal
+        self.adjacency = None  # GridAdjacency, see compile_adjacency()
+
+        # 1 = passable; one wall cell of padding so neighbor lookups need no bounds checks
+        self._stride = self.width + 2
+        self._free = np.pad(~self.walls, 1).tobytes()
+
+    @classmethod
+    def from_packed(
+        cls,
+        packed: np.ndarray,
+        width: int,
+        start: Optional[Coordinate] = None,
+        goal: Optional[Coordinate] = None,
+    ) -> "MazeWorld":
+        """Build a world over a (height, ceil(width / 8)) bit-packed wall bitmap.
+
+        Bits are little-endian within a byte, 1 = wall (np.packbits with
+        bitorder="little"). Nothing is unpacked here -- `walls` and the
+        passability buffer are built on first use -- so a
+        np.memmap bitmap opens in O(1) regardless of the maze size.
+        """
+        world = cls.__new__(cls)
+        world._packed = packed
+        world.height, world.width = packed.shape[0], width
+        world.start = start
+        world.goal = goal
+        world.adjacency = None
+        return world
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes that are not set yet: the belief map
+        # and a from_packed world's arrays are built the first time they
+        # are needed, so offline search and plain loading never pay for them.
+        if name == "known_map":
+            # -1 unknown, 0 free, 1 wall
+            self.known_map = np.full((self.height, self.width), -1, dtype=np.int8)
+            if self.start:
+                x, y = self.start
+                self.known_map[y, x] = 0
+            return self.known_map
+
+        packed = self.__dict__.get("_packed")
+        if packed is None or name not in _LAZY_ATTRS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        walls = np.unpackbits(packed, axis=1, count=self.width, bitorder="little").view(bool)
+        self._init_arrays(walls, self.start, self.goal)
+        return getattr(self, name)
 
     @classmethod
     def from_file(cls, filepath: str) -> "MazeWorld":
-        with open(filepath, encoding="utf-8") as f:
-            lines = [line.rstrip("\n") for line in f if line.strip()]
-        return cls([list(row) for row in lines])
-
-    def _find_symbol(self, symbol: str) -> Optional[Coordinate]:
-        for y, row in enumerate(self.grid):
-            for x, cell in enumerate(row):
-                if cell == symbol:
-                    return x, y
-        return None
+        if str(filepath).endswith(".maze"):
+            from .maze_binary import load_binary
+
+            return load_binary(filepath)
+
+        from .maze_text import read_text_maze
+
+        return cls.from_array(*read_text_maze(filepath))
+
+    @property
+    def grid(self) -> _GridView:
+        view = self.__dict__.get("_grid_view")
+        if view is None:
+            view = self._grid_view = _GridView(self)
+        return view
 
     def is_inside(self, x: int, y: int) -> bool:
         return 0 <= y < self.height and 0 <= x < self.width
@@ -53,12 +171,69 @@ class MazeWorld:
     def is_wall(self, x: int, y: int) -> bool:
         if not self.is_inside(x, y):
             return True
-        return self.grid[y][x] == "#"
+        return not self._free[(y + 1) * self._stride + x + 1]
 
     def neighbors4(self, state: Coordinate):
         x, y = state
-        candidates = [(x, y-1), (x, y+1), (x-1, y), (x+1, y)]
-        return [(nx, ny) for nx, ny in candidates if not self.is_wall(nx, ny)]
+        s = self._stride
+        i = (y + 1) * s + x + 1
+        free = self._free
+        out = []
+        if free[i - s]:
+            out.append((x, y - 1))
+        if free[i + s]:
+            out.append((x, y + 1))
+        if free[i - 1]:
+            out.append((x - 1, y))
+        if free[i + 1]:
+            out.append((x + 1, y))
+        return out
+
+    def compile_adjacency(self):
+        """Compile the passable cells into a CSR GridAdjacency (cached on `self.adjacency`)."""
+        from .grid_adjacency import GridAdjacency
+
+        self.adjacency = GridAdjacency.from_passable(~self.walls)
+        return self.adjacency
+
+    # ---------------- VECTORIZED QUERIES ----------------
+
+    def wall_mask(self) -> np.ndarray:
+        """(height, width) bool array, True where the cell is a wall (read-only)."""
+        return self.walls
+
+    def free_mask(self) -> np.ndarray:
+        """(height, width) bool array, True where the cell is passable."""
+        return ~self.walls
+
+    def free_cell_count(self) -> int:
+        return int(self.walls.size - np.count_nonzero(self.walls))
+
+    def neighbor_mask(self) -> np.ndarray:
+        """(4, height, width) bool array: move DIRECTIONS4[d] from (x, y) is passable.
+
+        Wall cells have no passable moves.
+        """
+        free = np.pad(~self.walls, 1)
+        h, w = self.height, self.width
+        out = np.empty((4, h, w), dtype=bool)
+        for d, (dx, dy) in enumerate(DIRECTIONS4):
+            np.logical_and(free[1 + dy:1 + dy + h, 1 + dx:1 + dx + w], free[1:-1, 1:-1], out=out[d])
+        return out
+
+    def neighbors4_bulk(self, cells: np.ndarray) -> np.ndarray:
+        """Passability of the 4 neighbors of many cells at once.
+
+        `cells` is an (n, 2) integer array of (x, y) coordinates inside the
+        grid. Returns an (n, 4) bool array ordered like DIRECTIONS4, matching
+        `neighbors4` cell by cell.
+        """
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        free = np.frombuffer(self._free, dtype=bool)
+        idx = (cells[:, 1] + 1) * self._stride + cells[:, 0] + 1
+        s = self._stride
+        offsets = np.array([-s, s, -1, 1], dtype=np.intp)
+        return free[idx[:, None] + offsets]
 
     # ---------------- PARTIAL OBSERVABILITY ----------------
 
@@ -78,18 +253,13 @@ class MazeWorld:
         title_prefix: str,
         save_dir: str,
     ) -> None:
-        os.makedirs(save_dir, exist_ok=True)
+        import matplotlib
+        matplotlib.use("Agg")  # FORCE FILE OUTPUT (no GUI)
+        import matplotlib.pyplot as plt
 
-        img = np.zeros((self.height, self.width))
-        img[self.known_map == -1] = 0.5
-        img[self.known_map == 0] = 1.0
-        img[self.known_map == 1] = 0.0
-
-        ax, ay = agent_pos
-        gx, gy = self.goal
+        os.makedirs(save_dir, exist_ok=True)
 
-        img[ay, ax] = 0.8
-        img[gy, gx] = 0.3
+        img = belief_image(self.known_map, agent_pos, self.goal)
 
         plt.figure(figsize=(5,5))
         plt.imshow(img, cmap="gray")
@@ -100,3 +270,43 @@ class MazeWorld:
         path = os.path.join(save_dir, f"{title_prefix}_{step_id}.png")
         plt.savefig(path, bbox_inches="tight")
         plt.close()
+
+
+def belief_image(known_map: np.ndarray, agent_pos: Coordinate, goal: Coordinate) -> np.ndarray:
+    """Gray-level image of a belief map: unknown 0.5, free 1.0, wall 0.0,
+    agent 0.8, goal 0.3 (as drawn by visualize_known_map)."""
+    img = np.zeros(known_map.shape)
+    img[known_map == -1] = 0.5
+    img[known_map == 0] = 1.0
+    img[known_map == 1] = 0.0
+
+    ax, ay = agent_pos
+    gx, gy = goal
+
+    img[ay, ax] = 0.8
+    img[gy, gx] = 0.3
+    return img
+
+
+# ---------------- PARSING HELPERS ----------------
+
+def _char_array(grid: Sequence[Sequence[str]]) -> np.ndarray:
+    """Rows of 1-char cells (lists or strings) -> (height, width) uint8 array."""
+    if isinstance(grid, np.ndarray) and grid.dtype == np.uint8:
+        return grid
+    rows = [r if isinstance(r, str) else "".join(r) for r in grid]
+    width = len(rows[0]) if rows else 0
+    for y, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"ragged maze: row {y} has {len(row)} cells, expected {width}")
+    data = "".join(rows).encode("latin-1", errors="replace")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(rows), width)
+
+
+def _find_byte(cells: np.ndarray, symbol: str) -> Optional[Coordinate]:
+    """First (x, y) in row-major order where `cells` holds `symbol`."""
+    hits = np.flatnonzero(cells.ravel() == ord(symbol))
+    if hits.size == 0:
+        return None
+    y, x = divmod(int(hits[0]), cells.shape[1])
+    return x, y
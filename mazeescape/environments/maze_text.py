@@ -0,0 +1,136 @@
+"""
+mazeescape/environments/maze_text.py
+
+Streaming parser for the text maze format (mazes/*.txt).
+
+The file is read in fixed-size chunks of raw bytes; each chunk is split
+into rows with numpy (newline positions, CR stripping, blank-line removal),
+validated and written straight into a preallocated boolean wall array.
+S / G are located with a vectorized search of each chunk. Working memory
+is a few chunks no matter how large the file is -- the only allocation
+that grows with the maze is the wall array itself.
+
+Cells are single bytes ('#' wall, 'S' start, 'G' goal, anything else
+free). Blank or whitespace-only lines are skipped, as in the old
+line-based loader, and rows must all have the same width.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+Coordinate = Tuple[int, int]
+
+CHUNK_SIZE = 1 << 22  # bytes per read (4 MiB)
+
+_NL, _CR = ord("\n"), ord("\r")
+_WALL, _START, _GOAL = ord("#"), ord("S"), ord("G")
+_BLANK = b" \t\r\x0b\x0c"
+
+
+def _first(block: np.ndarray, symbol: int, y0: int) -> Optional[Coordinate]:
+    """First (x, y) in row-major order where `block` holds `symbol` (rows start at y0)."""
+    hits = np.flatnonzero(block == symbol)
+    if hits.size == 0:
+        return None
+    y, x = divmod(int(hits[0]), block.shape[1])
+    return x, y0 + y
+
+
+def read_text_maze(
+    path: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[np.ndarray, Optional[Coordinate], Optional[Coordinate]]:
+    """(walls, start, goal) of a text maze; walls is a (height, width) bool array."""
+    size = os.path.getsize(path)
+    walls: Optional[np.ndarray] = None
+    width = height = 0
+    start: Optional[Coordinate] = None
+    goal: Optional[Coordinate] = None
+    tail = b""
+
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            final = not chunk
+            data = tail + chunk
+            if final:
+                if not data:
+                    break
+                data += b"\n"  # last line without a trailing newline
+
+            buf = np.frombuffer(data, dtype=np.uint8)
+            newlines = np.flatnonzero(buf == _NL)
+            if newlines.size == 0:
+                tail = data
+                continue
+            tail = data[newlines[-1] + 1:]
+
+            # Row extents [begin, end) without the newline and a trailing CR
+            begin = np.empty_like(newlines)
+            begin[0] = 0
+            begin[1:] = newlines[:-1] + 1
+            end = newlines.copy()
+            end[(end > begin) & (buf[end - 1] == _CR)] -= 1
+            length = end - begin
+
+            if walls is None:
+                first = next(
+                    (int(r) for r in np.flatnonzero(length) if data[begin[r]:end[r]].strip(_BLANK)),
+                    None,
+                )
+                if first is None:
+                    if final:
+                        break
+                    continue
+                width = int(length[first])
+                # Every row takes at least width + 1 bytes, so this is an upper bound
+                walls = np.empty((size // (width + 1) + 1, width), dtype=bool)
+
+            keep = length == width
+            if not keep.all():
+                for r in np.flatnonzero(~keep & (length > 0)):
+                    if data[begin[r]:end[r]].strip(_BLANK):
+                        raise ValueError(
+                            f"ragged maze: row {height + int(np.count_nonzero(keep[:r]))} "
+                            f"has {int(length[r])} cells, expected {width}"
+                        )
+                begin = begin[keep]
+            rows = len(begin)
+            if rows == 0:
+                if final:
+                    break
+                continue
+
+            # Kept rows as one (rows, width) block: a strided view when the
+            # rows are evenly spaced (LF or CRLF files), a gather otherwise
+            stride = int(begin[1] - begin[0]) if rows > 1 else width + 1
+            if (
+                stride in (width + 1, width + 2)
+                and begin[-1] + stride <= buf.size
+                and np.all(np.diff(begin) == stride)
+            ):
+                block = buf[begin[0]:begin[0] + rows * stride].reshape(rows, stride)[:, :width]
+            else:
+                block = buf[begin[:, None] + np.arange(width)]
+            blank = (block <= 32).all(axis=1)  # whitespace-only rows of full width
+            if blank.any():
+                block = block[~blank]
+                rows = len(block)
+
+            np.equal(block, _WALL, out=walls[height:height + rows])
+            if start is None:
+                start = _first(block, _START, height)
+            if goal is None:
+                goal = _first(block, _GOAL, height)
+            height += rows
+
+            if final:
+                break
+
+    if walls is None:
+        return np.zeros((0, 0), dtype=bool), None, None
+    return walls[:height], start, goal
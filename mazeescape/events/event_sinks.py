@@ -0,0 +1,142 @@
+"""
+mazeescape/events/event_sinks.py
+
+Pluggable sinks for the events emitted by the online agent.
+
+online_astar reports what it does ([STATE], [SEARCH], [PERCEPT], [ACTION],
+ASCII grid snapshots, [SUMMARY]) as events instead of printing them. An
+event is a plain dict with an "event" kind plus JSON-friendly fields.
+
+Sinks:
+  - NullSink        : drops everything (default; no I/O, for benchmarks)
+  - RingBufferSink  : keeps the last N events in memory
+  - JsonlSink       : one JSON object per line in a file
+  - ConsoleSink     : the classic academic console log
+  - MultiSink       : fan out to several sinks
+  (mazeescape.events.trace_recorder.TraceRecorder records a binary trace)
+
+ASCII snapshots are expensive (a full W x H string per step), so they are
+only rendered when a sink sets `wants_snapshots = True`.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import IO, Any, Deque, Dict, List, Optional, Union
+
+Event = Dict[str, Any]
+
+# Event kinds emitted by online_astar
+START = "start"            # agent, goal
+SEARCH = "search"          # planner, heuristic, call
+PLAN = "plan"              # call, expansions (this plan only), latency_ms, length
+PERCEPT = "percept"        # wall
+REPLAN = "replan"          # planner (current plan blocked)
+ACTION = "action"          # cell, step
+SNAPSHOT = "snapshot"      # step, ascii (known map; only if wants_snapshots)
+SUMMARY = "summary"        # calls, replans
+FINAL_PATH = "final_path"  # ascii (final path; only if wants_snapshots)
+
+
+class EventSink:
+    """Base sink: ignores every event."""
+
+    wants_snapshots = False
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "EventSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class NullSink(EventSink):
+    """Quiet default: no output, no snapshots."""
+
+
+class RingBufferSink(EventSink):
+    """Keep the most recent `capacity` events in memory (`events`)."""
+
+    def __init__(self, capacity: int = 1024, snapshots: bool = False) -> None:
+        self.events: Deque[Event] = deque(maxlen=capacity)
+        self.wants_snapshots = snapshots
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        fields["event"] = kind
+        self.events.append(fields)
+
+    def of_kind(self, kind: str) -> List[Event]:
+        return [e for e in self.events if e["event"] == kind]
+
+
+class JsonlSink(EventSink):
+    """Write events as JSON lines to a path or an open text file."""
+
+    def __init__(self, target: Union[str, IO[str]], snapshots: bool = False) -> None:
+        self._owns = isinstance(target, str)
+        self._file: Optional[IO[str]] = open(target, "w", encoding="utf-8") if self._owns else target
+        self.wants_snapshots = snapshots
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        fields["event"] = kind
+        self._file.write(json.dumps(fields) + "\n")
+
+    def close(self) -> None:
+        if self._file is not None and self._owns:
+            self._file.close()
+        self._file = None
+
+
+class MultiSink(EventSink):
+    """Forward every event to several sinks."""
+
+    def __init__(self, *sinks: EventSink) -> None:
+        self.sinks = [s for s in sinks if s is not None]
+        self.wants_snapshots = any(s.wants_snapshots for s in self.sinks)
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        for sink in self.sinks:
+            sink.emit(kind, **fields)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+class ConsoleSink(EventSink):
+    """Print the academic log format used by the experiment scripts."""
+
+    def __init__(self, snapshots: bool = True) -> None:
+        self.wants_snapshots = snapshots
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        if kind == START:
+            print(f"\n[STATE] Agent at {fields['agent']}")
+            print(f"[GOAL] Goal at {fields['goal']}")
+        elif kind == SNAPSHOT:
+            print(f"\n[GRID] Step {fields['step']}")
+            print(fields["ascii"])
+        elif kind == SEARCH:
+            print(f"\n[SEARCH] {fields['planner']} planning (heuristic = {fields['heuristic']})")
+            print(f"[SEARCH] {fields['planner']} called (call #{fields['call']})")
+        elif kind == PERCEPT:
+            print(f"[PERCEPT] Obstacle discovered at {fields['wall']}")
+        elif kind == REPLAN:
+            print("[SEARCH] Current plan invalid")
+            print(f"[SEARCH] Replanning with {fields['planner']}")
+        elif kind == ACTION:
+            print(f"[ACTION] Moving to {fields['cell']}")
+        elif kind == SUMMARY:
+            print("\n[SUMMARY]")
+            print(f"A* calls : {fields['calls']}")
+            print(f"Replans  : {fields['replans']}")
+        elif kind == FINAL_PATH:
+            print("\n[FINAL PATH – ASCII]")
+            print(fields["ascii"])
@@ -0,0 +1,160 @@
+"""
+mazeescape/events/trace_recorder.py
+
+Compact columnar traces of online runs, and their reconstruction.
+
+TraceRecorder is an EventSink: pass it (or a MultiSink containing it) as
+`online_astar(..., events=...)`, or use `online_astar(..., trace_path=...)`.
+It stores only small integer columns:
+
+  walls_packed      np.packbits of the true wall grid (+ height, width)
+  start, goal       (x, y)
+  positions         int32 (steps + 1, 2)  agent cell after each step
+  wall_cells        int32 (m, 2)          walls sensed by the agent, in order
+  wall_steps        int32 (m,)            step at which each wall was sensed
+  replan_steps      int32 (r,)            step at which each plan was made
+  replan_expansions int32 (r,)            expansions of that plan
+  replan_latency_ms float32 (r,)          planning wall time
+
+Saved either as one `.npz` file (compressed) or, for any other path, as a
+directory of `.npy` columns that `load_trace(..., mmap=True)` opens with
+np.load(mmap_mode="r").
+
+Trace.known_map(step) rebuilds the belief map drawn by
+MazeWorld.visualize_known_map at any step, so frames can be rendered long
+after the run (see mazeescape/experiments/replay_trace.py).
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+from mazeescape.events import event_sinks as ev
+from mazeescape.events.event_sinks import EventSink
+
+# Cells revealed by MazeWorld.sense(pos): the cell itself and its 4 neighbors
+_SENSE_OFFSETS = np.array([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+
+
+class TraceRecorder(EventSink):
+    """Collect an online run into columnar arrays."""
+
+    def __init__(self, world: MazeWorld) -> None:
+        self.world = world
+        self.positions: List[Coordinate] = []
+        self.wall_cells: List[Coordinate] = []
+        self.wall_steps: List[int] = []
+        self.replan_steps: List[int] = []
+        self.replan_expansions: List[int] = []
+        self.replan_latency_ms: List[float] = []
+        self._step = 0
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        if kind == ev.ACTION:
+            self._step = fields["step"]
+            self.positions.append(fields["cell"])
+        elif kind == ev.PERCEPT:
+            self.wall_cells.append(fields["wall"])
+            self.wall_steps.append(self._step)
+        elif kind == ev.PLAN:
+            self.replan_steps.append(self._step)
+            self.replan_expansions.append(fields["expansions"])
+            self.replan_latency_ms.append(fields["latency_ms"])
+        elif kind == ev.START:
+            self.positions = [fields["agent"]]
+
+    def to_trace(self) -> "Trace":
+        world = self.world
+        return Trace(
+            {
+                "height": np.int32(world.height),
+                "width": np.int32(world.width),
+                "walls_packed": np.packbits(world.walls, axis=None),
+                "start": np.array(world.start, dtype=np.int32),
+                "goal": np.array(world.goal, dtype=np.int32),
+                "positions": np.array(self.positions, dtype=np.int32).reshape(-1, 2),
+                "wall_cells": np.array(self.wall_cells, dtype=np.int32).reshape(-1, 2),
+                "wall_steps": np.array(self.wall_steps, dtype=np.int32),
+                "replan_steps": np.array(self.replan_steps, dtype=np.int32),
+                "replan_expansions": np.array(self.replan_expansions, dtype=np.int32),
+                "replan_latency_ms": np.array(self.replan_latency_ms, dtype=np.float32),
+            }
+        )
+
+    def save(self, path: str) -> None:
+        self.to_trace().save(path)
+
+
+@dataclass
+class Trace:
+    """A recorded online run (see module docstring for the columns)."""
+
+    columns: Dict[str, np.ndarray]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def steps(self) -> int:
+        return len(self.columns["positions"]) - 1
+
+    @property
+    def shape(self):
+        return int(self.columns["height"]), int(self.columns["width"])
+
+    def walls(self) -> np.ndarray:
+        h, w = self.shape
+        return np.unpackbits(self.columns["walls_packed"], count=h * w).reshape(h, w).astype(bool)
+
+    def world(self) -> MazeWorld:
+        """A fresh MazeWorld for the traced maze (nothing sensed yet)."""
+        start = tuple(int(v) for v in self.columns["start"])
+        goal = tuple(int(v) for v in self.columns["goal"])
+        return MazeWorld.from_array(self.walls(), start, goal)  # type: ignore[arg-type]
+
+    def first_seen(self) -> np.ndarray:
+        """(height, width) int32: step at which each cell was first sensed (-1 = never)."""
+        h, w = self.shape
+        pos = self.columns["positions"].astype(np.int64)
+        steps = np.repeat(np.arange(len(pos), dtype=np.int64), len(_SENSE_OFFSETS))
+        cells = (pos[:, None, :] + _SENSE_OFFSETS).reshape(-1, 2)
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < w) & (cells[:, 1] >= 0) & (cells[:, 1] < h)
+        flat = np.full(h * w, np.iinfo(np.int32).max, dtype=np.int64)
+        np.minimum.at(flat, cells[inside, 1] * w + cells[inside, 0], steps[inside])
+        flat[flat == np.iinfo(np.int32).max] = -1
+        return flat.reshape(h, w).astype(np.int32)
+
+    def known_map(self, step: int, first_seen: Optional[np.ndarray] = None) -> np.ndarray:
+        """Belief map (-1 unknown, 0 free, 1 wall) after `step` moves."""
+        if first_seen is None:
+            first_seen = self.first_seen()
+        known = (first_seen >= 0) & (first_seen <= step)
+        return np.where(known, self.walls().astype(int), -1)
+
+    def save(self, path: str) -> None:
+        if path.endswith(".npz"):
+            np.savez_compressed(path, **self.columns)
+            return
+        os.makedirs(path, exist_ok=True)
+        for name, arr in self.columns.items():
+            np.save(os.path.join(path, f"{name}.npy"), arr)
+
+
+def load_trace(path: str, mmap: bool = False) -> Trace:
+    """Load a trace saved as `.npz` or as a directory of `.npy` columns."""
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return Trace({name: data[name] for name in data.files})
+    mode = "r" if mmap else None
+    return Trace(
+        {
+            name[:-4]: np.load(os.path.join(path, name), mmap_mode=mode)
+            for name in sorted(os.listdir(path))
+            if name.endswith(".npy")
+        }
+    )
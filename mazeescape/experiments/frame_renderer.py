@@ -0,0 +1,165 @@
+"""
+mazeescape/experiments/frame_renderer.py
+
+Off-thread, batched rendering of per-step belief-map frames.
+
+The agent loop only calls `capture(pos)`, which copies the world's
+`known_map` (as int8) into the current batch. Full batches go to a
+process pool; each worker keeps ONE matplotlib figure / AxesImage alive
+and just swaps the image data between frames, instead of creating a new
+figure per step. The frames look exactly like
+MazeWorld.visualize_known_map output.
+
+Output is either one PNG per step (`<prefix>_<step>.png`, as before) or a
+single animated GIF (`animation="run.gif"`).
+
+Usage:
+    with FrameRenderer(world, "Manhattan", save_dir) as renderer:
+        online_astar(world, h, step_callback=renderer.capture)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld, belief_image
+
+Frame = Tuple[int, Coordinate, np.ndarray]  # (step_id, agent_pos, known_map)
+
+# Per-worker matplotlib state (created once by _init_worker)
+_FIG = None
+_AX = None
+_IMAGE = None
+
+
+def _init_worker() -> None:
+    global _FIG, _AX
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    _FIG = plt.figure(figsize=(5, 5))
+    _AX = _FIG.gca()
+    _AX.set_xticks([])
+    _AX.set_yticks([])
+
+
+def _draw(img: np.ndarray, title: str) -> None:
+    global _IMAGE
+    if _IMAGE is None or _IMAGE.get_array().shape != img.shape:
+        _AX.clear()
+        _IMAGE = _AX.imshow(img, cmap="gray")
+        _AX.set_xticks([])
+        _AX.set_yticks([])
+    else:
+        _IMAGE.set_data(img)
+    _IMAGE.set_clim(img.min(), img.max())  # imshow autoscales each new figure
+    _AX.set_title(title)
+
+
+def _render_batch(
+    frames: List[Frame],
+    goal: Coordinate,
+    title_prefix: str,
+    save_dir: Optional[str],
+) -> List[np.ndarray]:
+    """Render frames to PNG files (save_dir) or return them as RGB arrays."""
+    if _FIG is None:
+        _init_worker()
+    rgb: List[np.ndarray] = []
+    for step_id, agent_pos, known_map in frames:
+        _draw(belief_image(known_map, agent_pos, goal), f"{title_prefix} {step_id}")
+        if save_dir is not None:
+            path = os.path.join(save_dir, f"{title_prefix}_{step_id}.png")
+            _FIG.savefig(path, bbox_inches="tight")
+        else:
+            _FIG.canvas.draw()
+            rgb.append(np.asarray(_FIG.canvas.buffer_rgba())[..., :3].copy())
+    return rgb
+
+
+class FrameRenderer:
+    """Capture belief-map frames in the agent loop and render them in the background."""
+
+    def __init__(
+        self,
+        world: MazeWorld,
+        title_prefix: str,
+        save_dir: str,
+        *,
+        workers: int = 2,
+        batch_size: int = 32,
+        animation: Optional[str] = None,
+        fps: int = 4,
+    ) -> None:
+        os.makedirs(save_dir, exist_ok=True)
+        self.world = world
+        self.title_prefix = title_prefix
+        self.save_dir = save_dir
+        self.batch_size = batch_size
+        self.animation = animation
+        self.fps = fps
+
+        self._step = 0
+        self._written: List[int] = []
+        self._batch: List[Frame] = []
+        self._pending: List[Future] = []
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    def capture(self, agent_pos: Coordinate) -> None:
+        """Step callback: snapshot the belief map; rendering happens elsewhere."""
+        self.add_frame(self._step, agent_pos, self.world.known_map)
+
+    def add_frame(self, step_id: int, agent_pos: Coordinate, known_map: np.ndarray) -> None:
+        """Queue an explicit frame (e.g. one rebuilt from a recorded trace)."""
+        self._batch.append((step_id, agent_pos, known_map.astype(np.int8)))
+        self._written.append(step_id)
+        self._step = step_id + 1
+        if len(self._batch) >= self.batch_size:
+            self._submit()
+
+    def _submit(self) -> None:
+        if not self._batch:
+            return
+        target = None if self.animation else self.save_dir
+        self._pending.append(
+            self._pool.submit(_render_batch, self._batch, self.world.goal, self.title_prefix, target)
+        )
+        self._batch = []
+
+    def close(self) -> List[str]:
+        """Flush, wait for all batches and return the written file paths."""
+        self._submit()
+        frames = [rgb for fut in self._pending for rgb in fut.result()]
+        self._pending = []
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        if self.animation:
+            from PIL import Image
+
+            path = os.path.join(self.save_dir, self.animation)
+            images = [Image.fromarray(f) for f in frames]
+            if images:
+                images[0].save(
+                    path,
+                    save_all=True,
+                    append_images=images[1:],
+                    duration=int(1000 / self.fps),
+                    loop=0,
+                )
+            return [path]
+        return [os.path.join(self.save_dir, f"{self.title_prefix}_{i}.png") for i in self._written]
+
+    def __enter__(self) -> "FrameRenderer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._pool is not None:
+            self.close()
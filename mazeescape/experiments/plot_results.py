@@ -1,68 +1,118 @@
 """
 plot_results.py
 
-Very simple bar charts for:
-1) Offline vs Online A* comparison
-2) Manhattan vs Euclidean comparison
+Very simple bar charts built from run_matrix.py result files:
+1) Offline vs Online A* comparison (mean node expansions per algorithm)
+2) Manhattan vs Euclidean comparison (mean online wall time per heuristic)
+
+Usage:
+  python -m mazeescape.experiments.run_matrix          # writes results/matrix.*
+  python -m mazeescape.experiments.plot_results [--results results/matrix.jsonl]
 """
 
+import argparse
+import csv
+import json
+from collections import defaultdict
 from pathlib import Path
-import matplotlib.pyplot as plt
+from typing import Dict, List
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 FIG_DIR = BASE_DIR / "figures" / "plots"
-FIG_DIR.mkdir(parents=True, exist_ok=True)
+RESULTS_PATH = BASE_DIR / "results" / "matrix.jsonl"
 
+_NUMERIC = ("expansions", "replans", "path_cost", "path_length", "wall_ms", "peak_rss_mib")
+
+
+def _pyplot():
+    """Import pyplot on first use (headless backend, output dir created)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    FIG_DIR.mkdir(parents=True, exist_ok=True)
+    return plt
+
+
+def load_results(path) -> List[Dict]:
+    """Successful rows from a run_matrix .jsonl or .csv file."""
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as fh:
+        if path.suffix == ".csv":
+            rows = list(csv.DictReader(fh))
+            for row in rows:
+                for key in _NUMERIC:
+                    row[key] = float(row[key]) if row.get(key) else None
+        else:
+            rows = [json.loads(line) for line in fh if line.strip()]
+    return [row for row in rows if row["status"] == "ok"]
 
-def plot_offline_vs_online():
-    """
-    Offline vs Online A* comparison
-    Metric: node expansions
-    """
 
-    labels = ["Offline A*", "Online A*"]
-    node_expansions = [
-        14,   # Offline (from your output)
-        40,   # Online (approx / average from your runs)
-    ]
+def mean_by(rows: List[Dict], key: str, metric: str) -> Dict[str, float]:
+    """Mean of `metric` grouped by `key` (first-seen group order)."""
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row[key]].append(row[metric])
+    return {name: sum(values) / len(values) for name, values in groups.items()}
 
-    plt.figure(figsize=(5, 4))
-    plt.bar(labels, node_expansions)
-    plt.ylabel("Node Expansions")
-    plt.title("Offline vs Online A* Comparison")
+
+def _bar_chart(values: Dict[str, float], ylabel: str, title: str, filename: str) -> None:
+    plt = _pyplot()
+    plt.figure(figsize=(max(5, 1.2 * len(values)), 4))
+    plt.bar(list(values), list(values.values()))
+    plt.ylabel(ylabel)
+    plt.title(title)
 
     plt.tight_layout()
-    plt.savefig(FIG_DIR / "offline_vs_online.png")
+    plt.savefig(FIG_DIR / filename)
     plt.close()
 
 
-def plot_manhattan_vs_euclidean():
+def plot_offline_vs_online(rows: List[Dict]) -> None:
+    """
+    Offline vs Online A* comparison
+    Metric: node expansions (mean over mazes, heuristics and seeds)
+    """
+
+    _bar_chart(
+        mean_by(rows, "algorithm", "expansions"),
+        ylabel="Node Expansions",
+        title="Offline vs Online A* Comparison",
+        filename="offline_vs_online.png",
+    )
+
+
+def plot_manhattan_vs_euclidean(rows: List[Dict]) -> None:
     """
     Manhattan vs Euclidean comparison
-    Metric: execution time (ms)
+    Metric: execution time (ms) of the online runs
     """
 
-    labels = ["Manhattan", "Euclidean"]
-    times_ms = [
-        2166,  # Online Manhattan time (ms)
-        792,   # Online Euclidean time (ms)
-    ]
+    online = [row for row in rows if row["algorithm"].startswith("online")] or rows
+    _bar_chart(
+        mean_by(online, "heuristic", "wall_ms"),
+        ylabel="Time (ms)",
+        title="Manhattan vs Euclidean (Online A*)",
+        filename="manhattan_vs_euclidean.png",
+    )
 
-    plt.figure(figsize=(5, 4))
-    plt.bar(labels, times_ms)
-    plt.ylabel("Time (ms)")
-    plt.title("Manhattan vs Euclidean (Online A*)")
 
-    plt.tight_layout()
-    plt.savefig(FIG_DIR / "manhattan_vs_euclidean.png")
-    plt.close()
+def main(results_path=RESULTS_PATH):
+    if not Path(results_path).exists():
+        print(f"No results at {results_path}; run `python -m mazeescape.experiments.run_matrix` first.")
+        return
 
+    rows = load_results(results_path)
+    if not rows:
+        print(f"No successful runs in {results_path}.")
+        return
 
-def main():
-    plot_offline_vs_online()
-    plot_manhattan_vs_euclidean()
+    plot_offline_vs_online(rows)
+    plot_manhattan_vs_euclidean(rows)
     print("Bar charts saved to:", FIG_DIR)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Bar charts from run_matrix results")
+    parser.add_argument("--results", default=str(RESULTS_PATH), help="run_matrix .jsonl or .csv file")
+    main(parser.parse_args().results)
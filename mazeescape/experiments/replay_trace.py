@@ -0,0 +1,97 @@
+"""
+mazeescape/experiments/replay_trace.py
+
+Replay a trace recorded by online_astar(..., trace_path=...).
+
+Rebuilds the agent's belief map at any step (ASCII), prints the run's
+replan statistics, or renders a range of frames (PNG or one GIF) with the
+background FrameRenderer, so production runs never pay for rendering.
+
+Usage:
+  python -m mazeescape.experiments.replay_trace run.npz --info
+  python -m mazeescape.experiments.replay_trace run.npz --step 40
+  python -m mazeescape.experiments.replay_trace run.npz --frames 0:200 --out figures/replay [--gif]
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional
+
+import numpy as np
+
+from mazeescape.events.trace_recorder import Trace, load_trace
+from mazeescape.experiments.frame_renderer import FrameRenderer
+
+_CHARS = np.array(["?", ".", "#"])  # indexed by known_map + 1
+
+
+def render_step_ascii(trace: Trace, step: int) -> str:
+    """Belief map after `step` moves, drawn like the [GRID] console snapshots."""
+    rows = _CHARS[trace.known_map(step) + 1]
+    gx, gy = (int(v) for v in trace["goal"])
+    ax, ay = (int(v) for v in trace["positions"][step])
+    rows[gy, gx] = "G"
+    rows[ay, ax] = "A"
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def render_frames(
+    trace: Trace,
+    start: int,
+    stop: int,
+    save_dir: str,
+    title_prefix: str = "Replay",
+    animation: Optional[str] = None,
+) -> List[str]:
+    """Render steps [start, stop) of the trace; returns the written files."""
+    first_seen = trace.first_seen()
+    walls = trace.walls().astype(int)
+    positions = trace["positions"]
+    with FrameRenderer(trace.world(), title_prefix, save_dir, animation=animation) as renderer:
+        for step in range(start, min(stop, trace.steps + 1)):
+            known = (first_seen >= 0) & (first_seen <= step)
+            pos = (int(positions[step][0]), int(positions[step][1]))
+            renderer.add_frame(step, pos, np.where(known, walls, -1))
+        return renderer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded online run")
+    parser.add_argument("trace", help=".npz file or .npy column directory")
+    parser.add_argument("--info", action="store_true", help="print run statistics")
+    parser.add_argument("--step", type=int, help="print the belief map after this many moves")
+    parser.add_argument("--frames", help="render a step range START:STOP")
+    parser.add_argument("--out", default="figures/replay", help="output directory for --frames")
+    parser.add_argument("--gif", action="store_true", help="write one animated GIF instead of PNGs")
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace, mmap=True)
+
+    if args.info or (args.step is None and args.frames is None):
+        h, w = trace.shape
+        exp = trace["replan_expansions"]
+        print(f"Maze        : {w}x{h}")
+        print(f"Steps       : {trace.steps}")
+        print(f"Walls sensed: {len(trace['wall_cells'])}")
+        print(f"Plans       : {len(exp)} at steps {trace['replan_steps'].tolist()}")
+        print(f"Expansions  : {int(exp.sum())} total, {exp.tolist()} per plan")
+
+    if args.step is not None:
+        print(f"\n[GRID] Step {args.step}")
+        print(render_step_ascii(trace, args.step))
+
+    if args.frames is not None:
+        start, _, stop = args.frames.partition(":")
+        written = render_frames(
+            trace,
+            int(start or 0),
+            int(stop) if stop else trace.steps + 1,
+            args.out,
+            animation="replay.gif" if args.gif else None,
+        )
+        print(f"[FIGURE] {len(written)} file(s) written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
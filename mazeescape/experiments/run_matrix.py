@@ -0,0 +1,285 @@
+"""
+mazeescape/experiments/run_matrix.py
+
+Experiment matrix runner: mazes x algorithms x heuristics x seeds.
+
+Every combination is one independent run executed in a process pool.
+Per-run metrics are streamed to <out>.jsonl and <out>.csv as soon as the
+run finishes (completion order, not submission order), so a long matrix
+can be inspected -- or plotted with plot_results.py -- while it is still
+going.
+
+Maze specs:
+  maze1.txt / path/to/maze.txt   a maze file (bare names resolve to mazes/)
+  KIND:WxH[:key=value...]        seeded maze_generator maze, e.g.
+                                 kruskal:257x257, rooms:512x512:room=24,
+                                 obstacles:256x256:density=0.3
+  random:WxH[:density]           shorthand for obstacles:WxH:density=...
+
+Algorithm specs:
+  offline[:engine]               run_offline engines: aima (default), grid, jps,
+                                 bidirectional, hpa, field
+  online[:planner]               online_astar planners: astar (default),
+                                 dstar_lite, adaptive, rtaa, jps, hpa, field
+
+Recorded per run: expansions, replans, path_cost, path_length, wall_ms,
+peak_rss_mib and status ("ok" / "error" with the message in `error`).
+
+Usage:
+  python -m mazeescape.experiments.run_matrix
+  python -m mazeescape.experiments.run_matrix --mazes maze1.txt kruskal:129x129 \\
+      --algorithms offline offline:grid online online:dstar_lite \\
+      --heuristics manhattan euclidean --seeds 0 1 2 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from mazeescape.algorithms.online_astar import PLANNERS, online_astar
+from mazeescape.environments.maze_generator import GENERATORS, generate_maze
+from mazeescape.environments.maze_grid_world import MazeWorld
+from mazeescape.experiments.run_offline import ENGINES
+from mazeescape.heuristics.heuristics import euclidean_distance, manhattan_distance
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+MAZE_DIR = BASE_DIR / "mazes"
+RESULTS_PREFIX = BASE_DIR / "results" / "matrix"
+
+HEURISTICS = {
+    "manhattan": manhattan_distance,
+    "euclidean": euclidean_distance,
+}
+
+FIELDS = [
+    "maze", "width", "height", "algorithm", "heuristic", "seed", "status",
+    "expansions", "replans", "path_cost", "path_length", "wall_ms",
+    "peak_rss_mib", "error",
+]
+
+
+# =========================================================
+# SPECS
+# =========================================================
+
+def parse_algorithm(spec: str):
+    """'offline[:engine]' / 'online[:planner]' -> (mode, variant)."""
+    mode, _, variant = spec.partition(":")
+    if mode == "offline":
+        variant = variant or "aima"
+        if variant not in ENGINES:
+            raise ValueError(f"unknown offline engine {variant!r}; expected one of {sorted(ENGINES)}")
+    elif mode == "online":
+        variant = variant or "astar"
+        if variant not in PLANNERS:
+            raise ValueError(f"unknown online planner {variant!r}; expected one of {sorted(PLANNERS)}")
+    else:
+        raise ValueError(f"algorithm must be offline[:engine] or online[:planner], got {spec!r}")
+    return mode, variant
+
+
+def load_maze(spec: str, seed: int) -> MazeWorld:
+    """Build the world for a maze spec (see module docstring)."""
+    kind, _, rest = spec.partition(":")
+    if kind == "random" or kind in GENERATORS:
+        size, *params = rest.split(":")
+        width, height = (int(v) for v in size.lower().split("x"))
+        if kind == "random":
+            kind = "obstacles"
+            params = [f"density={p}" for p in params]
+        options = {}
+        for param in params:
+            name, _, value = param.partition("=")
+            options[name] = float(value) if "." in value else int(value)
+        return generate_maze(kind, width, height, seed=seed, **options)
+
+    path = Path(spec)
+    if not path.is_absolute() and not path.exists():
+        path = MAZE_DIR / spec
+    return MazeWorld.from_file(str(path))
+
+
+def expand_matrix(
+    mazes: Iterable[str],
+    algorithms: Iterable[str],
+    heuristics: Iterable[str],
+    seeds: Iterable[int],
+) -> List[Dict[str, Any]]:
+    """Cartesian product of the axes as a list of job dicts (validated)."""
+    algorithms = list(algorithms)
+    for spec in algorithms:
+        parse_algorithm(spec)
+    heuristics = list(heuristics)
+    for name in heuristics:
+        if name not in HEURISTICS:
+            raise ValueError(f"unknown heuristic {name!r}; expected one of {sorted(HEURISTICS)}")
+
+    return [
+        {"maze": maze, "algorithm": algorithm, "heuristic": heuristic, "seed": seed}
+        for maze, algorithm, heuristic, seed in itertools.product(mazes, algorithms, heuristics, seeds)
+    ]
+
+
+# =========================================================
+# PEAK MEMORY
+# =========================================================
+
+def _reset_peak_rss() -> bool:
+    """Reset the process high-water mark (Linux only); False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mib() -> Optional[float]:
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Lifetime maximum of the worker (KiB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+# =========================================================
+# ONE RUN (executed in a worker process)
+# =========================================================
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {field: None for field in FIELDS}
+    row.update(job)
+    try:
+        mode, variant = parse_algorithm(job["algorithm"])
+        heuristic = HEURISTICS[job["heuristic"]]
+        world = load_maze(job["maze"], job["seed"])
+        row["width"], row["height"] = world.width, world.height
+
+        _reset_peak_rss()
+        t0 = time.perf_counter()
+        if mode == "offline":
+            path, metrics = ENGINES[variant](world, heuristic=heuristic)
+            replans = 0
+        else:
+            path, replans, metrics = online_astar(world, heuristic, planner=variant)
+        row["wall_ms"] = (time.perf_counter() - t0) * 1000
+        row["peak_rss_mib"] = _peak_rss_mib()
+
+        row.update(
+            status="ok",
+            expansions=int(metrics["node_expansions"]),
+            replans=int(replans),
+            path_cost=float(metrics["path_cost"]),
+            path_length=len(path),
+        )
+    except Exception as exc:  # a failed cell must not take the matrix down
+        row.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    return row
+
+
+def run_matrix(jobs: List[Dict[str, Any]], workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield result rows as runs finish. workers=0 runs in-process."""
+    if workers == 0:
+        for job in jobs:
+            yield run_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# =========================================================
+# STREAMING OUTPUT
+# =========================================================
+
+class ResultWriter:
+    """Append rows to <prefix>.jsonl and <prefix>.csv, flushing every row."""
+
+    def __init__(self, prefix: Path) -> None:
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        self.jsonl_path = prefix.with_suffix(".jsonl")
+        self.csv_path = prefix.with_suffix(".csv")
+        self._jsonl = open(self.jsonl_path, "w", encoding="utf-8")
+        self._csv_fh = open(self.csv_path, "w", encoding="utf-8", newline="")
+        self._csv = csv.DictWriter(self._csv_fh, fieldnames=FIELDS)
+        self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._jsonl.write(json.dumps(row) + "\n")
+        self._jsonl.flush()
+        self._csv.writerow(row)
+        self._csv_fh.flush()
+
+    def close(self) -> None:
+        self._jsonl.close()
+        self._csv_fh.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# =========================================================
+# MAIN
+# =========================================================
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a maze x algorithm x heuristic x seed matrix")
+    parser.add_argument("--mazes", nargs="+", default=["maze1.txt"])
+    parser.add_argument("--algorithms", nargs="+", default=["offline", "online"])
+    parser.add_argument("--heuristics", nargs="+", default=sorted(HEURISTICS))
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (0 = in-process)")
+    parser.add_argument("--out", default=str(RESULTS_PREFIX), help="output prefix for .jsonl / .csv")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = expand_matrix(args.mazes, args.algorithms, args.heuristics, args.seeds)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    print(f"=== Experiment matrix: {len(jobs)} run(s), workers={os.cpu_count() if args.workers is None else args.workers} ===")
+    t0 = time.perf_counter()
+    failed = 0
+    with ResultWriter(Path(args.out)) as writer:
+        for done, row in enumerate(run_matrix(jobs, args.workers), start=1):
+            writer.write(row)
+            head = f"[{done}/{len(jobs)}] {row['maze']} | {row['algorithm']} | {row['heuristic']} | seed={row['seed']}"
+            if row["status"] == "ok":
+                print(
+                    f"{head} | exp={row['expansions']} replans={row['replans']} "
+                    f"cost={row['path_cost']:.0f} wall={row['wall_ms']:.1f} ms"
+                )
+            else:
+                failed += 1
+                print(f"{head} | {row['error']}")
+
+    print(f"\nDone in {time.perf_counter() - t0:.2f} s ({failed} failed)")
+    print(f"Results: {writer.jsonl_path}")
+    print(f"         {writer.csv_path}")
+
+
+if __name__ == "__main__":
+    main()
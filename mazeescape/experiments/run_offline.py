@@ -10,15 +10,20 @@ This version:
 """
 from __future__ import annotations
 
+import argparse
 import time
+from functools import partial
 from pathlib import Path
 import os
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from mazeescape.algorithms.grid_astar import grid_astar
+from mazeescape.algorithms.hierarchical_astar import hpa_star
+from mazeescape.algorithms.jump_point_search import jump_point_search
 from mazeescape.algorithms.offline_astar import offline_astar
 from mazeescape.environments.maze_grid_world import MazeWorld
+from mazeescape.heuristics.distance_field import distance_field_search
 from mazeescape.heuristics.heuristics import (
     euclidean_distance,
     manhattan_distance,
@@ -26,7 +31,18 @@ from mazeescape.heuristics.heuristics import (
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 FIG_DIR = BASE_DIR / "figures" / "offline"
-os.makedirs(FIG_DIR, exist_ok=True)
+
+# Offline search engines: generic AIMA stack, integer-state grid engine,
+# Jump Point Search, bidirectional A* on the AIMA stack, hierarchical HPA*,
+# cached goal distance field
+ENGINES = {
+    "aima": offline_astar,
+    "grid": grid_astar,
+    "jps": jump_point_search,
+    "bidirectional": partial(offline_astar, bidirectional=True),
+    "hpa": hpa_star,
+    "field": distance_field_search,
+}
 
 
 # =========================================================
@@ -56,6 +72,10 @@ def print_ascii_final_grid(world: MazeWorld, path) -> None:
 # =========================================================
 
 def visualize_offline_path(world: MazeWorld, path, title: str, filename: str) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     grid = np.zeros((world.height, world.width))
 
     for y in range(world.height):
@@ -73,6 +93,7 @@ def visualize_offline_path(world: MazeWorld, path, title: str, filename: str) ->
     grid[sy, sx] = 0.8                 # start
     grid[gy, gx] = 0.3                 # goal
 
+    os.makedirs(FIG_DIR, exist_ok=True)
     plt.figure(figsize=(5, 5))
     plt.imshow(grid, cmap="gray")
     plt.title(title)
@@ -86,12 +107,14 @@ def visualize_offline_path(world: MazeWorld, path, title: str, filename: str) ->
 # MAIN
 # =========================================================
 
-def main() -> None:
+def main(engine: str = "aima") -> None:
+    search = ENGINES[engine]
     maze_path = BASE_DIR / "mazes" / "maze1.txt"
     world = MazeWorld.from_file(str(maze_path))
 
     print("=== MazeEscape+ Offline A* (Full Knowledge) ===")
     print(f"Maze: {maze_path.name}")
+    print(f"Engine: {engine}")
 
     for name, h in [
         ("Manhattan", manhattan_distance),
@@ -100,7 +123,7 @@ def main() -> None:
         print(f"\n[SEARCH] Offline A* (heuristic = {name})")
 
         t0 = time.perf_counter()
-        path, metrics = offline_astar(world, heuristic=h)
+        path, metrics = search(world, heuristic=h)
         t1 = time.perf_counter()
 
         print(f"Path cost       : {metrics['path_cost']:.0f}")
@@ -123,4 +146,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Offline A* on a maze (full knowledge)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="aima")
+    main(parser.parse_args().engine)
@@ -3,18 +3,22 @@ mazeescape/experiments/run_online.py
 
 Runs Online / Repeated A* experiments.
 - Uses ASCII + academic logs from online_astar
-- Saves step-by-step FIGURES
+- Saves step-by-step FIGURES (rendered in background worker processes,
+  optionally as one animated GIF per heuristic: --gif)
 - Collects metrics for comparison plots
 """
 
 from __future__ import annotations
 
+import argparse
 import shutil
 import time
 from pathlib import Path
 
 from mazeescape.algorithms.online_astar import online_astar
 from mazeescape.environments.maze_grid_world import MazeWorld
+from mazeescape.events.event_sinks import ConsoleSink
+from mazeescape.experiments.frame_renderer import FrameRenderer
 from mazeescape.heuristics.heuristics import (
     manhattan_distance,
     euclidean_distance,
@@ -25,7 +29,7 @@ MAZE_PATH = BASE_DIR / "mazes" / "maze1.txt"
 FIG_DIR = BASE_DIR / "figures" / "online"
 
 
-def main():
+def main(animate: bool = False):
     # temiz başla
     if FIG_DIR.exists():
         shutil.rmtree(FIG_DIR)
@@ -42,35 +46,40 @@ def main():
         print(f"\nRunning: {heuristic_name}")
 
         world = MazeWorld.from_file(str(MAZE_PATH))
-        step_counter = {"i": 0}
 
         # ---- CALLBACKS ----
-        def step_cb(pos):
-            world.visualize_known_map(
-                agent_pos=pos,
-                step_id=step_counter["i"],
-                title_prefix=heuristic_name,
-                save_dir=str(FIG_DIR),
+        # step_cb only captures known_map; frames are rendered off the agent loop
+        # (the with block shuts the render pool down even if the run raises)
+        with FrameRenderer(
+            world,
+            title_prefix=heuristic_name,
+            save_dir=str(FIG_DIR),
+            animation=f"{heuristic_name}.gif" if animate else None,
+        ) as renderer:
+            step_cb = renderer.capture
+
+            def replan_cb(_pos):
+                pass  # log online_astar içinde zaten var
+
+            # ---- RUN ----
+            t0 = time.perf_counter()
+            path, replans, metrics = online_astar(
+                world,
+                heuristic_fn,
+                step_callback=step_cb,
+                replan_callback=replan_cb,
+                events=ConsoleSink(),
             )
-            step_counter["i"] += 1
-
-        def replan_cb(_pos):
-            pass  # log online_astar içinde zaten var
+            t1 = time.perf_counter()
 
-        # ---- RUN ----
-        t0 = time.perf_counter()
-        path, replans, metrics = online_astar(
-            world,
-            heuristic_fn,
-            step_callback=step_cb,
-            replan_callback=replan_cb,
-        )
-        t1 = time.perf_counter()
+            metrics["time_ms"] = (t1 - t0) * 1000
+            results[heuristic_name] = metrics
 
-        metrics["time_ms"] = (t1 - t0) * 1000
-        results[heuristic_name] = metrics
+            print(f"{heuristic_name} finished in {metrics['time_ms']:.2f} ms")
 
-        print(f"{heuristic_name} finished in {metrics['time_ms']:.2f} ms")
+            t2 = time.perf_counter()
+            written = renderer.close()
+            print(f"[FIGURE] {len(written)} file(s) rendered in {(time.perf_counter() - t2) * 1000:.2f} ms")
 
     # ---- FINAL SUMMARY (for plots) ----
     print("\n=== ONLINE A* METRICS SUMMARY ===")
@@ -85,4 +94,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Online / Repeated A* experiments")
+    parser.add_argument("--gif", action="store_true", help="write one animated GIF per heuristic")
+    main(animate=parser.parse_args().gif)
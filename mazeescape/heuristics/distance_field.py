@@ -0,0 +1,332 @@
+"""
+mazeescape/heuristics/distance_field.py
+
+Exact goal-distance fields and a memory-bounded LRU cache of them.
+
+For a fixed maze and goal, one backward breadth-first wavefront from the
+goal gives the true distance of every cell (unit step costs, moves are
+symmetric). A DistanceField then answers, without any search:
+  - distance(cell)   exact cost to the goal (inf if unreachable)
+  - heuristic        a perfect heuristic with the h(a, goal) signature, so
+                     offline_astar(world, field.heuristic) expands only
+                     cells on some optimal path (f = C*); where several
+                     optimal paths tie, the expansions can still fan out
+                     across all of them
+  - path(start)      an optimal path, by stepping to any neighbor one
+                     closer to the goal
+
+The wavefront works on flat indices of the padded passability buffer
+(one wall cell of border). Wide fronts are advanced with numpy (gather the
+4 neighbors, mask, deduplicate); narrow ones -- the long corridors of
+perfect mazes -- in a plain loop, where per-call numpy overhead would
+dominate.
+
+FieldCache keeps fields in an LRU keyed by (maze fingerprint, goal) and
+bounded by the total bytes of the stored arrays; `default_cache()` is the
+process-wide instance the engines share.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mazeescape.algorithms.grid_astar import grid_astar_search
+from mazeescape.environments.maze_grid_world import Coordinate, MazeWorld
+
+UNREACHABLE = -1
+VECTOR_FRONT = 512  # fronts at least this wide are advanced with numpy
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+def maze_fingerprint(world: MazeWorld) -> str:
+    """Content hash of the wall layout (cached on the world; walls are read-only)."""
+    fingerprint = world.__dict__.get("_fingerprint")
+    if fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array([world.width, world.height], dtype=np.int64).tobytes())
+        packed = world.__dict__.get("_packed")
+        if packed is None or "walls" in world.__dict__:
+            packed = np.packbits(world.walls, axis=1, bitorder="little")
+        digest.update(np.ascontiguousarray(packed).tobytes())
+        fingerprint = world._fingerprint = digest.hexdigest()
+    return fingerprint
+
+
+def wavefront(passable: np.ndarray, goal: Coordinate) -> Tuple[np.ndarray, int]:
+    """(distances, cells reached) of a BFS from `goal` over a (height, width) bool array.
+
+    Distances are int32 with UNREACHABLE (-1) for cells the goal cannot be
+    reached from, walls included.
+    """
+    height, width = passable.shape
+    s = width + 2
+    free = np.pad(np.asarray(passable, dtype=bool), 1).ravel()
+    dist = np.full(free.size, UNREACHABLE, dtype=np.int32)
+    gx, gy = goal
+    start = (gy + 1) * s + gx + 1
+    if not free[start]:
+        return dist.reshape(height + 2, s)[1:-1, 1:-1].copy(), 0
+
+    offsets = np.array([-s, s, -1, 1], dtype=np.intp)
+    free_bytes = free.tobytes()
+    dv = memoryview(dist)
+    dist[start] = 0
+    front: List[int] = [start]
+    front_np: Optional[np.ndarray] = None
+    reached, d = 1, 0
+    while front or (front_np is not None and front_np.size):
+        d += 1
+        if front_np is not None:
+            nb = (front_np[:, None] + offsets).ravel()
+            nb = np.unique(nb[free[nb] & (dist[nb] == UNREACHABLE)])
+            dist[nb] = d
+            reached += nb.size
+            if nb.size >= VECTOR_FRONT:
+                front_np = nb
+            else:
+                front_np, front = None, nb.tolist()
+            continue
+        nxt = []
+        for p in front:
+            for q in (p - s, p + s, p - 1, p + 1):
+                if free_bytes[q] and dv[q] == UNREACHABLE:
+                    dv[q] = d
+                    nxt.append(q)
+        reached += len(nxt)
+        if len(nxt) >= VECTOR_FRONT:
+            front, front_np = [], np.array(nxt, dtype=np.intp)
+        else:
+            front = nxt
+
+    return dist.reshape(height + 2, s)[1:-1, 1:-1].copy(), reached
+
+
+@dataclass
+class DistanceField:
+    """Exact distances to `goal` for every cell of one maze."""
+
+    goal: Coordinate
+    dist: np.ndarray      # (height, width) int32, UNREACHABLE where no path exists
+    fingerprint: str = ""
+    reached: int = 0      # cells settled by the wavefront
+
+    @classmethod
+    def compute(cls, world: MazeWorld, goal: Coordinate) -> "DistanceField":
+        dist, reached = wavefront(~world.walls, goal)
+        return cls(goal=goal, dist=dist, fingerprint=maze_fingerprint(world), reached=reached)
+
+    @property
+    def nbytes(self) -> int:
+        return self.dist.nbytes
+
+    def distance(self, cell: Coordinate) -> float:
+        d = int(self.dist[cell[1], cell[0]])
+        return float("inf") if d == UNREACHABLE else float(d)
+
+    @property
+    def heuristic(self) -> Callable[[Coordinate, Coordinate], float]:
+        """Perfect heuristic h(a, goal); only valid for this field's goal."""
+        dist, goal = self.dist, self.goal
+
+        def field_distance(a: Coordinate, b: Coordinate) -> float:
+            if b != goal:
+                raise ValueError(f"distance field is for goal {goal}, not {b}")
+            d = int(dist[a[1], a[0]])
+            return float("inf") if d == UNREACHABLE else float(d)
+
+        return field_distance
+
+    def path(self, start: Coordinate) -> Optional[List[Coordinate]]:
+        """An optimal path from `start` to the goal, or None if there is none."""
+        dist = self.dist
+        height, width = dist.shape
+        x, y = start
+        d = int(dist[y, x])
+        if d == UNREACHABLE:
+            return None
+        path = [start]
+        while d:
+            d -= 1
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= nx < width and 0 <= ny < height and dist[ny, nx] == d:
+                    x, y = nx, ny
+                    break
+            path.append((x, y))
+        return path
+
+
+class FieldCache:
+    """LRU of DistanceFields keyed by (maze fingerprint, goal), bounded in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.fields: "OrderedDict[Tuple[str, Coordinate], DistanceField]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def get(self, world: MazeWorld, goal: Optional[Coordinate] = None) -> DistanceField:
+        """Field for (world, goal or world.goal), computed on a miss."""
+        goal = goal if goal is not None else world.goal
+        if goal is None:
+            raise ValueError("MazeWorld must define a goal (G).")
+        key = (maze_fingerprint(world), tuple(goal))
+        field = self.fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self.fields.move_to_end(key)
+            return field
+
+        self.misses += 1
+        field = DistanceField.compute(world, key[1])
+        if field.nbytes <= self.max_bytes:  # larger fields are returned but not kept
+            self.fields[key] = field
+            self.nbytes += field.nbytes
+            while self.nbytes > self.max_bytes:
+                _, old = self.fields.popitem(last=False)
+                self.nbytes -= old.nbytes
+                self.evictions += 1
+        return field
+
+    def clear(self) -> None:
+        """Drop every field and reset the counters (like HeuristicCache.clear)."""
+        self.fields.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": float(self.hits),
+            "misses": float(self.misses),
+            "evictions": float(self.evictions),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "fields": float(len(self.fields)),
+            "bytes": float(self.nbytes),
+        }
+
+
+_DEFAULT_CACHE: Optional[FieldCache] = None
+
+
+def default_cache() -> FieldCache:
+    """The process-wide FieldCache shared by the engines."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = FieldCache()
+    return _DEFAULT_CACHE
+
+
+def distance_field_search(
+    world: MazeWorld,
+    _heuristic: Optional[Callable[[Coordinate, Coordinate], float]] = None,
+    *,
+    cache: Optional[FieldCache] = None,
+) -> Tuple[List[Coordinate], Dict[str, float]]:
+    """offline_astar's contract answered from a (cached) distance field.
+
+    The second argument only fills the engine signature (world, heuristic):
+    the field is exact, so no heuristic is used.
+    node_expansions is the number of cells the wavefront settled, 0 when
+    the field came from the cache.
+
+    Metrics returned:
+      - node_expansions
+      - path_cost
+      - path_length
+      - cache_hit
+    """
+
+    if world.start is None or world.goal is None:
+        raise ValueError("MazeWorld must define start (S) and goal (G).")
+    cache = cache if cache is not None else default_cache()
+    misses = cache.misses
+    field = cache.get(world)
+    computed = cache.misses != misses
+
+    path = field.path(world.start)
+    if path is None:
+        raise RuntimeError("Distance field: no solution found.")
+    return path, {
+        "node_expansions": float(field.reached if computed else 0),
+        "path_cost": float(len(path) - 1),
+        "path_length": float(len(path)),
+        "cache_hit": float(not computed),
+    }
+
+
+class DistanceFieldPlanner:
+    """Online planner built on the belief map's goal distance field.
+
+    Sensed walls only lengthen distances, so an outdated field is still an
+    admissible (and usually very tight) heuristic:
+      - if its descent path from the current cell avoids every known wall,
+        that path is optimal on the current belief map and is returned as is
+      - otherwise a grid A* on the belief map, guided by the old field,
+        finds the new optimal path
+    The wavefront is rerun once the A* repairs since the last one have
+    expanded as many cells as the grid has, which bounds the repair work to
+    the cost of recomputing the field.
+    """
+
+    label = "Distance field"
+
+    def __init__(
+        self,
+        world,
+        goal: Coordinate,
+        heuristic: Callable[[Coordinate, Coordinate], float],
+    ) -> None:
+        true_world = world.true_world
+        self.passable = np.ones((true_world.height, true_world.width), dtype=bool)
+        for x, y in world.known_walls:
+            self.passable[y, x] = False
+        self.adjacency = world.adjacency or world.compile_adjacency()
+        self.goal = goal
+        self.field: Optional[DistanceField] = None
+        self.repair_expansions = 0
+        self.expansions = 0
+        self.fields_computed = 0
+
+    def _refresh(self) -> None:
+        dist, reached = wavefront(self.passable, self.goal)
+        self.field = DistanceField(goal=self.goal, dist=dist, reached=reached)
+        self.repair_expansions = 0
+        self.expansions += reached
+        self.fields_computed += 1
+
+    def plan(self, current: Coordinate) -> Optional[List[Coordinate]]:
+        if self.field is None or self.repair_expansions >= self.passable.size:
+            self._refresh()
+        path = self.field.path(current)
+        passable = self.passable
+        if path is not None and all(passable[y, x] for x, y in path):
+            return path
+
+        flat = self.field.dist.ravel()
+
+        def h(i: int) -> float:
+            d = flat[i]
+            return float("inf") if d == UNREACHABLE else float(d)
+
+        w = self.adjacency.width
+        search = grid_astar_search(self.adjacency, current[1] * w + current[0], self.goal[1] * w + self.goal[0], h)
+        self.repair_expansions += search.expansions
+        self.expansions += search.expansions
+        return search.path() if search.found else None
+
+    def wall_added(self, cell: Coordinate) -> None:
+        self.passable[cell[1], cell[0]] = False  # the belief world patches the adjacency
+
+    def summary(self) -> Dict[str, float]:
+        """How many wavefronts the run needed."""
+        return {"fields_computed": float(self.fields_computed)}
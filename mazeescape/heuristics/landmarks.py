@@ -0,0 +1,144 @@
+"""
+mazeescape/heuristics/landmarks.py
+
+ALT (landmark) heuristics for MazeWorld.
+
+Manhattan / Euclidean distance ignore walls, so on wall-heavy mazes A*
+expands nearly every cell it can reach. Here k landmark cells are chosen
+and the exact maze distance from each landmark to every cell is stored
+(one distance_field wavefront per landmark, int32, -1 = unreachable).
+Moves are symmetric, so for any landmark L the triangle inequality gives
+
+    d(a, goal) >= |d(L, goal) - d(L, a)|
+
+and the maximum over the landmarks -- and the Manhattan distance, which
+landmarks far from both cells cannot beat -- is an admissible, consistent
+heuristic that follows the corridors. A cell reachable from a landmark
+while the goal is not (or vice versa) lies in another component: the
+bound is inf.
+
+Selection is "farthest" or "avoid", via aima.landmarks.select_landmarks;
+this module only supplies the wavefront distance rows and BFS trees.
+
+The distances describe the true maze, so the heuristic is only admissible
+for searches on it (offline search), not on the online agent's belief map,
+which has fewer walls.
+
+Usage:
+  landmarks = MazeLandmarks(world, k=8)
+  offline_astar(world, landmarks.heuristic)                   # h(a, goal)
+  astar_search(problem, h=landmarks.node_heuristic(goal))     # h(node)
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from aima.landmarks import METHODS, select_landmarks
+from aima.search import Node
+from mazeescape.environments.maze_grid_world import DIRECTIONS4, Coordinate, MazeWorld
+from mazeescape.heuristics.distance_field import UNREACHABLE, wavefront
+
+
+class MazeLandmarks:
+    """k landmark cells of one maze and their exact distance arrays."""
+
+    def __init__(self, world: MazeWorld, k: int = 8, method: str = "farthest", seed: int = 0) -> None:
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}")
+        self.width, self.height = world.width, world.height
+        passable = ~world.walls
+        free = np.flatnonzero(passable.ravel())
+        if free.size == 0:
+            raise ValueError("maze has no free cells")
+        w = self.width
+
+        def distances(i: int) -> np.ndarray:
+            d = wavefront(passable, (i % w, i // w))[0].ravel()
+            return np.where(d == UNREACHABLE, np.inf, d).astype(np.float32)
+
+        chosen, rows = select_landmarks(
+            free,
+            k,
+            distances,
+            method=method,
+            seed=seed,
+            shortest_path_tree=lambda i: self._bfs_tree(passable, i),
+        )
+        self.landmarks = [(i % w, i // w) for i in chosen]
+        # (k, height * width) int32, UNREACHABLE where a cell has no path to the landmark
+        self.dist = np.stack([np.where(np.isinf(row), UNREACHABLE, row).astype(np.int32) for row in rows])
+        self._rows = [memoryview(row) for row in self.dist]
+
+    @staticmethod
+    def _bfs_tree(passable: np.ndarray, root: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(distances, parents) of a BFS tree from flat cell `root`."""
+        h, w = passable.shape
+        d = wavefront(passable, (root % w, root // w))[0]
+        # BFS-tree parent: the first neighbor one step closer to the root
+        padded = np.pad(d, 1, constant_values=UNREACHABLE)
+        index = np.arange(h * w).reshape(h, w)
+        parent = np.full((h, w), -1, dtype=np.int64)
+        for dx, dy in DIRECTIONS4:
+            near = padded[1 + dy:1 + dy + h, 1 + dx:1 + dx + w]
+            take = (parent < 0) & (d > 0) & (near == d - 1)
+            parent[take] = (index + dy * w + dx)[take]
+        flat = d.ravel()
+        return np.where(flat == UNREACHABLE, np.inf, flat).astype(np.float32), parent.ravel()
+
+    @property
+    def nbytes(self) -> int:
+        return self.dist.nbytes
+
+    def index_heuristic(self, goal: Coordinate) -> Callable[[int], float]:
+        """h(i) on flat cell indices (i = y * width + x) towards `goal`."""
+        width = self.width
+        gx, gy = goal
+        g = gy * width + gx
+        terms = [(row, row[g]) for row in self._rows]
+        inf = float("inf")
+
+        def h(i: int) -> float:
+            y, x = divmod(i, width)
+            best = abs(x - gx) + abs(y - gy)  # walls only lengthen paths
+            for row, dg in terms:
+                da = row[i]
+                if da < 0 or dg < 0:
+                    if (da < 0) != (dg < 0):
+                        return inf  # different components
+                    continue
+                diff = da - dg if da > dg else dg - da
+                if diff > best:
+                    best = diff
+            return float(best)
+
+        return h
+
+    def lower_bound(self, a: Coordinate, b: Coordinate) -> float:
+        return self.index_heuristic(b)(a[1] * self.width + a[0])
+
+    @property
+    def heuristic(self) -> Callable[[Coordinate, Coordinate], float]:
+        """h(a, goal) with the signature of heuristics.py (offline_astar, grid_astar...)."""
+        width = self.width
+        cache = {}
+
+        def landmark_distance(a: Coordinate, b: Coordinate) -> float:
+            h = cache.get(b)
+            if h is None:
+                h = cache[b] = self.index_heuristic(b)
+            return h(a[1] * width + a[0])
+
+        return landmark_distance
+
+    def node_heuristic(self, goal: Coordinate) -> Callable[[Node], float]:
+        """h(node) for astar_search(problem, h=...) on a MazeGridProblem."""
+        h, width = self.index_heuristic(goal), self.width
+
+        def node_h(node: Node) -> float:
+            x, y = node.state
+            return h(y * width + x)
+
+        return node_h
@@ -9,7 +9,7 @@ reuse the AIMA-style search implementations (UCS / Greedy / A*).
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Tuple
 
 from aima.search import Problem
 from ..environments.maze_grid_world import Coordinate, MazeWorld
@@ -22,13 +22,25 @@ class MazeGridProblem(Problem):
         super().__init__(initial, goal)
         self.world = world
 
+    def _neighbors(self, state: Coordinate) -> Iterable[Coordinate]:
+        # Read neighbors straight from a compiled CSR adjacency when the world has one.
+        # Looked up per call: the world may compile or replace it after this problem is built.
+        adjacency = getattr(self.world, "adjacency", None)
+        if adjacency is not None:
+            return adjacency.neighbors(state)
+        return self.world.neighbors4(state)
+
     def actions(self, state: Coordinate) -> Iterable[Coordinate]:
         # In this formulation, an "action" is simply choosing a neighbor cell.
-        return self.world.neighbors4(state)
+        return self._neighbors(state)
 
     def result(self, state: Coordinate, action: Coordinate) -> Coordinate:
         return action
 
+    def predecessors(self, state: Coordinate) -> Iterable[Tuple[Coordinate, Coordinate]]:
+        # Moves are symmetric: every free neighbor can step back into `state`.
+        return [(cell, state) for cell in self._neighbors(state)]
+
     def path_cost(
         self,
         c: float,